@@ -0,0 +1,57 @@
+# SPDX-License-Identifier: BSD-3-Clause
+"""Compare the memory used by journals of article and compact_article
+
+Run with:
+
+    python benchmarks/memory.py [number of papers]
+
+No ADS token is needed, the papers are made up locally.
+"""
+
+import sys
+import tracemalloc
+
+import pyastroapi
+
+
+def make_docs(n):
+    for i in range(n):
+        yield {
+            "bibcode": f"{2000 + i % 20}ApJ...{i % 1000:03d}..{i % 997:03d}F",
+            "author": [f"Author {i % 5000}, A.", "Second, B."],
+            "title": [f"Paper number {i}"],
+            "year": str(2000 + i % 20),
+            "pub": "The Astrophysical Journal",
+            "pubdate": f"{2000 + i % 20}-01-00",
+            "citation_count": i % 300,
+        }
+
+
+def measure(n, compact):
+    tracemalloc.start()
+    j = pyastroapi.journal(data=make_docs(n), compact=compact)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del j
+    return current
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    # Fill the shared schema so it isn't counted against the first compact run
+    measure(1, compact=True)
+
+    plain = measure(n, compact=False)
+    compact = measure(n, compact=True)
+
+    print(f"{n} papers")
+    print(f"article:         {plain / 2**20:8.1f} MB ({plain / n:6.0f} bytes/paper)")
+    print(
+        f"compact_article: {compact / 2**20:8.1f} MB ({compact / n:6.0f} bytes/paper)"
+    )
+    print(f"ratio:           {compact / plain:8.2f}")
+
+
+if __name__ == "__main__":
+    main()
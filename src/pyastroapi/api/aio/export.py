@@ -0,0 +1,387 @@
+# SPDX-License-Identifier: BSD-3-Clause
+
+import typing as t
+
+from .. import exceptions as e
+from .. import urls
+from .. import utils
+from . import http
+
+_exportType = t.List[str]
+
+__all__ = [
+    "ads",
+    "bibtexabs",
+    "bibtex",
+    "endnote",
+    "medlars",
+    "procite",
+    "refworks",
+    "ris",
+    "aastex",
+    "icarus",
+    "mnras",
+    "soph",
+    "dcxml",
+    "refxml",
+    "refabsxml",
+    "rss",
+    "votable",
+    "ieee",
+    "csl",
+    "custom",
+]
+
+
+async def _export(token: str, bibcode: t.Union[str, t.List[str]], format: str) -> str:
+    """General method for exporting a reference
+
+    Async version of api.export._export, users should not call this directly.
+
+    Args:
+        token (str): ADSABS token
+        bibcode (t.Union[str, t.List[str]]): Either a single bibcode or a list of bibcodes
+        format (str): Requested export format
+
+    Returns:
+        str: Export data
+    """
+    url = urls.make_url(urls.urls["export"][format])
+    data = {"bibcode": utils.ensure_list(bibcode)}
+    r = await http.post(token, url, data)
+
+    if r.status != 200:
+        raise e.AdsApiError(r.response["error"])
+
+    return r.response["export"]
+
+
+async def ads(token: str, bibcode: t.Union[str, t.List[str]]) -> _exportType:
+    """Get the ADS format
+
+    Args:
+        token (str): ADSABS token
+        bibcode (t.Union[str, t.List[str]]): Either a single bibcode or a list of bibcodes
+
+    Returns:
+        _exportType: Export data
+    """
+    r = (await _export(token, bibcode, "ads")).split("\n\n\n")
+    return [i for i in r if i]
+
+
+async def bibtexabs(token: str, bibcode: t.Union[str, t.List[str]]) -> _exportType:
+    """Get the Bibtex + abstract export
+
+    Args:
+        token (str): ADSABS token
+        bibcode (t.Union[str, t.List[str]]): Either a single bibcode or a list of bibcodes
+
+    Returns:
+        _exportType: Export data
+    """
+    r = (await _export(token, bibcode, "bibtexabs")).split("\n\n")
+    return [i for i in r if i]
+
+
+async def bibtex(token: str, bibcode: t.Union[str, t.List[str]]) -> _exportType:
+    """Get the bibtex
+
+    Args:
+        token (str): ADSABS token
+        bibcode (t.Union[str, t.List[str]]): Either a single bibcode or a list of bibcodes
+
+    Returns:
+        _exportType: Export data
+    """
+    r = (await _export(token, bibcode, "bibtex")).split("\n\n")
+    return [i for i in r if i]
+
+
+async def endnote(token: str, bibcode: t.Union[str, t.List[str]]) -> _exportType:
+    """Get the Endnote format
+
+    Args:
+        token (str): ADSABS token
+        bibcode (t.Union[str, t.List[str]]): Either a single bibcode or a list of bibcodes
+
+    Returns:
+        _exportType: Export data
+    """
+    r = (await _export(token, bibcode, "endnote")).split("\n\n\n")
+    return [i for i in r if i]
+
+
+async def medlars(token: str, bibcode: t.Union[str, t.List[str]]) -> _exportType:
+    """Get the MEDLARS format
+
+    Args:
+        token (str): ADSABS token
+        bibcode (t.Union[str, t.List[str]]): Either a single bibcode or a list of bibcodes
+
+    Returns:
+        _exportType: Export data
+    """
+    r = (await _export(token, bibcode, "medlars")).split("\n\n\n")
+    return [i for i in r if i]
+
+
+async def procite(token: str, bibcode: t.Union[str, t.List[str]]) -> _exportType:
+    """Get the Procite format
+
+    Args:
+        token (str): ADSABS token
+        bibcode (t.Union[str, t.List[str]]): Either a single bibcode or a list of bibcodes
+
+    Returns:
+        _exportType: Export data
+    """
+    r = (await _export(token, bibcode, "procite")).split("\n\n\n")
+    return [i for i in r if i]
+
+
+async def refworks(token: str, bibcode: t.Union[str, t.List[str]]) -> _exportType:
+    """Get the Refworks format
+
+    Args:
+        token (str): ADSABS token
+        bibcode (t.Union[str, t.List[str]]): Either a single bibcode or a list of bibcodes
+
+    Returns:
+        _exportType: Export data
+    """
+    r = (await _export(token, bibcode, "refworks")).split("\n\n\n")
+    return [i for i in r if i]
+
+
+async def ris(token: str, bibcode: t.Union[str, t.List[str]]) -> _exportType:
+    """Get the RIS format
+
+    Args:
+        token (str): ADSABS token
+        bibcode (t.Union[str, t.List[str]]): Either a single bibcode or a list of bibcodes
+
+    Returns:
+        _exportType: Export data
+    """
+    r = (await _export(token, bibcode, "ris")).split("\n\n\n")
+    return [i for i in r if i]
+
+
+async def aastex(token: str, bibcode: t.Union[str, t.List[str]]) -> _exportType:
+    """Get the AASTeX format
+
+    Args:
+        token (str): ADSABS token
+        bibcode (t.Union[str, t.List[str]]): Either a single bibcode or a list of bibcodes
+
+    Returns:
+        _exportType: Export data
+    """
+    r = (await _export(token, bibcode, "aastex")).split("\n")
+    return [i for i in r if i]
+
+
+async def icarus(token: str, bibcode: t.Union[str, t.List[str]]) -> _exportType:
+    """Get the Icarus format
+
+    Args:
+        token (str): ADSABS token
+        bibcode (t.Union[str, t.List[str]]): Either a single bibcode or a list of bibcodes
+
+    Returns:
+        _exportType: Export data
+    """
+    r = (await _export(token, bibcode, "icarus")).split("\n")
+    return [i for i in r if i]
+
+
+async def mnras(token: str, bibcode: t.Union[str, t.List[str]]) -> _exportType:
+    """Get the MNRAS  format
+
+    Args:
+        token (str): ADSABS token
+        bibcode (t.Union[str, t.List[str]]): Either a single bibcode or a list of bibcodes
+
+    Returns:
+        _exportType: Export data
+    """
+    r = (await _export(token, bibcode, "mnras")).split("\n")
+    return [i for i in r if i]
+
+
+async def soph(token: str, bibcode: t.Union[str, t.List[str]]) -> _exportType:
+    """Get the SoPh format
+
+    Args:
+        token (str): ADSABS token
+        bibcode (t.Union[str, t.List[str]]): Either a single bibcode or a list of bibcodes
+
+    Returns:
+        _exportType: Export data
+    """
+    r = (await _export(token, bibcode, "soph")).split("\n")
+    return [i for i in r if i]
+
+
+async def dcxml(token: str, bibcode: t.Union[str, t.List[str]]) -> _exportType:
+    """Get the Dublin Core (DC) XML format
+
+    Args:
+        token (str): ADSABS token
+        bibcode (t.Union[str, t.List[str]]): Either a single bibcode or a list of bibcodes
+
+    Returns:
+        _exportType: Export data
+    """
+    return [await _export(token, bibcode, "dcxml")]  # unsplitable
+
+
+async def refxml(token: str, bibcode: t.Union[str, t.List[str]]) -> _exportType:
+    """Get the REF-XML format
+
+    Args:
+        token (str): ADSABS token
+        bibcode (t.Union[str, t.List[str]]): Either a single bibcode or a list of bibcodes
+
+    Returns:
+        _exportType: Export data
+    """
+    return [await _export(token, bibcode, "refxml")]  # unsplitable
+
+
+async def refabsxml(token: str, bibcode: t.Union[str, t.List[str]]) -> _exportType:
+    """Get the REFABS  XML format
+
+    Args:
+        token (str): ADSABS token
+        bibcode (t.Union[str, t.List[str]]): Either a single bibcode or a list of bibcodes
+
+    Returns:
+        _exportType: Export data
+    """
+    return [await _export(token, bibcode, "refabsxml")]  # unsplitable
+
+
+async def rss(token: str, bibcode: t.Union[str, t.List[str]]) -> _exportType:
+    """Get the RSS format
+
+    Args:
+        token (str): ADSABS token
+        bibcode (t.Union[str, t.List[str]]): Either a single bibcode or a list of bibcodes
+
+    Returns:
+        _exportType: Export data
+    """
+    return [await _export(token, bibcode, "rss")]  # unsplitable
+
+
+async def votable(token: str, bibcode: t.Union[str, t.List[str]]) -> _exportType:
+    """Get the VOTables format
+
+    Args:
+        token (str): ADSABS token
+        bibcode (t.Union[str, t.List[str]]): Either a single bibcode or a list of bibcodes
+
+    Returns:
+        _exportType: Export data
+    """
+    return [await _export(token, bibcode, "votable")]  # unsplitable
+
+
+async def ieee(token: str, bibcode: t.Union[str, t.List[str]]) -> _exportType:
+    """Get the IEEE format
+
+    Args:
+        token (str): ADSABS token
+        bibcode (t.Union[str, t.List[str]]): Either a single bibcode or a list of bibcodes
+
+    Returns:
+        _exportType: Export data
+    """
+    r = (await _export(token, bibcode, "ieee")).split("\n")
+    return [i for i in r if i]
+
+
+async def csl(
+    token: str,
+    bibcodes: t.Union[str, t.List[str]],
+    style: str = "aastex",
+    format: str = "latex",
+    journal: str = "aastex",
+) -> _exportType:
+    """Export in the given style format
+
+    Async version of api.export.csl
+
+    Args:
+        token (str): ADSABS token
+        bibcode (t.Union[str, t.List[str]]): Either a single bibcode or a list of bibcodes
+        style (str): Journal style to use must be one of aastex┃icarus┃mnras┃soph┃aspc┃apsj┃aasj┃ieee
+        format (str): Output format must be one of unicode|html|latex
+        journal (str): Format of journal name  must be one of aastex|abbev|full
+
+    Returns:
+        _exportType: Export data
+    """
+
+    _styles = ["aastex", "icarus", "mnras", "soph", "aspc", "apsj", "aasj", "ieee"]
+    _formats = ["unicode", "html", "latex"]
+    _journal = ["aastex", "abbev", "full"]
+
+    if style not in _styles:
+        raise ValueError(f"Bad style must be one of {_styles}")
+
+    if format not in _formats:
+        raise ValueError(f"Bad format must be one of {_formats}")
+
+    if journal not in _journal:
+        raise ValueError(f"Bad journal format must be one of {_journal}")
+
+    data = {
+        "bibcode": utils.ensure_list(bibcodes),
+        "style": style,
+        "format": _formats.index(format) + 1,
+        "journalformat": _journal.index(journal) + 1,
+        "sort": "first_author desc",
+    }
+
+    return await _post_export(token, "csl", data)
+
+
+async def custom(
+    token: str,
+    bibcodes: t.Union[str, t.List[str]],
+    format: str,
+) -> _exportType:
+    """Export in a custom format
+
+    Async version of api.export.custom
+
+    Args:
+        token (str): ADSABS token
+        bibcode (t.Union[str, t.List[str]]): Either a single bibcode or a list of bibcodes
+        format (str) : Format code to use
+
+    Returns:
+        _exportType: Export data
+    """
+    data = {
+        "bibcode": utils.ensure_list(bibcodes),
+        "format": format,
+    }
+
+    return await _post_export(token, "custom", data)
+
+
+async def _post_export(token: str, format: str, data: t.Dict) -> _exportType:
+    url = urls.make_url(urls.urls["export"][format])
+
+    r = await http.post(token, url, data, json=True)
+
+    if r.status != 200:
+        raise e.AdsApiError(f"Unknown error code {r.status}")
+
+    res = r.response["export"].split("\n")
+
+    return [i for i in res if len(i)]
@@ -0,0 +1,319 @@
+# SPDX-License-Identifier: BSD-3-Clause
+
+import asyncio
+import json as _json
+import typing as t
+
+try:
+    import aiohttp
+except ImportError:
+    raise ImportError(
+        "pyastroapi.api.aio requires aiohttp, install it with: pip install pyastroapi[async]"
+    )
+
+from .. import http as _http
+from .. import urls
+from .. import utils
+
+__all__ = [
+    "AsyncClient",
+    "get_client",
+    "set_client",
+    "get",
+    "post",
+    "put",
+    "delete",
+    "post_bibcodes",
+    "bigquery_bibcodes",
+]
+
+HttpResponse = _http.HttpResponse
+ADSLimits = _http.ADSLimits
+Payload_t = _http.Payload_t
+
+
+class AsyncClient:
+    """Holds an aiohttp session that all async ADS calls are sent through
+
+    All requests run on the one event loop, with at most max_connections in flight at once.
+    By default the rate limit budget is shared with the synchronous client.
+
+    The session and the connection limit belong to the event loop they are used on, if the
+    client is used from a new loop (e.g a second asyncio.run) new ones are made. A session
+    made by the client is closed when its loop shuts down.
+
+    Args:
+        max_connections (int, optional): Maximum number of requests in flight. Defaults to 100.
+        limiter (http.RateLimiter, optional): Scheduler for requests sent to ADS. Defaults to the synchronous client's limiter.
+        session (aiohttp.ClientSession, optional): Use an existing session. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        limiter: t.Optional[_http.RateLimiter] = None,
+        session: t.Optional[aiohttp.ClientSession] = None,
+    ) -> None:
+        self.max_connections = max_connections
+
+        if limiter is None:
+            limiter = _http.get_client().limiter
+        self.limiter = limiter
+
+        self.session = session
+        self._owned = session is None
+        self._loop: t.Optional[asyncio.AbstractEventLoop] = None
+        self._semaphore: t.Optional[asyncio.Semaphore] = None
+        self._closer: t.Optional[t.AsyncGenerator] = None
+
+    async def _session(self) -> aiohttp.ClientSession:
+        # aiohttp sessions and semaphores must be made inside the loop that uses them
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_connections)
+            if self._owned:
+                self.session = None
+
+        if self.session is None:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_connections)
+            )
+            self._owned = True
+            # The loop finalizes unfinished async generators when it shuts down,
+            # which closes the session while the loop can still run it
+            self._closer = _close_on_shutdown(self.session)
+            await self._closer.__anext__()
+
+        return self.session
+
+    async def request(
+        self, method: str, url: str, decode: bool = True, **kwargs
+    ) -> HttpResponse:
+        """Send a request, pacing and retrying it with the limiter
+
+        As with the synchronous client only requests to ADS are scheduled and retried.
+
+        Args:
+            method (str): HTTP method (GET, POST, PUT, DELETE)
+            url (str): URL to send the request to
+            decode (bool, optional): Decode the response as JSON. Defaults to True.
+            **kwargs: Passed on to aiohttp.ClientSession.request
+
+        Returns:
+            HttpResponse:
+        """
+        session = await self._session()
+        loop = asyncio.get_running_loop()
+        limited = url.startswith(urls.base_url)
+
+        attempt = 0
+        while True:
+            async with self._semaphore:  # type:ignore
+                if limited:
+                    # The limiter takes a lock and may wait on the shared state file
+                    wait = await loop.run_in_executor(None, self.limiter.wait_time)
+                    if wait > 0:
+                        await asyncio.sleep(wait)
+
+                async with session.request(method, url, **kwargs) as r:
+                    status = r.status
+                    headers = r.headers
+                    text = await r.text()
+
+            if not limited:
+                break
+
+            await loop.run_in_executor(None, self.limiter.update, headers)
+
+            delay = self.limiter.retry_delay(status, headers, attempt, method)
+            if delay is None:
+                break
+
+            await asyncio.sleep(delay)
+            attempt += 1
+
+        if decode:
+            response = _json.loads(text) if text else {}
+        else:
+            response = text
+
+        return HttpResponse(response, status, ADSLimits(headers))
+
+    async def close(self) -> None:
+        """Close the session"""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+
+async def _close_on_shutdown(session: aiohttp.ClientSession) -> t.AsyncGenerator:
+    try:
+        yield
+    finally:
+        await session.close()
+
+
+_client: t.Optional[AsyncClient] = None
+
+
+def get_client() -> AsyncClient:
+    """Get the client used for all async ADS calls, creating a default one if needed
+
+    Returns:
+        AsyncClient:
+    """
+    global _client
+    if _client is None:
+        _client = AsyncClient()
+    return _client
+
+
+def set_client(client: t.Optional[AsyncClient]) -> None:
+    """Set the client used for all async ADS calls
+
+    Args:
+        client (AsyncClient): The client to use. Passing None resets to a default client on the next call.
+    """
+    global _client
+    _client = client
+
+
+def _auth(token: str) -> t.Dict[str, str]:
+    return {"authorization": "Bearer " + str(token)}
+
+
+async def get(
+    token: str, url: str, data: Payload_t = None, json: bool = True
+) -> HttpResponse:
+    """Perform a HTTP Get request
+
+    Args:
+        token (str): ADS Token
+        url (str): URL to get. This should usually include some sort of extra identifier
+        data (Payload_t, optional): Any additional data being passed, thats not in the URL. Defaults to None.
+        json (bool, optional): Whether to return the data in a JSON compatible format. Defaults to True.
+
+    Returns:
+        HttpResponse:
+    """
+    if data is None:
+        data = {}  # type:ignore
+
+    return await get_client().request(
+        "GET", url, decode=json, headers=_auth(token), params=data
+    )
+
+
+async def post(
+    token: str,
+    url: str,
+    data: Payload_t = None,
+    params: t.Any = None,
+    json: bool = True,
+) -> HttpResponse:
+    """Perform a HTTP Post request
+
+    Args:
+        token (str): ADS Token
+        url (str): URL to post to
+        data (Payload_t, optional): Data being sent. Defaults to None.
+        params (Payload_t, optional): Data being sent via the url and not the post dict. Defaults to None.
+        json (bool, optional): Whether to return the data in a JSON compatible format. Defaults to True.
+
+    Returns:
+        HttpResponse:
+    """
+    args: t.Dict[str, t.Any] = {"headers": _auth(token)}
+
+    if data is not None:
+        args["json"] = data
+        args["headers"]["Accept"] = "application/json"
+
+    if params is not None:
+        args["params"] = params
+
+    return await get_client().request("POST", url, decode=json, **args)
+
+
+async def put(token: str, url: str, data: Payload_t) -> HttpResponse:
+    """Perform a HTTP Put request
+
+    Args:
+        token (str): ADS Token
+        url (str): URL to post to
+        data (Payload_t, optional): Data being sent. Defaults to None.
+
+    Returns:
+        HttpResponse:
+    """
+    return await get_client().request("PUT", url, headers=_auth(token), json=data)
+
+
+async def delete(token: str, url: str) -> HttpResponse:
+    """Perform a HTTP Delete request
+
+    Args:
+        token (str): ADS Token
+        url (str): URL to post to
+
+    Returns:
+        HttpResponse:
+    """
+    r = await get_client().request("DELETE", url, decode=False, headers=_auth(token))
+    return HttpResponse("", r.status, r.limits)
+
+
+async def post_bibcodes(
+    token: str, url: str, bibcodes: t.Union[str, t.List[str]], multi_bibs: bool = True
+) -> HttpResponse:
+    """Perform a HTTP Post request with a list of bibcodes
+
+    Args:
+        token (str): ADS Token
+        url (str): URL to post to
+        bibcodes (t.Union[str, t.List[str]]): Either a single bibcode or a list of bibcodes
+        multi_bibs (bool): Some end points care whether you use bibcode or bibcodes and thats not consistent with the actual number of bibcodes used
+    Returns:
+        HttpResponse:
+    """
+    if isinstance(bibcodes, list):
+        if multi_bibs:
+            data = {"bibcodes": bibcodes}
+        else:
+            data = {"bibcode": bibcodes}
+    else:
+        data = {"bibcode": utils.ensure_list(bibcodes)}
+
+    return await post(token, url, data)
+
+
+async def bigquery_bibcodes(
+    token: str,
+    url: str,
+    bibcodes: t.Union[str, t.List[str]],
+    params: t.Any,
+) -> HttpResponse:
+    """Perform a ADS Big query with a list of bibcodes
+
+    Args:
+        token (str): ADS Token
+        url (str): URL to post to
+        bibcodes (t.Union[str, t.List[str]]): Either a single bibcode or a list of bibcodes
+        params (dict) : Extra params sent
+    Returns:
+        HttpResponse:
+    """
+    data = "bibcode\n" + "\n".join(utils.ensure_list(bibcodes))
+
+    params = {k: str(v) for k, v in params.items()}
+
+    return await get_client().request(
+        "POST", url, headers=_auth(token), params=params, data=data
+    )
@@ -0,0 +1,293 @@
+# SPDX-License-Identifier: BSD-3-Clause
+
+import asyncio
+import typing as t
+
+from .. import exceptions as e
+from .. import urls
+from .. import utils
+from .. import libraries as _libraries_sync
+from . import http
+
+__all__ = [
+    "list_all",
+    "get_permissions",
+    "get",
+    "update_metadata",
+    "transfer",
+    "new",
+    "delete",
+    "add",
+    "remove",
+    "bulk",
+    "edit",
+]
+
+
+async def list_all(token: str):
+    """List all libraries the user has
+
+    Args:
+        token (str): ADSABS token
+
+    Returns:
+        dict: Library metadata
+    """
+    url = urls.make_url(urls.urls["libraries"]["view"])
+
+    r = await http.get(token, url)
+
+    if r.status != 200:
+        raise e.AdsApiError(r.response["error"])
+
+    return r.response
+
+
+async def get_permissions(token: str, lib: str):
+    url = urls.make_url(urls.urls["libraries"]["permission"], lib)
+
+    r = await http.get(token, url)
+
+    if r.status != 200:
+        raise e.AdsApiError(r.response["error"])
+
+    return r.response
+
+
+async def get(
+    token: str, lib: str, rows: t.Optional[int] = None
+) -> t.AsyncGenerator[str, None]:
+    """Iterate over the bibcodes in a library
+
+    Args:
+        token (str): ADSABS token
+        lib (str): Library id
+        rows (int, optional): Documents per page, up to 2000. Defaults to the server's default.
+
+    Raises:
+        ValueError: If rows is out of range
+
+    Yields:
+        str: Bibcode
+    """
+    if rows is not None and not 0 < rows <= _libraries_sync._max_rows:
+        raise ValueError(f"rows must be between 1 and {_libraries_sync._max_rows}")
+
+    data = {}
+    if rows is not None:
+        data["rows"] = f"{rows}"
+
+    start = 0
+    while True:
+        url = urls.make_url(urls.urls["libraries"]["view"], lib)
+
+        data["start"] = f"{start}"
+        r = await http.get(token, url, data=dict(data))
+
+        if r.status != 200:
+            raise e.AdsApiError(r.response["error"])
+
+        total_num = int(r.response["metadata"]["num_documents"])
+
+        if len(r.response["documents"]) == 0:
+            # Total_num lies sometimes so track when we stop getting new papers
+            break
+
+        for bibcode in r.response["documents"]:
+            yield bibcode
+
+        start += len(r.response["documents"])
+
+        if start >= total_num:
+            break
+
+
+async def update_metadata(
+    token: str,
+    lib: str,
+    name: t.Optional[str] = None,
+    description: t.Optional[str] = None,
+    public: t.Optional[bool] = False,
+):
+    params: t.Dict[str, t.Any] = {}
+    if name is not None:
+        params["name"] = name
+    if description is not None:
+        params["description"] = description
+    if public is not None:
+        params["public"] = bool(public)
+
+    url = urls.make_url(urls.urls["libraries"]["change"], lib)
+
+    r = await http.put(token, url, params)
+
+    if r.status != 200:
+        raise e.AdsApiError(r.response["error"])
+
+
+async def transfer(token: str, lib: str, email: str):
+    url = urls.make_url(urls.urls["libraries"]["transfer"], lib)
+
+    r = await http.post(token, url, {"email": email})
+
+    if r.status != 200:
+        raise e.AdsApiError(r.response["error"])
+
+
+async def new(
+    token: str,
+    name: t.Optional[str] = None,
+    description: t.Optional[str] = None,
+    public: t.Optional[bool] = None,
+    bibcode: t.Optional[t.Union[str, t.List[str]]] = None,
+):
+    params: t.Dict[t.Any, t.Any] = {}
+    if name is not None:
+        params["name"] = name
+    if description is not None:
+        params["description"] = description
+    if public is not None:
+        params["public"] = bool(public)
+    if bibcode is not None:
+        params["bibcode"] = utils.ensure_list(bibcode)
+
+    url = urls.make_url(urls.urls["libraries"]["view"])
+
+    r = await http.post(token, url, data=params, json=True)
+
+    if r.status != 200:
+        raise e.AdsApiError(r.response["error"])
+
+    return r.response
+
+
+async def delete(token: str, lib: str):
+    url = urls.make_url(urls.urls["libraries"]["change"], lib)
+
+    r = await http.delete(token, url)
+
+    if r.status != 200:
+        raise e.AdsApiError(r.response["error"])
+
+
+async def add(token: str, lib: str, bibcode: str):
+    url = urls.make_url(urls.urls["libraries"]["change"], lib)
+
+    bibs = utils.ensure_list(bibcode)
+
+    r = await http.post(token, url, {"action": "add", "bibcode": bibs})
+
+    if r.status != 200:
+        raise e.AdsApiError(r.response["error"])
+
+    if len(bibs) != r.response["number_added"]:
+        raise e.AdsApiError(
+            f"Bad number of bibcodes added tried {len(bibs)} got {r.response['number_added']}"
+        )
+
+
+async def remove(token: str, lib: str, bibcode: str):
+    url = urls.make_url(urls.urls["libraries"]["change"], lib)
+
+    bibs = utils.ensure_list(bibcode)
+    r = await http.post(token, url, {"action": "remove", "bibcode": bibs})
+
+    if r.status != 200:
+        raise e.AdsApiError(r.response["error"])
+
+    if len(bibs) != r.response["number_removed"]:
+        raise e.AdsApiError(
+            f"Bad number of bibcodes removed tried {len(bibs)} got {r.response['number_removed']}"
+        )
+
+
+async def bulk(
+    token: str,
+    lib: str,
+    bibcodes: t.List[str],
+    action: str = "add",
+    chunk_size: int = _libraries_sync._max_bibcodes,
+    retries: int = 0,
+) -> t.Dict[str, str]:
+    """Add or remove many bibcodes, reporting the outcome for each one
+
+    See pyastroapi.api.libraries.bulk, the chunks are sent concurrently on the event loop.
+
+    Args:
+        token (str): ADSABS token
+        lib (str): Library id
+        bibcodes (t.List[str]): Bibcodes to add or remove
+        action (str, optional): Either "add" or "remove". Defaults to "add".
+        chunk_size (int, optional): Bibcodes per request. Defaults to 1000.
+        retries (int, optional): Number of times to resend bibcodes that were not "ok". Defaults to 0.
+
+    Raises:
+        ValueError: If action is not valid
+
+    Returns:
+        t.Dict[str, str]: Map of bibcode to status
+    """
+    if action not in ["add", "remove"]:
+        raise ValueError(f"action must be add or remove not {action}")
+
+    url = urls.make_url(urls.urls["libraries"]["change"], lib)
+    key = "number_added" if action == "add" else "number_removed"
+
+    async def send(bibs):
+        r = await http.post(token, url, {"action": action, "bibcode": bibs})
+
+        if r.status != 200:
+            error = r.response.get("error", f"Status {r.status}")
+            return {b: str(error) for b in bibs}
+
+        if r.response[key] == len(bibs):
+            return {b: "ok" for b in bibs}
+
+        # Don't know which ones were applied yet
+        return {b: None for b in bibs}
+
+    report: t.Dict[str, t.Any] = {}
+    pending = list(dict.fromkeys(utils.ensure_list(bibcodes)))
+
+    for _ in range(retries + 1):
+        for res in await asyncio.gather(
+            *(send(c) for c in utils.chunks(pending, chunk_size))
+        ):
+            report.update(res)
+
+        unknown = [b for b in pending if report[b] is None]
+        if len(unknown):
+            members = {b async for b in get(token, lib, rows=_libraries_sync._max_rows)}
+            for b in unknown:
+                report[b] = "ok" if (b in members) == (action == "add") else "failed"
+
+        pending = [b for b in pending if report[b] != "ok"]
+        if not len(pending):
+            break
+
+    return report
+
+
+async def edit(
+    token: str,
+    lib: str,
+    email: str,
+    read: bool = False,
+    write: bool = False,
+    admin: bool = False,
+):
+    url = urls.make_url(urls.urls["libraries"]["permission"], lib)
+
+    data = {
+        "email": email,
+        "permission": {
+            "read": read,
+            "write": write,
+            "admin": admin,
+        },
+    }
+
+    r = await http.post(token, url, data)
+
+    if r.status != 200:
+        raise e.AdsApiError(r.response["error"])
@@ -0,0 +1,93 @@
+# SPDX-License-Identifier: BSD-3-Clause
+
+import typing as t
+
+from .. import exceptions as e
+from .. import urls
+from .. import utils
+from . import http
+
+__all__ = [
+    "detail",
+    "metrics",
+    "basic",
+    "citations",
+    "indicators",
+    "histograms",
+    "timeseries",
+]
+
+
+async def detail(token: str, bibcode: t.List[str]) -> t.Dict:
+    """Provides basic, year-by-year metrics on a per-bibcode basis.
+
+    Args:
+        token (str): ADSABS token
+        bibcode (t.List[str]): List of bibcodes
+
+    Returns:
+        dict: Metric data
+    """
+    url = urls.make_url(urls.urls["metrics"]["detail"])
+    r = await http.post_bibcodes(token, url, bibcode)
+
+    if r.status != 200:
+        raise e.AdsApiError(r.response["error"])
+
+    return r.response
+
+
+async def metrics(token: str, bibcode: str) -> t.Dict:
+    """Provides basic, year-by-year metrics on for a single bibcode
+
+    Args:
+        token (str): ADSABS token
+        bibcode (str): Single bibcode
+
+    Returns:
+        dict: Metric data
+    """
+    url = urls.make_url(urls.urls["metrics"]["metrics"], bibcode)
+
+    r = await http.get(token, url)
+
+    if r.status != 200:
+        raise e.AdsApiError(r.response["error"])
+
+    return r.response
+
+
+async def _metric(token: str, bibcode: t.List[str], format: str) -> t.Dict:
+    url = urls.make_url(urls.urls["metrics"]["metrics"])
+    payload = {"bibcodes": utils.ensure_list(bibcode), "types": [format]}
+    r = await http.post(token, url, payload)
+
+    if r.status != 200:
+        raise e.AdsApiError(r.response["error"])
+
+    return r.response
+
+
+async def basic(token: str, bibcode: t.List[str]) -> t.Dict:
+    """Publication and usage stats (all papers, and just refereed papers)"""
+    return await _metric(token, bibcode, "basic")
+
+
+async def citations(token: str, bibcode: t.List[str]) -> t.Dict:
+    """citation stats"""
+    return await _metric(token, bibcode, "citations")
+
+
+async def indicators(token: str, bibcode: t.List[str]) -> t.Dict:
+    """indicators, like the h-index, g-index, m-index, etc"""
+    return await _metric(token, bibcode, "indicators")
+
+
+async def histograms(token: str, bibcode: t.List[str]) -> t.Dict:
+    """Publication, citation, reads and downloads histograms"""
+    return await _metric(token, bibcode, "histograms")
+
+
+async def timeseries(token: str, bibcode: t.List[str]) -> t.Dict:
+    """time series for a set of indicators"""
+    return await _metric(token, bibcode, "timeseries")
@@ -0,0 +1,108 @@
+# SPDX-License-Identifier: BSD-3-Clause
+
+from .. import exceptions as e
+from .. import urls
+from . import http
+
+__all__ = [
+    "resolve",
+    "abstract",
+    "citations",
+    "references",
+    "coreads",
+    "toc",
+    "openurl",
+    "metrics",
+    "graphics",
+    "data",
+    "inspire",
+    "esource",
+    "librarycatalog",
+    "presentation",
+    "associated",
+]
+
+
+async def resolve(token: str, bibcode: str):
+    """Get all the links available for a bibcode
+
+    Async version of api.resolver.resolve
+    """
+    if isinstance(bibcode, list):
+        raise TypeError("One bibcode at a time")
+
+    url = urls.make_url(urls.urls["resolve"]["search"], bibcode)
+
+    r = await http.get(token, url)
+
+    if r.status != 200:
+        raise e.AdsApiError(r.response["error"])
+
+    return r.response
+
+
+async def _get(token: str, bibcode: str, format: str) -> str:
+    url = urls.make_url(urls.urls["resolve"]["search"], bibcode, format)
+
+    r = await http.get(token, url)
+
+    if r.status != 200:
+        raise e.AdsApiError(r.response["error"])
+
+    return r.response
+
+
+async def abstract(token: str, bibcode: str) -> str:
+    return await _get(token, bibcode, "abstract")
+
+
+async def citations(token: str, bibcode: str) -> str:
+    return await _get(token, bibcode, "citations")
+
+
+async def references(token: str, bibcode: str) -> str:
+    return await _get(token, bibcode, "references")
+
+
+async def coreads(token: str, bibcode: str) -> str:
+    return await _get(token, bibcode, "coreads")
+
+
+async def toc(token: str, bibcode: str) -> str:
+    return await _get(token, bibcode, "toc")
+
+
+async def openurl(token: str, bibcode: str) -> str:
+    return await _get(token, bibcode, "openurl")
+
+
+async def metrics(token: str, bibcode: str) -> str:
+    return await _get(token, bibcode, "metrics")
+
+
+async def graphics(token: str, bibcode: str) -> str:
+    return await _get(token, bibcode, "graphics")
+
+
+async def data(token: str, bibcode: str) -> str:
+    return await _get(token, bibcode, "data")
+
+
+async def inspire(token: str, bibcode: str) -> str:
+    return await _get(token, bibcode, "inspire")
+
+
+async def esource(token: str, bibcode: str) -> str:
+    return await _get(token, bibcode, "esource")
+
+
+async def librarycatalog(token: str, bibcode: str) -> str:
+    return await _get(token, bibcode, "librarycatalog")
+
+
+async def presentation(token: str, bibcode: str) -> str:
+    return await _get(token, bibcode, "presentation")
+
+
+async def associated(token: str, bibcode: str) -> str:
+    return await _get(token, bibcode, "associated")
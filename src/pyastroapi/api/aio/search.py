@@ -0,0 +1,135 @@
+# SPDX-License-Identifier: BSD-3-Clause
+
+import typing as t
+
+from .. import exceptions as e
+from .. import urls
+from .. import search as _search
+from . import http
+
+__all__ = ["search", "bigquery"]
+
+
+async def search(
+    token: str,
+    query: str = "*:*",
+    fields: str = None,
+    fq: str = "",
+    limit: int = -1,
+    dbg: bool = False,
+    rows: int = None,
+    cursor: bool = False,
+) -> t.AsyncGenerator[t.Dict[t.Any, t.Any], None]:
+    """Search ADS
+
+    Async version of api.search.search
+
+    Args:
+        token (str): ADSABS token
+        query (str, optional): ADS query string. Defaults to "*:*".
+        fields (str, optional): Comma separated list of fields to return. Defaults to a short set of fields.
+        fq (str, optional): Filter query. Defaults to "".
+        limit (int, optional): Maximum number of records to return (-1 is no limit). Defaults to -1.
+        dbg (bool, optional): Print each request. Defaults to False.
+        rows (int, optional): Number of records per request, up to 2000. Defaults to limit if set, otherwise 50.
+        cursor (bool, optional): Page with a cursorMark (sorted on id) instead of start offsets. Defaults to False.
+
+    Raises:
+        ValueError: If a field or the number of rows is not valid
+        e.AdsApiError: If the request fails
+
+    Yields:
+        dict: One dict per record, with keys given by fields
+    """
+    if fields is not None:
+        for f in fields.split(","):
+            if f and f not in _search._fields:
+                raise ValueError(f"Field {f} not valid in search")
+    else:
+        fields = _search._short_fl
+
+    if rows is None:
+        if limit > 0:
+            rows = min(limit, _search._max_rows)
+        else:
+            rows = 50
+    elif rows < 1 or rows > _search._max_rows:
+        raise ValueError(f"rows must be between 1 and {_search._max_rows}")
+
+    split_f = fields.split(",")
+
+    start = 0
+    count = 0
+    cursor_mark = "*"
+    while True:
+        data = {
+            "q": f"{query}",
+            "fl": f"{fields}",
+            "fq": f"{fq}",
+            "rows": f"{rows if limit <= 0 else min(rows, limit - count)}",
+        }
+        if cursor:
+            data["sort"] = "id asc"
+            data["cursorMark"] = cursor_mark
+        else:
+            data["start"] = f"{start}"
+
+        r = await _query(token, data, dbg)
+
+        total_num = int(r["response"]["numFound"])
+        docs = r["response"]["docs"]
+
+        if not len(docs):
+            break
+
+        count += len(docs)
+
+        for doc in _search._fill(docs, split_f):
+            yield doc
+
+        if count >= total_num or (count >= limit and limit > 0):
+            break
+
+        if cursor:
+            if r["nextCursorMark"] == cursor_mark:
+                break
+            cursor_mark = r["nextCursorMark"]
+        else:
+            start = count
+
+
+async def _query(token: str, data: t.Dict[str, str], dbg: bool = False) -> t.Dict:
+    url = urls.make_url(urls.urls["search"]["search"])
+
+    if dbg:
+        print(url)
+        print(data)
+
+    r = await http.get(token, url, data=data)
+
+    if r.status != 200:
+        raise e.AdsApiError(r.response["error"])
+
+    return r.response
+
+
+async def bigquery(
+    token: str, bibcodes: t.List[str], limit: int = 10, q="*:*", fields=None
+):
+    """Search within a list of bibcodes
+
+    Async version of api.search.bigquery
+    """
+    if fields is None:
+        fields = "id,bibcode,title"
+
+    terms = {"q": q, "fl": fields, "rows": limit}
+
+    url = urls.make_url(urls.urls["search"]["bigquery"])
+
+    r = await http.bigquery_bibcodes(token, url, bibcodes=bibcodes, params=terms)
+
+    if r.status != 200:
+        raise e.AdsApiError(r.response["error"])
+
+    return r.response["response"]
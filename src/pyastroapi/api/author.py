@@ -3,10 +3,14 @@
 from . import exceptions as e
 from . import urls
 from . import http
+from . import utils
 import typing as t
 
 __all__ = ["search"]
 
+# Largest number of bibcodes we send to the author-affiliation service in one request
+_max_bibcodes = 1000
+
 
 def search(token: str, bibcode: t.Union[str, t.List[str]]):
     """Create an author-affiliations report.
@@ -23,9 +27,16 @@ def search(token: str, bibcode: t.Union[str, t.List[str]]):
 
     url = urls.make_url(urls.urls["authors"]["search"])
 
-    r = http.post_bibcodes(token, url, bibcode, False)
+    def send(bibs):
+        r = http.post_bibcodes(token, url, bibs, False)
+
+        if r.status != 200:
+            raise e.AdsApiError(r.response["error"])
+
+        return r.response["data"]
 
-    if r.status != 200:
-        raise e.AdsApiError(r.response["error"])
+    if not isinstance(bibcode, list) or len(bibcode) <= _max_bibcodes:
+        return send(bibcode)
 
-    return r.response["data"]
+    res = utils.concurrent_map(send, utils.chunks(bibcode, _max_bibcodes))
+    return sum(res, [])
@@ -0,0 +1,320 @@
+# SPDX-License-Identifier: BSD-3-Clause
+
+import contextlib
+import hashlib
+import json
+import os
+import sqlite3
+import time
+import typing as t
+
+from . import urls
+
+__all__ = ["Cache"]
+
+_day = 24 * 60 * 60
+
+# How long (in seconds) responses from each endpoint are kept.
+# Anything not listed here is never cached
+_default_ttl = {
+    urls.urls["search"]["search"]: _day,
+    urls.urls["search"]["bigquery"]: _day,
+    urls.urls["metrics"]["metrics"]: _day,
+    urls.urls["metrics"]["detail"]: _day,
+    urls.urls["authors"]["search"]: 7 * _day,
+    urls.urls["resolve"]["search"]: 7 * _day,
+    urls.urls["ref"]["text"]: 30 * _day,
+}
+for _endpoint in urls.urls["export"].values():
+    _default_ttl[_endpoint] = 30 * _day
+
+
+def _normalize(payload: t.Any) -> t.Any:
+    if isinstance(payload, (list, tuple)):
+        return [_normalize(i) for i in payload]
+
+    if isinstance(payload, dict):
+        payload = dict(payload)
+        if isinstance(payload.get("fl"), str):
+            payload["fl"] = ",".join(sorted(set(payload["fl"].split(","))))
+
+    return payload
+
+
+class Cache:
+    """On-disk cache of ADS responses
+
+    Entries are keyed on the endpoint, a normalized copy of the payload and the token, expire after
+    a per-endpoint time to live, and the least recently used entries are evicted once the
+    cache grows past max_size. The cache is a sqlite database so it can be shared between
+    processes.
+
+    Enable it with:
+
+        http.get_client().cache = cache.Cache()
+
+    Args:
+        filename (str, optional): Database file. Defaults to "~/.ads/cache.sqlite".
+        max_size (int, optional): Maximum total size of the cached responses in bytes. Defaults to 256MB.
+        ttl (dict, optional): Map of endpoint (e.g "/export/bibtex") to time to live in seconds,
+                              these override the defaults. A ttl of 0 disables caching. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        filename: str = "~/.ads/cache.sqlite",
+        max_size: int = 256 * 1024 * 1024,
+        ttl: t.Optional[t.Dict[str, float]] = None,
+    ) -> None:
+        self.filename = os.path.expanduser(filename)
+        self.max_size = max_size
+        self.ttl = dict(_default_ttl)
+        if ttl is not None:
+            self.ttl.update(ttl)
+
+        folder = os.path.dirname(self.filename)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+
+        with self._connect() as db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, value TEXT, size INTEGER, "
+                "expires REAL, accessed REAL)"
+            )
+            db.execute(
+                "CREATE INDEX IF NOT EXISTS accessed_idx ON responses (accessed)"
+            )
+            db.execute("CREATE INDEX IF NOT EXISTS expires_idx ON responses (expires)")
+            # Running total of the size of all responses, so writes don't have to add it up
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER)"
+            )
+            # Caches made before the total was kept
+            db.execute(
+                "INSERT OR IGNORE INTO meta "
+                "SELECT 'size', CAST(TOTAL(size) AS INTEGER) FROM responses"
+            )
+
+    @contextlib.contextmanager
+    def _connect(self) -> t.Iterator[sqlite3.Connection]:
+        # A connection per operation keeps this safe to use from many threads
+        db = sqlite3.connect(self.filename, timeout=30, isolation_level=None)
+        try:
+            db.execute("PRAGMA journal_mode=WAL")
+            yield db
+        finally:
+            if db.in_transaction:
+                db.rollback()
+            db.close()
+
+    def ttl_for(self, url: str) -> float:
+        """Time to live for a url
+
+        Args:
+            url (str): Full ADS URL
+
+        Returns:
+            float: Time to live in seconds, 0 if the url should not be cached
+        """
+        if not url.startswith(urls.base_url):
+            return 0
+
+        # make_url joins with "/" so there may be repeated slashes
+        path = "/" + url[len(urls.base_url) :].split("?")[0].lstrip("/")
+
+        # Longest endpoint first so /metrics/detail is matched before /metrics
+        for endpoint in sorted(self.ttl, key=len, reverse=True):
+            if path == endpoint or path.startswith(endpoint + "/"):
+                return self.ttl[endpoint]
+        return 0
+
+    def key(
+        self,
+        method: str,
+        url: str,
+        payload: t.Any = None,
+        token: t.Optional[str] = None,
+    ) -> str:
+        """Make a cache key from a request
+
+        The field list is sorted so requests for the same set of fields in a
+        different order share an entry. A hash of the token is included so one
+        user's responses (e.g private libraries) are never given to another.
+
+        Args:
+            method (str): HTTP method
+            url (str): URL
+            payload (t.Any, optional): Data or params sent with the request. Defaults to None.
+            token (str, optional): ADS token the request is sent with. Defaults to None.
+
+        Returns:
+            str: Cache key
+        """
+        user = None
+        if token is not None:
+            user = hashlib.sha256(str(token).encode()).hexdigest()
+
+        blob = json.dumps(
+            [method.upper(), url, _normalize(payload), user],
+            sort_keys=True,
+            default=str,
+        )
+
+        return hashlib.sha256(blob.encode()).hexdigest()
+
+    def get(self, key: str) -> t.Any:
+        """Get a cached value
+
+        Args:
+            key (str): Cache key
+
+        Returns:
+            t.Any: The value or None if its missing or expired
+        """
+        now = time.time()
+        with self._connect() as db:
+            row = db.execute(
+                "SELECT value, expires FROM responses WHERE key=?", (key,)
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            if row[1] < now:
+                db.execute("BEGIN IMMEDIATE")
+                self._remove(db, "key=?", (key,))
+                db.execute("COMMIT")
+                return None
+
+            db.execute("UPDATE responses SET accessed=? WHERE key=?", (now, key))
+
+        return json.loads(row[0])
+
+    def set(self, key: str, value: t.Any, ttl: float) -> None:
+        """Store a value
+
+        Args:
+            key (str): Cache key
+            value (t.Any): JSON serializable value
+            ttl (float): Time to live in seconds
+        """
+        now = time.time()
+        blob = json.dumps(value)
+        with self._connect() as db:
+            db.execute("BEGIN IMMEDIATE")
+            self._insert(db, [(key, blob, len(blob), now + ttl, now)])
+            db.execute("COMMIT")
+        self.evict()
+
+    def get_many(self, keys: t.Iterable[str]) -> t.Dict[str, t.Any]:
+        """Get many cached values in one go
+
+        Args:
+            keys (iterable[str]): Cache keys
+
+        Returns:
+            t.Dict[str, t.Any]: Map of key to value, for the keys that are present and not expired
+        """
+        now = time.time()
+        result = {}
+        with self._connect() as db:
+            db.execute("BEGIN")
+            for key in keys:
+                row = db.execute(
+                    "SELECT value, expires FROM responses WHERE key=?", (key,)
+                ).fetchone()
+                if row is not None and row[1] >= now:
+                    result[key] = json.loads(row[0])
+            db.executemany(
+                "UPDATE responses SET accessed=? WHERE key=?",
+                [(now, key) for key in result],
+            )
+            db.execute("COMMIT")
+
+        return result
+
+    def set_many(self, items: t.Dict[str, t.Any], ttl: float) -> None:
+        """Store many values in one go
+
+        Args:
+            items (dict): Map of key to JSON serializable value
+            ttl (float): Time to live in seconds
+        """
+        now = time.time()
+        rows = []
+        for key, value in items.items():
+            blob = json.dumps(value)
+            rows.append((key, blob, len(blob), now + ttl, now))
+
+        with self._connect() as db:
+            db.execute("BEGIN IMMEDIATE")
+            self._insert(db, rows)
+            db.execute("COMMIT")
+        self.evict()
+
+    def _insert(self, db: sqlite3.Connection, rows: t.List[t.Tuple]) -> None:
+        # Must be called inside a transaction so the total stays in step
+        delta = 0
+        for row in rows:
+            old = db.execute(
+                "SELECT size FROM responses WHERE key=?", (row[0],)
+            ).fetchone()
+            delta += row[2] - (old[0] if old is not None else 0)
+
+        db.executemany("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)", rows)
+        db.execute("UPDATE meta SET value = value + ? WHERE key='size'", (delta,))
+
+    def _remove(self, db: sqlite3.Connection, where: str, params: t.Tuple) -> None:
+        # Must be called inside a transaction so the total stays in step
+        size = db.execute(
+            f"SELECT TOTAL(size) FROM responses WHERE {where}", params
+        ).fetchone()[0]
+        db.execute(f"DELETE FROM responses WHERE {where}", params)
+        db.execute("UPDATE meta SET value = value - ? WHERE key='size'", (int(size),))
+
+    def _total(self, db: sqlite3.Connection) -> int:
+        return int(db.execute("SELECT value FROM meta WHERE key='size'").fetchone()[0])
+
+    def evict(self) -> None:
+        """Remove expired entries then the least recently used until we fit in max_size"""
+        with self._connect() as db:
+            db.execute("BEGIN IMMEDIATE")
+            self._remove(db, "expires < ?", (time.time(),))
+
+            total = self._total(db)
+            while total > self.max_size:
+                # Oldest first, a batch at a time so we never read the whole table
+                rows = db.execute(
+                    "SELECT key, size FROM responses ORDER BY accessed LIMIT 100"
+                ).fetchall()
+                if not rows:
+                    break
+                removed = 0
+                for key, size in rows:
+                    if total - removed <= self.max_size:
+                        break
+                    db.execute("DELETE FROM responses WHERE key=?", (key,))
+                    removed += size
+                db.execute(
+                    "UPDATE meta SET value = value - ? WHERE key='size'", (removed,)
+                )
+                total -= removed
+            db.execute("COMMIT")
+
+    def size(self) -> int:
+        """Total size in bytes of the cached values"""
+        with self._connect() as db:
+            return self._total(db)
+
+    def clear(self) -> None:
+        """Remove every entry"""
+        with self._connect() as db:
+            db.execute("BEGIN IMMEDIATE")
+            db.execute("DELETE FROM responses")
+            db.execute("UPDATE meta SET value = 0 WHERE key='size'")
+            db.execute("COMMIT")
+
+    def __len__(self) -> int:
+        with self._connect() as db:
+            return db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
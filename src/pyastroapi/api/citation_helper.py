@@ -3,10 +3,14 @@
 from . import exceptions as e
 from . import urls
 from . import http
+from . import utils
 import typing as t
 
 __all__ = ["citations"]
 
+# Largest number of bibcodes we send to the citation helper in one request
+_max_bibcodes = 1000
+
 
 def citations(token: str, bibcode: t.List[str]):
     """Given a set of bibcodes, suggest additional citations.
@@ -29,9 +33,27 @@ def citations(token: str, bibcode: t.List[str]):
     if not isinstance(bibcode, list):
         raise TypeError("Must pass a list of more than one bibcode")
 
-    r = http.post_bibcodes(token, url, bibcode, True)
+    def send(bibs):
+        r = http.post_bibcodes(token, url, bibs, True)
+
+        if r.status != 200:
+            raise e.AdsApiError(r.response["error"])
+
+        return r.response
+
+    if len(bibcode) <= _max_bibcodes:
+        return send(bibcode)
 
-    if r.status != 200:
-        raise e.AdsApiError(r.response["error"])
+    # Scores count how many of the input papers are linked to a suggestion,
+    # so they can be summed over disjoint chunks of the input
+    merged: t.Dict[str, t.Dict] = {}
+    for res in utils.concurrent_map(send, utils.chunks(bibcode, _max_bibcodes)):
+        for i in res:
+            if i["bibcode"] in merged:
+                merged[i["bibcode"]]["score"] += i["score"]
+            else:
+                merged[i["bibcode"]] = dict(i)
 
-    return r.response
+    inputs = set(bibcode)
+    result = [i for i in merged.values() if i["bibcode"] not in inputs]
+    return sorted(result, key=lambda i: i["score"], reverse=True)
@@ -4,6 +4,7 @@ from . import exceptions as e
 from . import urls
 from . import http
 from . import utils
+import re
 import typing as t
 
 _exportType = t.List[str]
@@ -32,7 +33,22 @@ __all__ = [
 ]
 
 
-def _export(token: str, bibcode: t.Union[str, t.List[str]], format: str) -> str:
+# Largest number of bibcodes the export service accepts in one request
+_max_bibcodes = 2000
+
+# Element holding each record in the formats that come back as one document
+_records = {
+    "dcxml": "record",
+    "refxml": "record",
+    "refabsxml": "record",
+    "rss": "item",
+    "votable": "TR",
+}
+
+
+def _export(
+    token: str, bibcode: t.Union[str, t.List[str]], format: str, sep: str = "\n"
+) -> str:
     """General method for exporting a reference
 
     Users should not call this directly.
@@ -41,22 +57,78 @@ def _export(token: str, bibcode: t.Union[str, t.List[str]], format: str) -> str:
         token (str): ADSABS token
         bibcode (t.Union[str, t.List[str]]): Either a single bibcode or a list of bibcodes
         format (str): Requested export format
+        sep (str): Separator used to join the exports from each chunk. Defaults to "\n".
 
     Raises:
-        e.NoRecordsFound: _description_
         e.AdsApiError: _description_
 
     Returns:
         str: Export data
     """
+    return sep.join(i.rstrip("\n") for i in _export_chunks(token, bibcode, format))
+
+
+def _export_chunks(
+    token: str, bibcode: t.Union[str, t.List[str]], format: str
+) -> t.List[str]:
+    """Export in chunks of at most _max_bibcodes, sent concurrently
+
+    Returns:
+        t.List[str]: Export data from each chunk in input order
+    """
     url = urls.make_url(urls.urls["export"][format])
-    data = {"bibcode": utils.ensure_list(bibcode)}
-    r = http.post(token, url, data)
 
-    if r.status != 200:
-        raise e.AdsApiError(r.response["error"])
+    def send(bibs):
+        data = {"bibcode": bibs}
+        r = http.post(token, url, data)
+
+        if r.status != 200:
+            raise e.AdsApiError(r.response["error"])
+
+        return r.response["export"]
+
+    bibs = utils.ensure_list(bibcode)
+    return utils.concurrent_map(send, utils.chunks(bibs, _max_bibcodes))
+
+
+def _export_document(
+    token: str, bibcode: t.Union[str, t.List[str]], format: str
+) -> _exportType:
+    """Export a format that returns a single document
+
+    When the bibcodes are split over several requests the records from each
+    chunk are spliced into the first chunk's document.
+
+    Returns:
+        _exportType: A single element list holding the document
+    """
+    docs = _export_chunks(token, bibcode, format)
+    if len(docs) == 1:
+        return docs
+
+    tag = _records[format]
+    start = re.compile(rf"<(\w+:)?{tag}[\s/>]")
+    end = re.compile(rf"</(\w+:)?{tag}>")
+
+    def span(doc):
+        first = start.search(doc)
+        last = None
+        for last in end.finditer(doc):
+            pass
+        if first is None or last is None:
+            return None
+        return first.start(), last.end()
+
+    # Chunks where every bibcode was skipped have no records to add
+    found = [(doc, span(doc)) for doc in docs]
+    found = [(doc, s) for doc, s in found if s is not None]
+    if not found:
+        return docs[:1]
+
+    head, (_, pos) = found[0]
+    body = "".join(doc[a:b] for doc, (a, b) in found[1:])
 
-    return r.response["export"]
+    return [head[:pos] + body + head[pos:]]
 
 
 def ads(token: str, bibcode: t.Union[str, t.List[str]]) -> _exportType:
@@ -71,7 +143,7 @@ def ads(token: str, bibcode: t.Union[str, t.List[str]]) -> _exportType:
     Returns:
         _exportType: Export data
     """
-    r = _export(token, bibcode, "ads").split("\n\n\n")
+    r = _export(token, bibcode, "ads", "\n\n\n").split("\n\n\n")
     return [i for i in r if i]
 
 
@@ -87,7 +159,7 @@ def bibtexabs(token: str, bibcode: t.Union[str, t.List[str]]) -> _exportType:
     Returns:
         _exportType: Export data
     """
-    r = _export(token, bibcode, "bibtexabs").split("\n\n")
+    r = _export(token, bibcode, "bibtexabs", "\n\n").split("\n\n")
     return [i for i in r if i]
 
 
@@ -103,7 +175,7 @@ def bibtex(token: str, bibcode: t.Union[str, t.List[str]]) -> _exportType:
     Returns:
         _exportType: Export data
     """
-    r = _export(token, bibcode, "bibtex").split("\n\n")
+    r = _export(token, bibcode, "bibtex", "\n\n").split("\n\n")
     return [i for i in r if i]
 
 
@@ -119,7 +191,7 @@ def endnote(token: str, bibcode: t.Union[str, t.List[str]]) -> _exportType:
     Returns:
         _exportType: Export data
     """
-    r = _export(token, bibcode, "endnote").split("\n\n\n")
+    r = _export(token, bibcode, "endnote", "\n\n\n").split("\n\n\n")
     return [i for i in r if i]
 
 
@@ -135,7 +207,7 @@ def medlars(token: str, bibcode: t.Union[str, t.List[str]]) -> _exportType:
     Returns:
         _exportType: Export data
     """
-    r = _export(token, bibcode, "medlars").split("\n\n\n")
+    r = _export(token, bibcode, "medlars", "\n\n\n").split("\n\n\n")
     return [i for i in r if i]
 
 
@@ -151,7 +223,7 @@ def procite(token: str, bibcode: t.Union[str, t.List[str]]) -> _exportType:
     Returns:
         _exportType: Export data
     """
-    r = _export(token, bibcode, "procite").split("\n\n\n")
+    r = _export(token, bibcode, "procite", "\n\n\n").split("\n\n\n")
     return [i for i in r if i]
 
 
@@ -167,7 +239,7 @@ def refworks(token: str, bibcode: t.Union[str, t.List[str]]) -> _exportType:
     Returns:
         _exportType: Export data
     """
-    r = _export(token, bibcode, "refworks").split("\n\n\n")
+    r = _export(token, bibcode, "refworks", "\n\n\n").split("\n\n\n")
     return [i for i in r if i]
 
 
@@ -183,7 +255,7 @@ def ris(token: str, bibcode: t.Union[str, t.List[str]]) -> _exportType:
     Returns:
         _exportType: Export data
     """
-    r = _export(token, bibcode, "ris").split("\n\n\n")
+    r = _export(token, bibcode, "ris", "\n\n\n").split("\n\n\n")
     return [i for i in r if i]
 
 
@@ -199,7 +271,7 @@ def aastex(token: str, bibcode: t.Union[str, t.List[str]]) -> _exportType:
     Returns:
         _exportType: Export data
     """
-    r = _export(token, bibcode, "aastex").split("\n")
+    r = _export(token, bibcode, "aastex", "\n").split("\n")
     return [i for i in r if i]
 
 
@@ -215,7 +287,7 @@ def icarus(token: str, bibcode: t.Union[str, t.List[str]]) -> _exportType:
     Returns:
         _exportType: Export data
     """
-    r = _export(token, bibcode, "icarus").split("\n")
+    r = _export(token, bibcode, "icarus", "\n").split("\n")
     return [i for i in r if i]
 
 
@@ -231,7 +303,7 @@ def mnras(token: str, bibcode: t.Union[str, t.List[str]]) -> _exportType:
     Returns:
         _exportType: Export data
     """
-    r = _export(token, bibcode, "mnras").split("\n")
+    r = _export(token, bibcode, "mnras", "\n").split("\n")
     return [i for i in r if i]
 
 
@@ -247,7 +319,7 @@ def soph(token: str, bibcode: t.Union[str, t.List[str]]) -> _exportType:
     Returns:
         _exportType: Export data
     """
-    r = _export(token, bibcode, "soph").split("\n")
+    r = _export(token, bibcode, "soph", "\n").split("\n")
     return [i for i in r if i]
 
 
@@ -263,7 +335,7 @@ def dcxml(token: str, bibcode: t.Union[str, t.List[str]]) -> _exportType:
     Returns:
         _exportType: Export data
     """
-    return [_export(token, bibcode, "dcxml")]  # unsplitable
+    return _export_document(token, bibcode, "dcxml")
 
 
 def refxml(token: str, bibcode: t.Union[str, t.List[str]]) -> _exportType:
@@ -278,7 +350,7 @@ def refxml(token: str, bibcode: t.Union[str, t.List[str]]) -> _exportType:
     Returns:
         _exportType: Export data
     """
-    return [_export(token, bibcode, "refxml")]  # unsplitable
+    return _export_document(token, bibcode, "refxml")
 
 
 def refabsxml(token: str, bibcode: t.Union[str, t.List[str]]) -> _exportType:
@@ -293,7 +365,7 @@ def refabsxml(token: str, bibcode: t.Union[str, t.List[str]]) -> _exportType:
     Returns:
         _exportType: Export data
     """
-    return [_export(token, bibcode, "refabsxml")]  # unsplitable
+    return _export_document(token, bibcode, "refabsxml")
 
 
 def rss(token: str, bibcode: t.Union[str, t.List[str]]) -> _exportType:
@@ -308,7 +380,7 @@ def rss(token: str, bibcode: t.Union[str, t.List[str]]) -> _exportType:
     Returns:
         _exportType: Export data
     """
-    return [_export(token, bibcode, "rss")]  # unsplitable
+    return _export_document(token, bibcode, "rss")
 
 
 def votable(token: str, bibcode: t.Union[str, t.List[str]]) -> _exportType:
@@ -323,7 +395,7 @@ def votable(token: str, bibcode: t.Union[str, t.List[str]]) -> _exportType:
     Returns:
         _exportType: Export data
     """
-    return [_export(token, bibcode, "votable")]  # unsplitable
+    return _export_document(token, bibcode, "votable")
 
 
 def ieee(token: str, bibcode: t.Union[str, t.List[str]]) -> _exportType:
@@ -338,7 +410,7 @@ def ieee(token: str, bibcode: t.Union[str, t.List[str]]) -> _exportType:
     Returns:
         _exportType: Export data
     """
-    r = _export(token, bibcode, "ieee").split("\n")
+    r = _export(token, bibcode, "ieee", "\n").split("\n")
     return [i for i in r if i]
 
 
@@ -1,14 +1,30 @@
 # SPDX-License-Identifier: BSD-3-Clause
 
+import contextlib
 import requests
 import os
+import json as _json
+import threading
+import time
 import typing as t
 
 from dataclasses import dataclass
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type:ignore
+
 from . import utils
+from . import urls
+from . import cache as _cache
 
 __all__ = [
+    "Client",
+    "RateLimiter",
+    "get_client",
+    "set_client",
+    "budget",
     "get",
     "post",
     "put",
@@ -54,13 +70,25 @@ class ADSLimits:
     remaining: int = -1
     reset: int = -1
 
-    def __init__(self, header):
-        try:
-            self.limit = header["X-RateLimit-Limit"]
-            self.remaining = header["X-RateLimit-Remaining"]
-            self.reset = header["X-RateLimit-Reset"]
-        except KeyError:
-            pass
+    def __init__(
+        self, header=None, limit: int = -1, remaining: int = -1, reset: int = -1
+    ):
+        self.limit = limit
+        self.remaining = remaining
+        self.reset = reset
+
+        if header is None:
+            return
+
+        for attr, key in [
+            ("limit", "X-RateLimit-Limit"),
+            ("remaining", "X-RateLimit-Remaining"),
+            ("reset", "X-RateLimit-Reset"),
+        ]:
+            try:
+                setattr(self, attr, int(header[key]))
+            except (KeyError, ValueError):
+                pass
 
 
 @dataclass
@@ -70,6 +98,353 @@ class HttpResponse:
     limits: ADSLimits
 
 
+# Methods that are safe to send again if the server failed part way through
+_idempotent = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+
+class RateLimiter:
+    """Tracks the ADS rate limit budget and schedules requests against it
+
+    The budget is updated from the X-RateLimit headers of every ADS response. It is
+    shared between threads, and between processes if a state_file is given.
+
+    Args:
+        pace (bool, optional): Spread requests evenly over the time left until the limit resets,
+                               so long crawls finish inside the quota. Defaults to False.
+        max_retries (int, optional): Number of times to retry on a 429 or 5xx response (5xx only for idempotent methods). Defaults to 3.
+        backoff (float, optional): Base delay in seconds for retrying 5xx responses. Defaults to 1.0.
+        max_wait (float, optional): Longest time in seconds we will sleep waiting for the limit
+                                    to reset. Defaults to 3600.
+        state_file (str, optional): File used to share the budget between processes. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        pace: bool = False,
+        max_retries: int = 3,
+        backoff: float = 1.0,
+        max_wait: float = 3600,
+        state_file: t.Optional[str] = None,
+    ) -> None:
+        self.pace = pace
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_wait = max_wait
+        self.state_file = state_file
+
+        if self.state_file is not None:
+            self.state_file = os.path.expanduser(self.state_file)
+
+        self._lock = threading.Lock()
+        self._limits = ADSLimits()
+        self._last = 0.0
+
+    @property
+    def budget(self) -> ADSLimits:
+        """The most recent ADS limits seen by any thread (or process)"""
+        with self._lock, self._state(write=False):
+            return ADSLimits(
+                limit=self._limits.limit,
+                remaining=self._limits.remaining,
+                reset=self._limits.reset,
+            )
+
+    def update(self, header) -> None:
+        """Update the budget from a set of response headers
+
+        Args:
+            header (dict): HTTP response headers
+        """
+        limits = ADSLimits(header)
+        if limits.remaining < 0:
+            return
+
+        with self._lock, self._state():
+            # Responses can finish out of order, so only accept a new reset window
+            # or a lower remaining count
+            if (
+                limits.reset > self._limits.reset
+                or limits.remaining < self._limits.remaining
+                or self._limits.remaining < 0
+            ):
+                self._limits = limits
+
+    def wait_time(self) -> float:
+        """Seconds to wait before the next request is allowed to be sent
+
+        This also reserves the slot, so call it only when about to send a request.
+
+        Returns:
+            float: Time in seconds
+        """
+        with self._lock, self._state():
+            now = time.time()
+            wait = 0.0
+            limits = self._limits
+
+            if limits.remaining >= 0 and limits.reset > now:
+                if limits.remaining == 0:
+                    wait = limits.reset - now
+                elif self.pace:
+                    interval = (limits.reset - now) / limits.remaining
+                    wait = max(0.0, self._last + interval - now)
+
+            self._last = now + wait
+
+        return min(wait, self.max_wait)
+
+    def acquire(self) -> None:
+        """Block until the next request is allowed to be sent"""
+        wait = self.wait_time()
+        if wait > 0:
+            time.sleep(wait)
+
+    def retry_delay(
+        self,
+        status: int,
+        header: t.Mapping[str, str],
+        attempt: int,
+        method: str = "GET",
+    ) -> t.Optional[float]:
+        """How long to wait before retrying a failed request
+
+        A 429 means the request was never handled so is always retried, 5xx errors are
+        only retried for idempotent methods as the request may have been partly applied.
+
+        Args:
+            status (int): HTTP status code of the failed response
+            header (dict): Headers of the failed response
+            attempt (int): How many times we have already retried
+            method (str, optional): HTTP method of the failed request. Defaults to "GET".
+
+        Returns:
+            float or None: Seconds to wait, or None if the request should not be retried
+        """
+        if attempt >= self.max_retries:
+            return None
+
+        if status == 429:
+            limits = ADSLimits(header)
+            if "Retry-After" in header:
+                try:
+                    delay = float(header["Retry-After"])
+                except ValueError:
+                    delay = self.backoff * 2**attempt
+            elif limits.reset > 0:
+                delay = max(0.0, limits.reset - time.time())
+            else:
+                delay = self.backoff * 2**attempt
+        elif status >= 500 and method.upper() in _idempotent:
+            delay = self.backoff * 2**attempt
+        else:
+            return None
+
+        if delay > self.max_wait:
+            return None
+        return delay
+
+    @contextlib.contextmanager
+    def _state(self, write: bool = True):
+        """Load the shared state and, with write, save it again afterwards
+
+        The state file is exclusively locked for the whole read-modify-write so two
+        processes can not both reserve the same slot.
+        """
+        if self.state_file is None:
+            yield
+            return
+
+        with open(self.state_file, "a+") as f:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                self._load(f)
+                yield
+                if write:
+                    self._save(f)
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _load(self, f: t.IO[str]) -> None:
+        try:
+            state = _json.load(f)
+        except ValueError:
+            # New (empty) file
+            return
+
+        self._limits = ADSLimits(
+            limit=state["limit"], remaining=state["remaining"], reset=state["reset"]
+        )
+        self._last = max(self._last, state["last"])
+
+    def _save(self, f: t.IO[str]) -> None:
+        f.seek(0)
+        f.truncate()
+        _json.dump(
+            {
+                "limit": self._limits.limit,
+                "remaining": self._limits.remaining,
+                "reset": self._limits.reset,
+                "last": self._last,
+            },
+            f,
+        )
+        f.flush()
+
+
+class Client:
+    """Holds a pooled keep-alive http session that all ADS calls are sent through
+
+    Re-using a single session means we only pay for the TCP and TLS handshakes once
+    per connection in the pool, rather than once per request.
+
+    Args:
+        pool_connections (int, optional): Number of host connection pools to cache. Defaults to 10.
+        pool_maxsize (int, optional): Maximum number of connections kept alive per host. Defaults to 10.
+        session (requests.Session, optional): Use an existing session instead of creating a new one. Defaults to None.
+        limiter (RateLimiter, optional): Scheduler for requests sent to ADS. Defaults to a new RateLimiter.
+        cache (cache.Cache, optional): On-disk cache consulted by get and post before going to ADS. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        session: t.Optional[requests.Session] = None,
+        limiter: t.Optional[RateLimiter] = None,
+        cache: t.Optional[_cache.Cache] = None,
+    ) -> None:
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.cache = cache
+
+        if limiter is None:
+            limiter = RateLimiter()
+        self.limiter = limiter
+
+        if session is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=pool_connections, pool_maxsize=pool_maxsize
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+
+        self.session = session
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request through the pooled session
+
+        Args:
+            method (str): HTTP method (GET, POST, PUT, DELETE)
+            url (str): URL to send the request to
+            **kwargs: Passed on to requests.Session.request
+
+        Requests to ADS are scheduled by the limiter and retried on 429 and 5xx errors.
+
+        Returns:
+            requests.Response:
+        """
+        if not url.startswith(urls.base_url):
+            return self.session.request(method, url, **kwargs)
+
+        attempt = 0
+        while True:
+            self.limiter.acquire()
+            r = self.session.request(method, url, **kwargs)
+            self.limiter.update(r.headers)
+
+            delay = self.limiter.retry_delay(r.status_code, r.headers, attempt, method)
+            if delay is None:
+                return r
+
+            # Free the connection before we send the request again
+            r.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def close(self) -> None:
+        """Close all pooled connections"""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+_client: t.Optional[Client] = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> Client:
+    """Get the client used for all ADS calls, creating a default one if needed
+
+    Returns:
+        Client:
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = Client()
+    return _client
+
+
+def budget() -> ADSLimits:
+    """Get the current ADS rate limit budget
+
+    Returns:
+        ADSLimits: The limit, remaining requests and reset time (-1 if not yet known)
+    """
+    return get_client().limiter.budget
+
+
+def set_client(client: t.Optional[Client]) -> None:
+    """Set the client used for all ADS calls
+
+    Args:
+        client (Client): The client to use. Passing None resets to a default client on the next call.
+    """
+    global _client
+    with _client_lock:
+        _client = client
+
+
+def _cached(
+    send: t.Callable[[], HttpResponse],
+    method: str,
+    url: str,
+    payload: t.Any,
+    token: str,
+) -> HttpResponse:
+    """Return a cached response if we have one, otherwise send the request and cache the result
+
+    Only successful responses from endpoints with a time to live are stored.
+    """
+    cache = get_client().cache
+    if cache is None:
+        return send()
+
+    ttl = cache.ttl_for(url)
+    if ttl <= 0:
+        return send()
+
+    key = cache.key(method, url, payload, token)
+    hit = cache.get(key)
+    if hit is not None:
+        return HttpResponse(hit, 200, ADSLimits())
+
+    r = send()
+    if r.status == 200:
+        cache.set(key, r.response, ttl)
+
+    return r
+
+
 def get(
     token: str, url: str, data: Payload_t = None, json: bool = True
 ) -> HttpResponse:
@@ -87,18 +462,22 @@ def get(
     if data is None:
         data = {}  # type:ignore
 
-    r = requests.get(
-        url,
-        auth=_BearerAuth(token),
-        params=data,
-    )
+    def send():
+        r = get_client().request(
+            "GET",
+            url,
+            auth=_BearerAuth(token),
+            params=data,
+        )
 
-    response_code = r.status_code
+        response_code = r.status_code
 
-    if json:
-        return HttpResponse(r.json(), response_code, ADSLimits(r.headers))
-    else:
-        return HttpResponse(r.text, response_code, ADSLimits(r.headers))
+        if json:
+            return HttpResponse(r.json(), response_code, ADSLimits(r.headers))
+        else:
+            return HttpResponse(r.text, response_code, ADSLimits(r.headers))
+
+    return _cached(send, "GET", url, [data, json], token)
 
 
 def post(
@@ -134,14 +513,17 @@ def post(
     if params is not None:
         args["params"] = params
 
-    r = requests.post(url, **args)  # type:ignore
+    def send():
+        r = get_client().request("POST", url, **args)  # type:ignore
 
-    response_code = r.status_code
+        response_code = r.status_code
 
-    if json:
-        return HttpResponse(r.json(), response_code, ADSLimits(r.headers))
-    else:
-        return HttpResponse(r.text, response_code, ADSLimits(r.headers))
+        if json:
+            return HttpResponse(r.json(), response_code, ADSLimits(r.headers))
+        else:
+            return HttpResponse(r.text, response_code, ADSLimits(r.headers))
+
+    return _cached(send, "POST", url, [data, params, json], token)
 
 
 def put(token: str, url: str, data: Payload_t) -> HttpResponse:
@@ -156,7 +538,8 @@ def put(token: str, url: str, data: Payload_t) -> HttpResponse:
         HttpResponse:
     """
 
-    r = requests.put(
+    r = get_client().request(
+        "PUT",
         url,
         auth=_BearerAuth(token),
         headers={"Content-Type": "application/json"},
@@ -178,7 +561,8 @@ def delete(token: str, url: str) -> HttpResponse:
     Returns:
         HttpResponse:
     """
-    r = requests.delete(
+    r = get_client().request(
+        "DELETE",
         url,
         auth=_BearerAuth(token),
     )
@@ -233,51 +617,92 @@ def bigquery_bibcodes(
 
     data = "bibcode\n" + "\n".join(utils.ensure_list(bibcodes))
 
-    r = requests.post(
-        url,
-        params=params,
-        auth=_BearerAuth(token),
-        data=data,
-    )
+    def send():
+        r = get_client().request(
+            "POST",
+            url,
+            params=params,
+            auth=_BearerAuth(token),
+            data=data,
+        )
 
-    response_code = r.status_code
+        response_code = r.status_code
 
-    return HttpResponse(r.json(), response_code, ADSLimits(r.headers))
+        return HttpResponse(r.json(), response_code, ADSLimits(r.headers))
+
+    return _cached(send, "POST", url, [data, params], token)
 
 
-def download_file(url: str, filename: str):
+def _is_html(start: bytes) -> bool:
+    start = start.lstrip().lower()
+    return start.startswith(b"<!doctype html") or start.startswith(b"<html")
+
+
+def download_file(
+    url: str, filename: str, resume: bool = False, chunk_size: int = 1024 * 1024
+):
     """Download a file to filename
 
     On return you should check if the file exists to see if it succeeded.
 
+    The data is written to filename + ".part" and only moved to filename once complete.
+    With resume, an existing .part file is continued with a HTTP Range request (if the
+    server does not support ranges the download starts again).
+
     Args:
         url (str): URL to download from
         filename (str): Filename to save file to.
+        resume (bool, optional): Continue a previous partial download. Defaults to False.
+        chunk_size (int, optional): Bytes read per chunk. Defaults to 1MB.
 
     Raises:
-        FileDownloadFailed: _description_
+        FileDownloadFailed: If the request fails or we got a html page rather than the file
     """
 
     headers = {
         "User-Agent": "Mozilla/5.0 (X11; Fedora; Linux x86_64; rv:96.0) Gecko/20100101 Firefox/96.0",
         "DNT": "1",
         "Accept": "*/*",
-        "Host": "www.google.com",
         "Connection": "keep-alive",
     }
 
-    r = requests.get(url, stream=True, headers=headers, allow_redirects=True)
-    with open(filename, "wb") as fd:
-        for chunk in r.iter_content(chunk_size=1024):
-            fd.write(chunk)
-
-    # Check if a pdf file was downloaded
-    with open(filename, "rb") as fd:
-        line = fd.readline()
-
-    if line.startswith(b"<!DOCTYPE html"):
-        os.remove(filename)
-        # html = os.path.abspath(filename.replace('.pdf','.html'))
-        # shutil.move(filename,html)
-        # webbrowser.open(f'file://{html}')
-        raise FileDownloadFailed("Annoying site gave us a html file and not a pdf")
+    part = filename + ".part"
+    offset = 0
+    if resume and os.path.exists(part):
+        offset = os.path.getsize(part)
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+    elif os.path.exists(part):
+        os.remove(part)
+
+    r = get_client().request(
+        "GET", url, stream=True, headers=headers, allow_redirects=True
+    )
+
+    with r:
+        if offset and r.status_code == 416:
+            # Nothing left to fetch
+            os.replace(part, filename)
+            return
+
+        if r.status_code >= 400:
+            raise FileDownloadFailed(f"Download failed with status {r.status_code}")
+
+        if r.status_code != 206:
+            # Server ignored the range so start again
+            offset = 0
+
+        chunks = r.iter_content(chunk_size=chunk_size)
+        first = next(chunks, b"")
+
+        # Check we are getting a pdf file before writing anything, any earlier
+        # partial download is left alone so another source can resume it
+        if not offset and _is_html(first):
+            raise FileDownloadFailed("Annoying site gave us a html file and not a pdf")
+
+        with open(part, "ab" if offset else "wb") as fd:
+            fd.write(first)
+            for chunk in chunks:
+                fd.write(chunk)
+
+    os.replace(part, filename)
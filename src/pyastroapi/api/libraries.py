@@ -17,6 +17,7 @@ __all__ = [
     "delete",
     "add",
     "remove",
+    "bulk",
     "edit",
 ]
 
@@ -56,31 +57,69 @@ def get_permissions(token: str, lib: str):
     return r.response
 
 
-def get(token: str, lib: str):
-    start = 0
-    count = 0
-    while True:
-        url = urls.make_url(urls.urls["libraries"]["view"], lib, "?start=" + str(start))
+# Largest number of documents the server returns in one page
+_max_rows = 2000
+
+# Number of bibcodes sent per request by bulk()
+_max_bibcodes = 1000
+
+
+def get(
+    token: str, lib: str, rows: t.Optional[int] = None, concurrent: bool = False
+) -> t.Generator[str, None, None]:
+    """Iterate over the bibcodes in a library
+
+    Args:
+        token (str): ADSABS token
+        lib (str): Library id
+        rows (int, optional): Documents per page, up to 2000. Defaults to the server's default.
+        concurrent (bool, optional): Once the first page gives the total, fetch the remaining
+                                     pages in parallel. Defaults to False.
+
+    Raises:
+        ValueError: If rows is out of range
+        e.AdsApiError: If a request fails
+
+    Yields:
+        str: Bibcode
+    """
+    if rows is not None and not 0 < rows <= _max_rows:
+        raise ValueError(f"rows must be between 1 and {_max_rows}")
+
+    def page(start):
+        query = "?start=" + str(start)
+        if rows is not None:
+            query += "&rows=" + str(rows)
+        url = urls.make_url(urls.urls["libraries"]["view"], lib, query)
 
         r = http.get(token, url)
 
         if r.status != 200:
             raise e.AdsApiError(r.response["error"])
 
-        total_num = int(r.response["metadata"]["num_documents"])
+        return int(r.response["metadata"]["num_documents"]), r.response["documents"]
 
-        if len(r.response["documents"]) == 0:
-            # Total_num lies sometimes so track when we stop getting new papers
-            break
-
-        count += len(r.response["documents"])
+    total_num, docs = page(0)
+    count = len(docs)
+    yield from docs
 
-        yield from r.response["documents"]
+    if concurrent and len(docs) and count < total_num:
+        # Offsets assume every page is as full as the first
+        starts = list(range(count, total_num, len(docs)))
+        for start, (_, page_docs) in zip(starts, utils.concurrent_map(page, starts)):
+            # After a short page the later offsets no longer line up with what
+            # we have returned, so carry on one page at a time from count
+            if start != count:
+                break
+            docs = page_docs
+            count += len(docs)
+            yield from docs
 
-        if count == total_num:
-            break
-        else:
-            start = count - 1
+    # Total_num lies sometimes so keep going until we stop getting new papers
+    while len(docs) and count < total_num:
+        total_num, docs = page(count)
+        count += len(docs)
+        yield from docs
 
 
 def update_metadata(
@@ -186,6 +225,81 @@ def remove(token: str, lib: str, bibcode: str):
         )
 
 
+def bulk(
+    token: str,
+    lib: str,
+    bibcodes: t.List[str],
+    action: str = "add",
+    chunk_size: int = _max_bibcodes,
+    retries: int = 0,
+) -> t.Dict[str, str]:
+    """Add or remove many bibcodes, reporting the outcome for each one
+
+    The bibcodes are sent in chunks of chunk_size in parallel. Unlike add and remove,
+    failures do not raise, instead each bibcode is given a status:
+
+        "ok": The bibcode is now in (or no longer in) the library
+        "failed": The server did not apply the change, e.g an invalid bibcode
+        anything else: The error message returned for that bibcode's chunk
+
+    ADS only returns the number of bibcodes changed, so when that does not match a chunk
+    the library is downloaded once to find which ones were applied.
+
+    Failed bibcodes can be retried by passing them back in, or automatically with retries.
+
+    Args:
+        token (str): ADSABS token
+        lib (str): Library id
+        bibcodes (t.List[str]): Bibcodes to add or remove
+        action (str, optional): Either "add" or "remove". Defaults to "add".
+        chunk_size (int, optional): Bibcodes per request. Defaults to 1000.
+        retries (int, optional): Number of times to resend bibcodes that were not "ok". Defaults to 0.
+
+    Raises:
+        ValueError: If action is not valid
+
+    Returns:
+        t.Dict[str, str]: Map of bibcode to status
+    """
+    if action not in ["add", "remove"]:
+        raise ValueError(f"action must be add or remove not {action}")
+
+    url = urls.make_url(urls.urls["libraries"]["change"], lib)
+    key = "number_added" if action == "add" else "number_removed"
+
+    def send(bibs):
+        r = http.post(token, url, {"action": action, "bibcode": bibs})
+
+        if r.status != 200:
+            error = r.response.get("error", f"Status {r.status}")
+            return {b: str(error) for b in bibs}
+
+        if r.response[key] == len(bibs):
+            return {b: "ok" for b in bibs}
+
+        # Don't know which ones were applied yet
+        return {b: None for b in bibs}
+
+    report: t.Dict[str, t.Any] = {}
+    pending = list(dict.fromkeys(utils.ensure_list(bibcodes)))
+
+    for _ in range(retries + 1):
+        for res in utils.concurrent_map(send, utils.chunks(pending, chunk_size)):
+            report.update(res)
+
+        unknown = [b for b in pending if report[b] is None]
+        if len(unknown):
+            members = set(get(token, lib, rows=_max_rows))
+            for b in unknown:
+                report[b] = "ok" if (b in members) == (action == "add") else "failed"
+
+        pending = [b for b in pending if report[b] != "ok"]
+        if not len(pending):
+            break
+
+    return report
+
+
 def edit(
     token: str,
     lib: str,
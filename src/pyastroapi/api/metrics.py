@@ -17,6 +17,13 @@ __all__ = [
     "timeseries",
 ]
 
+# Largest number of bibcodes the metrics service accepts in one request
+_max_bibcodes = 2000
+
+# Types whose results from separate requests can be added together exactly. The
+# others hold medians, distinct citing paper counts or indices like the h-index
+_mergeable = ["histograms"]
+
 
 def detail(token: str, bibcode: t.List[str]) -> t.Dict:
     """Provides basic, year-by-year metrics on a per-bibcode basis.
@@ -31,12 +38,25 @@ def detail(token: str, bibcode: t.List[str]) -> t.Dict:
         dict: Metric data
     """
     url = urls.make_url(urls.urls["metrics"]["detail"])
-    r = http.post_bibcodes(token, url, bibcode)
 
-    if r.status != 200:
-        raise e.AdsApiError(r.response["error"])
+    def send(bibs):
+        r = http.post_bibcodes(token, url, bibs)
 
-    return r.response
+        if r.status != 200:
+            raise e.AdsApiError(r.response["error"])
+
+        return r.response
+
+    if not isinstance(bibcode, list) or len(bibcode) <= _max_bibcodes:
+        return send(bibcode)
+
+    # Per-bibcode results so chunks just need combining
+    result: t.Dict[str, t.Any] = {"skipped bibcodes": []}
+    for res in utils.concurrent_map(send, utils.chunks(bibcode, _max_bibcodes)):
+        result["skipped bibcodes"].extend(res.pop("skipped bibcodes", []))
+        result.update(res)
+
+    return result
 
 
 def metrics(token: str, bibcode: str) -> t.Dict:
@@ -63,13 +83,57 @@ def metrics(token: str, bibcode: str) -> t.Dict:
 def _metric(token: str, bibcode: t.List[str], format: str) -> t.Dict:
 
     url = urls.make_url(urls.urls["metrics"]["metrics"])
-    payload = {"bibcodes": utils.ensure_list(bibcode), "types": [format]}
-    r = http.post(token, url, payload)
 
-    if r.status != 200:
-        raise e.AdsApiError(r.response["error"])
+    def send(bibs):
+        payload = {"bibcodes": bibs, "types": [format]}
+        r = http.post(token, url, payload)
 
-    return r.response
+        if r.status != 200:
+            raise e.AdsApiError(r.response["error"])
+
+        return r.response
+
+    bibs = utils.ensure_list(bibcode)
+    if len(bibs) <= _max_bibcodes:
+        return send(bibs)
+
+    if format not in _mergeable:
+        raise ValueError(
+            f"{format} can not be combined from separate requests, "
+            f"use at most {_max_bibcodes} bibcodes"
+        )
+
+    results = utils.concurrent_map(send, utils.chunks(bibs, _max_bibcodes))
+
+    return _merge(results)
+
+
+def _merge(results: t.List[t.Dict]) -> t.Dict:
+    """Combine the histograms from several chunks of bibcodes
+
+    Counts are summed year by year, years missing from a chunk count as zero.
+    """
+    result: t.Dict[str, t.Any] = {
+        "skipped bibcodes": sum((r.get("skipped bibcodes", []) for r in results), [])
+    }
+
+    for key in results[0]:
+        if key == "skipped bibcodes":
+            continue
+        result[key] = _merge_stats([r[key] for r in results])
+
+    return result
+
+
+def _merge_stats(stats: t.List[t.Any]) -> t.Any:
+    if isinstance(stats[0], dict):
+        # Histograms from different chunks may cover different years
+        return {
+            key: _merge_stats([s[key] for s in stats if key in s])
+            for key in dict.fromkeys(k for s in stats for k in s)
+        }
+
+    return sum(s for s in stats if s is not None)
 
 
 def basic(token: str, bibcode: t.List[str]) -> t.Dict:
@@ -81,6 +145,10 @@ def basic(token: str, bibcode: t.List[str]) -> t.Dict:
 
     Returns:
         dict: Metric data
+
+    Raises:
+        ValueError: If given more than 2000 bibcodes, as this can not be
+            combined from separate requests
     """
     return _metric(token, bibcode, "basic")
 
@@ -94,6 +162,10 @@ def citations(token: str, bibcode: t.List[str]) -> t.Dict:
 
     Returns:
         dict: Metric data
+
+    Raises:
+        ValueError: If given more than 2000 bibcodes, as this can not be
+            combined from separate requests
     """
     return _metric(token, bibcode, "citations")
 
@@ -107,6 +179,10 @@ def indicators(token: str, bibcode: t.List[str]) -> t.Dict:
 
     Returns:
         dict: Metric data
+
+    Raises:
+        ValueError: If given more than 2000 bibcodes, as this can not be
+            combined from separate requests
     """
     return _metric(token, bibcode, "indicators")
 
@@ -133,5 +209,9 @@ def timeseries(token: str, bibcode: t.List[str]) -> t.Dict:
 
     Returns:
         dict: Metric data
+
+    Raises:
+        ValueError: If given more than 2000 bibcodes, as this can not be
+            combined from separate requests
     """
     return _metric(token, bibcode, "timeseries")
@@ -1,10 +1,24 @@
 # SPDX-License-Identifier: BSD-3-Clause
+import collections
+import re
+import threading
+import typing as t
+
 from . import exceptions as e
 from . import urls
 from . import http
 from . import utils
+from . import cache as _cache
+
+__all__ = ["resolve", "resolve_many"]
+
+# Number of reference strings sent per request by resolve_many
+_max_references = 16
 
-__all__ = ["resolve"]
+# Least recently used memo of normalized reference string to its resolution, shared between calls to resolve_many
+_memo: "collections.OrderedDict[str, t.Dict[str, str]]" = collections.OrderedDict()
+_memo_size = 100_000
+_memo_lock = threading.Lock()
 
 
 def resolve(token, reference):
@@ -18,3 +32,100 @@ def resolve(token, reference):
         raise e.AdsApiError(r.response["error"])
 
     return r.response["resolved"]
+
+
+def _normalize(reference: str) -> str:
+    """Collapse whitespace so trivially different copies of a reference match"""
+    return re.sub(r"\s+", " ", reference).strip()
+
+
+def resolve_many(
+    token: str,
+    references: t.Iterable[str],
+    memo: t.Optional[_cache.Cache] = None,
+    chunk_size: int = _max_references,
+) -> t.List[t.Dict[str, str]]:
+    """Resolve a large number of reference strings
+
+    Strings are normalized and de-duplicated, then looked up in an in-process memo of
+    past resolutions and then in the persistent memo, if there is one. Only strings not
+    seen before are sent, chunk_size at a time in parallel, and their results are added
+    to both memos.
+
+    Args:
+        token (str): ADSABS token
+        references (iterable[str]): Reference strings
+        memo (cache.Cache, optional): Persistent store of past resolutions. Defaults to the http client's cache, if set.
+        chunk_size (int, optional): Reference strings per request. Defaults to 16.
+
+    Raises:
+        e.AdsApiError: If any request fails, after the results of the other requests have been added to the memos
+
+    Returns:
+        t.List[t.Dict[str, str]]: One result per reference string, in the same order
+    """
+    if memo is None:
+        memo = http.get_client().cache
+
+    url = urls.make_url(urls.urls["ref"]["text"])
+    if memo is not None and not memo.ttl_for(url):
+        memo = None
+
+    references = list(references)
+    unique = list(dict.fromkeys(_normalize(r) for r in references))
+
+    def remember(new):
+        with _memo_lock:
+            _memo.update(new)
+            while len(_memo) > _memo_size:
+                _memo.popitem(last=False)
+
+    found: t.Dict[str, t.Dict[str, str]] = {}
+    with _memo_lock:
+        for ref in unique:
+            if ref in _memo:
+                _memo.move_to_end(ref)
+                found[ref] = _memo[ref]
+
+    keys = {}
+    if memo is not None:
+        keys = {ref: memo.key("POST", url, ref, token) for ref in unique}
+        cached = memo.get_many(keys[ref] for ref in unique if ref not in found)
+        new = {ref: cached[key] for ref, key in keys.items() if key in cached}
+        found.update(new)
+        remember(new)
+
+    def fetch(chunk):
+        # Memoize each chunk as soon as it resolves so a later failure loses nothing
+        try:
+            new = dict(zip(chunk, resolve(token, chunk)))
+        except e.AdsApiError as err:
+            return None, str(err)
+
+        remember(new)
+        if memo is not None:
+            memo.set_many(
+                {keys[ref]: value for ref, value in new.items()}, memo.ttl_for(url)
+            )
+        return new, None
+
+    todo = [ref for ref in unique if ref not in found]
+    errors = []
+    for new, error in utils.concurrent_map(fetch, utils.chunks(todo, chunk_size)):
+        if error is not None:
+            errors.append(error)
+        else:
+            found.update(new)
+
+    if len(errors):
+        raise e.AdsApiError(
+            f"{len(errors)} chunks of references failed, the rest were saved: {errors[0]}"
+        )
+
+    result = []
+    for ref in references:
+        res = dict(found[_normalize(ref)])
+        res["refstring"] = ref
+        result.append(res)
+
+    return result
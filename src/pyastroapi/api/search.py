@@ -2,12 +2,15 @@
 
 import typing as t
 
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+
 from . import exceptions as e
 from . import urls
 from . import http
 from . import utils
 
-__all__ = ["search", "bigquery"]
+__all__ = ["search", "bigquery", "bigquery_search"]
 
 _fields = set(
     """abstract ack aff aff_id alternate_bibcode alternate_title arxiv_class author author_count author_norm 
@@ -33,6 +36,9 @@ _fields = set(
 
 _short_fl = "abstract,author,bibcode,pubdate,title,pub,year,citation_count"
 
+# Largest number of rows ADS will return in one request
+_max_rows = 2000
+
 
 def search(
     token: str,
@@ -41,7 +47,35 @@ def search(
     fq: str = "",
     limit: int = -1,
     dbg: bool = False,
+    rows: int = None,
+    cursor: bool = False,
+    prefetch: int = 0,
 ) -> t.Generator[t.Dict[t.Any, t.Any], None, None]:
+    """Search ADS
+
+    https://ui.adsabs.harvard.edu/help/api/api-docs.html#get-/search/query
+
+    Args:
+        token (str): ADSABS token
+        query (str, optional): ADS query string. Defaults to "*:*".
+        fields (str, optional): Comma separated list of fields to return. Defaults to a short set of fields.
+        fq (str, optional): Filter query. Defaults to "".
+        limit (int, optional): Maximum number of records to return (-1 is no limit). Defaults to -1.
+        dbg (bool, optional): Print each request. Defaults to False.
+        rows (int, optional): Number of records per request, up to 2000. Defaults to limit if set, otherwise 50.
+        cursor (bool, optional): Page with a cursorMark (sorted on id) instead of start offsets.
+                                 This is faster for deep pagination and never repeats or skips records. Defaults to False.
+        prefetch (int, optional): Number of pages to keep in flight in the background while the
+                                  current page is consumed. Results are still returned in order.
+                                  With cursor=True at most one page can be fetched ahead. Defaults to 0.
+
+    Raises:
+        ValueError: If a field or the number of rows is not valid
+        e.AdsApiError: If the request fails
+
+    Yields:
+        dict: One dict per record, with keys given by fields
+    """
 
     if fields is not None:
         for f in fields.split(","):
@@ -50,53 +84,218 @@ def search(
     else:
         fields = _short_fl
 
+    if rows is None:
+        if limit > 0:
+            rows = min(limit, _max_rows)
+        else:
+            rows = 50
+    elif rows < 1 or rows > _max_rows:
+        raise ValueError(f"rows must be between 1 and {_max_rows}")
+
     split_f = fields.split(",")
 
+    if cursor:
+        yield from _search_cursor(
+            token, query, fields, fq, limit, dbg, rows, split_f, prefetch
+        )
+        return
+
+    if prefetch > 0:
+        yield from _search_prefetch(
+            token, query, fields, fq, limit, dbg, rows, split_f, prefetch
+        )
+        return
+
     start = 0
     count = 0
     while True:
+        page_rows = rows
+        if limit > 0:
+            page_rows = min(rows, limit - count)
+
         data = {
             "q": f"{query}",
             "fl": f"{fields}",
             "fq": f"{fq}",
             "start": f"{start}",
+            "rows": f"{page_rows}",
         }
 
+        r = _query(token, data, dbg)
+
+        total_num = int(r["response"]["numFound"])
+
+        docs = r["response"]["docs"]
+        if not len(docs):
+            break
+
         if limit > 0:
-            data["rows"] = f"{limit}"
+            docs = docs[: limit - count]
+        count += len(docs)
+
+        yield from _fill(docs, split_f)
+
+        if count >= total_num or (count >= limit and limit > 0):
+            break
         else:
-            data["rows"] = "50"
+            start = count
 
-        url = urls.make_url(urls.urls["search"]["search"])
 
-        if dbg:
-            print(url)
-            print(data)
+def _search_prefetch(
+    token: str,
+    query: str,
+    fields: str,
+    fq: str,
+    limit: int,
+    dbg: bool,
+    rows: int,
+    split_f: t.List[str],
+    prefetch: int,
+) -> t.Generator[t.Dict[t.Any, t.Any], None, None]:
+    """Page with start offsets, keeping the next prefetch pages in flight
 
-        r = http.get(token, url, data=data)
+    The first page tells us the total number of records, after that every
+    page offset is known up front so they can be requested concurrently.
+    """
 
-        if r.status != 200:
-            raise e.AdsApiError(r.response["error"])
+    def page(start):
+        page_rows = rows
+        if limit > 0:
+            page_rows = min(rows, limit - start)
+        return {
+            "q": f"{query}",
+            "fl": f"{fields}",
+            "fq": f"{fq}",
+            "start": f"{start}",
+            "rows": f"{page_rows}",
+        }
 
-        total_num = int(r.response["response"]["numFound"])
+    r = _query(token, page(0), dbg)
 
-        if not len(r.response["response"]["docs"]):
-            break
+    total_num = int(r["response"]["numFound"])
+    if limit > 0:
+        total_num = min(total_num, limit)
 
-        count += len(r.response["response"]["docs"])
+    starts = iter(range(rows, total_num, rows))
+    pending: t.Deque[Future] = deque()
 
-        for index, doc in enumerate(r.response["response"]["docs"]):
-            for f in split_f:
-                if f not in doc:
-                    r.response["response"]["docs"][index][f] = None
+    pool = ThreadPoolExecutor(max_workers=prefetch)
 
-        # print(count,total_num,start)
-        yield from r.response["response"]["docs"]
+    def submit():
+        while len(pending) < prefetch:
+            start = next(starts, None)
+            if start is None:
+                break
+            pending.append(pool.submit(_query, token, page(start), dbg))
 
-        if count >= total_num or (count >= limit and limit > 0):
-            break
-        else:
-            start += count - 1
+    try:
+        submit()
+        docs = r["response"]["docs"]
+        while len(docs):
+            yield from _fill(docs, split_f)
+
+            if not pending:
+                break
+            docs = pending.popleft().result()["response"]["docs"]
+            submit()
+    finally:
+        for f in pending:
+            f.cancel()
+        pool.shutdown(wait=False)
+
+
+def _search_cursor(
+    token: str,
+    query: str,
+    fields: str,
+    fq: str,
+    limit: int,
+    dbg: bool,
+    rows: int,
+    split_f: t.List[str],
+    prefetch: int = 0,
+) -> t.Generator[t.Dict[t.Any, t.Any], None, None]:
+    """Deep pagination with Solr's cursorMark
+
+    The cursor needs a stable sort on the unique key, so we always sort on id.
+
+    Each page needs the cursor from the page before it, so prefetching can
+    only overlap fetching the next page with consuming the current one.
+    """
+
+    def page(cursor_mark, count):
+        page_rows = rows
+        if limit > 0:
+            page_rows = min(rows, limit - count)
+        return {
+            "q": f"{query}",
+            "fl": f"{fields}",
+            "fq": f"{fq}",
+            "rows": f"{page_rows}",
+            "sort": "id asc",
+            "cursorMark": cursor_mark,
+        }
+
+    pool = None
+    if prefetch > 0:
+        pool = ThreadPoolExecutor(max_workers=1)
+
+    def fetch(data):
+        if pool is None:
+            f: Future = Future()
+            f.set_result(_query(token, data, dbg))
+            return f
+        return pool.submit(_query, token, data, dbg)
+
+    cursor_mark = "*"
+    count = 0
+    pending: t.Optional[Future] = fetch(page(cursor_mark, count))
+    try:
+        while pending is not None:
+            r = pending.result()
+            pending = None
+
+            docs = r["response"]["docs"]
+            if not len(docs):
+                break
+
+            count += len(docs)
+
+            next_mark = r["nextCursorMark"]
+            if next_mark != cursor_mark and (count < limit or limit <= 0):
+                cursor_mark = next_mark
+                pending = fetch(page(cursor_mark, count))
+
+            yield from _fill(docs, split_f)
+    finally:
+        if pending is not None:
+            pending.cancel()
+        if pool is not None:
+            pool.shutdown(wait=False)
+
+
+def _query(token: str, data: t.Dict[str, str], dbg: bool = False) -> t.Dict:
+    url = urls.make_url(urls.urls["search"]["search"])
+
+    if dbg:
+        print(url)
+        print(data)
+
+    r = http.get(token, url, data=data)
+
+    if r.status != 200:
+        raise e.AdsApiError(r.response["error"])
+
+    return r.response
+
+
+def _fill(docs: t.List[t.Dict], split_f: t.List[str]) -> t.List[t.Dict]:
+    """Set any field that ADS did not return to None"""
+    for doc in docs:
+        for f in split_f:
+            if f not in doc:
+                doc[f] = None
+    return docs
 
 
 def bigquery(token: str, bibcodes: t.List[str], limit: int = 10, q="*:*", fields=None):
@@ -114,3 +313,66 @@ def bigquery(token: str, bibcodes: t.List[str], limit: int = 10, q="*:*", fields
         raise e.AdsApiError(r.response["error"])
 
     return r.response["response"]
+
+
+def bigquery_search(
+    token: str,
+    bibcodes: t.List[str],
+    fields: str = None,
+    q: str = "*:*",
+    rows: int = None,
+    chunk_size: int = None,
+) -> t.Generator[t.Dict[t.Any, t.Any], None, None]:
+    """Fetch fields for an arbitrarily large list of bibcodes
+
+    The bibcodes are split into chunks that bigquery accepts, the chunks are
+    sent concurrently and each is paged until all of its records are returned.
+
+    Args:
+        token (str): ADSABS token
+        bibcodes (t.List[str]): List of bibcodes
+        fields (str, optional): Comma separated list of fields to return. Defaults to a short set of fields.
+        q (str, optional): Query to filter the bibcodes with. Defaults to "*:*".
+        rows (int, optional): Number of records per request (max 2000). Defaults to 2000.
+        chunk_size (int, optional): Number of bibcodes sent in each request (max 2000). Defaults to 2000.
+
+    Raises:
+        ValueError: If a field is not valid
+        e.AdsApiError: If a request fails
+
+    Yields:
+        dict: One dict per record, with keys given by fields
+    """
+    if fields is not None:
+        for f in fields.split(","):
+            if f and f not in _fields:
+                raise ValueError(f"Field {f} not valid in search")
+    else:
+        fields = _short_fl
+
+    if rows is None:
+        rows = _max_rows
+    if chunk_size is None:
+        chunk_size = _max_rows
+
+    split_f = fields.split(",")
+    url = urls.make_url(urls.urls["search"]["bigquery"])
+
+    def fetch(chunk):
+        docs: t.List[t.Dict] = []
+        while True:
+            terms = {"q": q, "fl": fields, "rows": rows, "start": len(docs)}
+
+            r = http.bigquery_bibcodes(token, url, bibcodes=chunk, params=terms)
+
+            if r.status != 200:
+                raise e.AdsApiError(r.response["error"])
+
+            page = r.response["response"]["docs"]
+            docs.extend(page)
+
+            if not len(page) or len(docs) >= int(r.response["response"]["numFound"]):
+                return _fill(docs, split_f)
+
+    for docs in utils.concurrent_map(fetch, utils.chunks(bibcodes, chunk_size)):
+        yield from docs
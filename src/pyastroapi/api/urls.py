@@ -4,6 +4,9 @@
 
 base_url = "https://api.adsabs.harvard.edu/v1"
 
+# ADS UI redirect to a paper's full text source, esource is e.g EPRINT_PDF
+link_gateway = "https://ui.adsabs.harvard.edu/link_gateway/{bibcode}/{esource}"
+
 urls = {
     "search": {
         "search": "/search/query",
@@ -1,8 +1,20 @@
 # SPDX-License-Identifier: BSD-3-Clause
 
+import re
 import typing as t
 
-__all__ = ["ensure_list", "ensure_str"]
+from concurrent.futures import ThreadPoolExecutor
+
+__all__ = [
+    "ensure_list",
+    "ensure_str",
+    "chunks",
+    "concurrent_map",
+    "normalize_identifier",
+]
+
+# Default number of requests sent at once when splitting up large requests
+max_workers = 4
 
 
 def ensure_list(s: t.Union[str, t.List[str]]) -> t.List[str]:
@@ -27,3 +39,58 @@ def ensure_str(s: t.Union[str, t.List[str]]) -> str:
         str: CSV string
     """
     return s if isinstance(s, str) else ",".join(s)
+
+
+def chunks(s: t.Sequence[t.Any], size: int) -> t.List[t.List[t.Any]]:
+    """Split a sequence into lists of at most size elements
+
+    Args:
+        s (t.Sequence[t.Any]): Sequence to split
+        size (int): Maximum length of each chunk
+
+    Returns:
+        t.List[t.List[t.Any]]: List of chunks, in order
+    """
+    return [list(s[i : i + size]) for i in range(0, len(s), size)]
+
+
+def concurrent_map(
+    func: t.Callable[[t.Any], t.Any],
+    items: t.Iterable[t.Any],
+    workers: t.Optional[int] = None,
+) -> t.List[t.Any]:
+    """Call func on each item using a pool of threads
+
+    Args:
+        func (t.Callable): Function to call
+        items (t.Iterable): Arguments to pass to func, one at a time
+        workers (int, optional): Number of threads. Defaults to max_workers.
+
+    Returns:
+        t.List[t.Any]: Results in the same order as items
+    """
+    items = list(items)
+    if workers is None:
+        workers = max_workers
+
+    if len(items) <= 1 or workers <= 1:
+        return [func(i) for i in items]
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(items))) as pool:
+        return list(pool.map(func, items))
+
+
+def normalize_identifier(identifier: str) -> str:
+    """Normalize a doi, arxiv id or bibcode so the forms used in references and by ADS match
+
+    Args:
+        identifier (str): Identifier, e.g "arXiv:2006.06678v2" or "doi:10.3847/1538-4357/ac2f44"
+
+    Returns:
+        str: Lower case identifier without any prefix or arxiv version
+    """
+    identifier = identifier.strip().lower()
+    for prefix in ["arxiv:", "doi:", "https://doi.org/"]:
+        if identifier.startswith(prefix):
+            identifier = identifier[len(prefix) :]
+    return re.sub(r"^(\d{4}\.\d{4,5})v\d+$", r"\1", identifier)
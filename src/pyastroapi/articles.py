@@ -8,26 +8,107 @@ import pyastroapi.api.metrics as _metrics
 import pyastroapi.api.visualization as _visualization
 import pyastroapi.api.resolver as _resolve
 import pyastroapi.api.http as _http
+import pyastroapi.api.urls as _urls
 import pyastroapi.api.exceptions as _e
 
+import collections.abc
+import itertools
+import sys
+import threading
 import typing as t
 
 import pyastroapi
 import pyastroapi.extras.bibtex as bib
+import pyastroapi.extras.pdfs as _pdfs
 
-__all__ = ["article", "journal"]
+__all__ = ["article", "compact_article", "journal", "LinkCache"]
 
 
 _t_bibcode = t.Union[str, t.List[str]]
 
 
-class article:
+def _check_fields(fields: t.Union[str, t.List[str]]) -> t.List[str]:
+    """Validate a field or list of fields against the known ADS fields"""
+    fields = utils.ensure_list(fields)
+    for f in fields:
+        if f not in _search._fields:
+            raise ValueError(f"Field {f} not valid in search")
+    return fields
+
+
+def _fl(fields: t.List[str]) -> t.Optional[str]:
+    """Build the fl string for a search that also loads the declared fields
+
+    Returns None when nothing extra is declared, so the search uses its default fields
+    """
+    if not len(fields):
+        return None
+    return ",".join(dict.fromkeys(_search._short_fl.split(",") + list(fields)))
+
+
+def _missing(value: t.Any) -> bool:
+    """Whether a value from a column counts as missing"""
+    if value is None:
+        return True
+    if isinstance(value, float) and value != value:
+        return True
+    if isinstance(value, str) and not len(value):
+        return True
+    return False
+
+
+def _to_numpy(columns: t.Dict[str, t.List]):
+    """Build a numpy masked structured array from a dict of columns, missing values are masked"""
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("to_columns requires numpy")
+
+    arrays = {}
+    for name, values in columns.items():
+        present = [v for v in values if v is not None]
+        if len(present) and all(
+            isinstance(v, int) and not isinstance(v, bool) for v in present
+        ):
+            arrays[name] = np.array(
+                [0 if v is None else v for v in values], dtype=np.int64
+            )
+        elif len(present) and all(
+            isinstance(v, (int, float)) and not isinstance(v, bool) for v in present
+        ):
+            arrays[name] = np.array(
+                [np.nan if v is None else v for v in values], dtype=np.float64
+            )
+        else:
+            # Strings are kept as objects, fixed width unicode would make every
+            # value as long as the longest (e.g abstracts).
+            # Fill element by element so numpy doesn't try to broadcast lists
+            arrays[name] = np.empty(len(values), dtype=object)
+            for i, v in enumerate(values):
+                arrays[name][i] = v
+
+    dtype = [(k, v.dtype) for k, v in arrays.items()]
+    table = np.empty(len(columns["bibcode"]), dtype=dtype)
+    mask = np.zeros(len(columns["bibcode"]), dtype=[(k, bool) for k in arrays])
+    for name, values in arrays.items():
+        table[name] = values
+        mask[name] = [v is None for v in columns[name]]
+
+    return np.ma.MaskedArray(table, mask=mask)
+
+
+class _paper:
+    """Shared implementation of article and compact_article"""
+
+    __slots__ = ()
+
     def __init__(
         self,
         bibcode: str = None,
         data: t.Dict = None,
         bibtex: str = None,
         search: str = None,
+        fields: t.List[str] = None,
     ):
         """Creates an article
 
@@ -38,6 +119,7 @@ class article:
             data (t.Dict, optional): Initialize the article from a dict containing at least a "bibcode" key . Defaults to None.
             bibtex (str, optional): Initialize given a bibtex string. Must contain only one document. Defaults to None.
             search (str, optional): Initialize after performing a query of ADS with the search string. We only return the first result from the search. Defaults to None.
+            fields (t.List[str], optional): ADS fields to load up front in a single request, later access to them will not need the network. Defaults to None.
         """
 
         self.bibcode = None
@@ -45,6 +127,9 @@ class article:
         self._query = None
         self._refs = None
         self._cites = None
+        self._fields = []
+        if fields is not None:
+            self._fields = _check_fields(fields)
 
         if bibcode is not None:
             self.from_bibcode(bibcode)
@@ -55,6 +140,9 @@ class article:
         elif search is not None:
             self.from_search(search)
 
+        if len(self._fields) and self.bibcode is not None:
+            self.load(self._fields)
+
     def from_bibcode(self, bibcode: str):
         """Set the article to point to the paper given by bibcode
 
@@ -81,7 +169,9 @@ class article:
             bibtex (str): A bibtex document as a string
         """
         bd = bib.parse_bibtex(bibtex)
-        self.from_data(list(pyastroapi.search(bd[0], limit=1))[0])
+        self.from_data(
+            list(pyastroapi.search(bd[0], limit=1, fields=_fl(self._fields)))[0]
+        )
 
     def from_search(self, search: str):
         """Perform a search of ADS and return only the first result
@@ -90,7 +180,36 @@ class article:
             search (str): An ADS search query
         """
         self._query = search
-        self.from_data(list(pyastroapi.search(search, limit=1))[0])
+        self.from_data(
+            list(pyastroapi.search(search, limit=1, fields=_fl(self._fields)))[0]
+        )
+
+    def load(self, fields: t.Union[str, t.List[str]]):
+        """Fetch any of fields that are not already loaded in a single request
+
+        Args:
+            fields (str or list[str]): One or more ADS fields
+
+        Returns:
+            self
+        """
+        fields = [f for f in _check_fields(fields) if f not in self._data]
+        if not len(fields):
+            return self
+
+        if "bibcode" not in self._data:
+            raise ValueError("Bibcode must be set first")
+
+        x = list(
+            pyastroapi.search(
+                query=f"identifier:{self.bibcode}",
+                limit=1,
+                fields=",".join(fields),
+            )
+        )[0]
+        self._data.update(x)
+
+        return self
 
     def add_to_lib(self, library: str):
         """Add article to the ADS library
@@ -118,6 +237,10 @@ class article:
                 ):  # Add field if we dont have it allready
                     fields = f"{attr}," + fields
 
+                for f in self._fields:  # Load the declared fields at the same time
+                    if f not in self._data and f not in fields.split(","):
+                        fields = f"{f}," + fields
+
                 x = list(
                     pyastroapi.search(
                         query=f"identifier:{self.bibcode}",
@@ -167,7 +290,7 @@ class article:
         return hash(self.bibcode)
 
     def __eq__(self, value):
-        if isinstance(value, article):
+        if isinstance(value, _paper):
             if value.bibcode == self.bibcode:
                 return True
         return False
@@ -292,9 +415,131 @@ class article:
         return self.__dict__.copy()
 
     def __setstate__(self, state):
+        # Articles pickled before declared fields existed
+        state.setdefault("_fields", [])
         self.__dict__.update(state)
 
 
+class article(_paper):
+    """A single paper, see _paper.__init__ for the arguments"""
+
+
+class _Schema:
+    """Field name to position map shared by every compact_article
+
+    Field names are interned and each name is only stored once however many papers use it.
+    """
+
+    def __init__(self) -> None:
+        self.names: t.List[str] = []
+        self.index: t.Dict[str, int] = {}
+
+    def position(self, name: str) -> int:
+        try:
+            return self.index[name]
+        except KeyError:
+            name = sys.intern(name)
+            self.index[name] = len(self.names)
+            self.names.append(name)
+            return self.index[name]
+
+
+_schema = _Schema()
+
+# Marks a field that has not been loaded
+_unset = object()
+
+
+class _Record(collections.abc.MutableMapping):
+    """Dict view over a compact_article's values list"""
+
+    __slots__ = ("_values",)
+
+    def __init__(self, values: t.List) -> None:
+        self._values = values
+
+    def __getitem__(self, key: str):
+        i = _schema.index.get(key)
+        if i is None or i >= len(self._values) or self._values[i] is _unset:
+            raise KeyError(key)
+        return self._values[i]
+
+    def __setitem__(self, key: str, value) -> None:
+        i = _schema.position(key)
+        if i >= len(self._values):
+            self._values.extend([_unset] * (i + 1 - len(self._values)))
+        self._values[i] = value
+
+    def __delitem__(self, key: str) -> None:
+        self[key]
+        self._values[_schema.index[key]] = _unset
+
+    def __iter__(self) -> t.Iterator[str]:
+        for name, value in zip(_schema.names, self._values):
+            if value is not _unset:
+                yield name
+
+    def __len__(self) -> int:
+        return sum(1 for v in self._values if v is not _unset)
+
+    def __contains__(self, key) -> bool:
+        i = _schema.index.get(key)
+        return i is not None and i < len(self._values) and self._values[i] is not _unset
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+class compact_article(_paper):
+    """Memory-lean version of article for very large journals
+
+    This has the same interface as article, but uses __slots__ and stores its fields as a
+    plain list of values indexed by a schema shared between all compact_articles, rather
+    than a dict per paper. _data is a dict-like view onto that list.
+
+    Use journal(..., compact=True) to build journals of these.
+    """
+
+    __slots__ = ("bibcode", "_values", "_query", "_refs", "_cites", "_fields")
+
+    @property
+    def _data(self) -> _Record:
+        return _Record(self._values)
+
+    @_data.setter
+    def _data(self, data: t.Dict) -> None:
+        self._values = []
+        record = _Record(self._values)
+        for key, value in data.items():
+            record[key] = value
+
+    def __getattr__(self, attr: str):
+        # Unset slots and dunder lookups are not ADS fields
+        if attr in compact_article.__slots__ or attr.startswith("__"):
+            raise AttributeError(attr)
+        return super().__getattr__(attr)
+
+    def __dir__(self):
+        return (
+            list(self.keys())
+            + list(self.__slots__)
+            + ["export", "metrics", "visual", "pdf"]
+        )
+
+    def as_dict(self):
+        return dict(self._data)
+
+    def __getstate__(self):
+        state = {k: getattr(self, k) for k in self.__slots__ if k != "_values"}
+        state["_data"] = dict(self._data)
+        return state
+
+    def __setstate__(self, state):
+        # Positions are only valid within one process so go back through the field names
+        for key, value in state.items():
+            setattr(self, key, value)
+
+
 class journal:
     def __init__(
         self,
@@ -302,6 +547,8 @@ class journal:
         data: t.List = None,
         bibtex: str = None,
         search: str = None,
+        fields: t.List[str] = None,
+        compact: bool = False,
     ):
         """Creates an journal
 
@@ -314,9 +561,15 @@ class journal:
             data (t.Dict, optional): Initialize the journal from a list of dicts. Each dict must have at least a "bibcode" key. Defaults to None.
             bibtex (str, optional): Initialize given a bibtex string. Must contain only one document. Defaults to None.
             search (str, optional): Initialize after performing a query of ADS with the search string. Defaults to None.
+            fields (t.List[str], optional): ADS fields to load for every paper up front in batched requests. Defaults to None.
+            compact (bool, optional): Store papers as compact_article's, which use much less memory for large journals. Defaults to False.
         """
 
-        self._data = {}
+        self._reset()
+        self._compact = compact
+        self._fields = []
+        if fields is not None:
+            self._fields = _check_fields(fields)
 
         if bibcodes is not None:
             self.from_bibcodes(bibcodes)
@@ -327,18 +580,26 @@ class journal:
         elif search is not None:
             self.from_search(search)
 
-    def from_bibcodes(self, bibcodes: t.List):
+        if len(self._fields):
+            self.hydrate(self._fields)
+
+    def from_bibcodes(self, bibcodes: t.List, fields: t.List[str] = None):
         """Initialize from a list of bibcodes
 
         Args:
             bibcodes (t.List):
+            fields (t.List[str], optional): Load these fields for every paper with bulk bigquery requests,
+                                            otherwise each paper is loaded lazily when first used. Defaults to None.
 
         Returns:
             self
         """
-        self._data = {}
+        self._reset()
         for bib in bibcodes:
             self.add_bibcode(bib)
+
+        if fields is not None:
+            self.hydrate(fields)
         return self
 
     def from_data(self, data: t.List):
@@ -349,7 +610,7 @@ class journal:
         Args:
             data (t.List): List of dict-like objects
         """
-        self._data = {}
+        self._reset()
         self.add_data(data)
 
     def from_bibtex(self, bibtex: str):
@@ -358,7 +619,7 @@ class journal:
         Args:
             bibtex (str): A bibtex string of one or more bibtex's
         """
-        self._data = {}
+        self._reset()
         self.add_bibtex(bibtex)
 
     def from_search(self, search: str):
@@ -367,8 +628,8 @@ class journal:
         Args:
             search (str): ADS query string
         """
-        self._data = {}
-        self.add_data(pyastroapi.search(search))
+        self._reset()
+        self.add_data(pyastroapi.search(search, fields=_fl(self._fields)))
 
     def from_articles(self, data: t.List):
         """Initialize from list of articles
@@ -376,7 +637,7 @@ class journal:
         Args:
             data (t.List): List of articles
         """
-        self._data = {}
+        self._reset()
         self.add_articles(data)
 
     def add_bibcode(self, bibcode: t.List):
@@ -385,7 +646,7 @@ class journal:
         Args:
             bibcode (t.List): List of bibcodes
         """
-        self._data[bibcode] = article(bibcode=bibcode)
+        self._set(bibcode, self._article(bibcode=bibcode))
 
     def add_data(self, data: t.List):
         """Add papers from list of dict-like objects
@@ -394,8 +655,8 @@ class journal:
             data (t.List): List of dict-like objects. Each element must have at least "bibcode" as a key
         """
         for dd in data:
-            d = article(data=dd)
-            self._data[d.bibcode] = d
+            d = self._article(data=dd)
+            self._set(d.bibcode, d)
 
     def add_articles(self, data: t.List):
         """Add papers from a list of articles
@@ -404,8 +665,8 @@ class journal:
             data (t.List): List of articles
         """
         for dd in data:
-            if isinstance(dd, article):
-                self._data[dd.bibcode] = dd
+            if isinstance(dd, _paper):
+                self._set(dd.bibcode, dd)
 
     def add_bibtex(self, bibtex: str):
         """Add papers from bibtex
@@ -413,9 +674,83 @@ class journal:
         Args:
             bibtex (str): One of more bibtex's
         """
-        bd = bib.parse_bibtex(bibtex)
-        for b in bd:
-            self.add_data(pyastroapi.search(b, limit=1))
+        self._add_queries(bib.iter_queries(bib.iter_bibtex(bibtex)))
+
+    def add_bibtex_file(self, filename: str, batch: int = 500):
+        """Add papers from a bibtex file
+
+        The file is read and resolved batch entries at a time, so memory use stays flat
+        for very large bibliographies.
+
+        Args:
+            filename (str): Bibtex file
+            batch (int, optional): Number of entries resolved at once. Defaults to 500.
+        """
+        self._add_queries(bib.iter_queries(bib.iter_file(filename)), batch)
+
+    def _add_queries(
+        self, queries: t.Iterable[str], batch: int = 500, chunk_size: int = 50
+    ):
+        """Find the papers for queries made from bibtex and add them, keeping their order
+
+        identifier: queries are combined into one search per chunk_size, the rest
+        (and any identifiers that could not be matched up) are searched for in parallel.
+
+        Args:
+            queries (iterable[str]): ADS queries, one per paper
+            batch (int, optional): Number of queries resolved at once. Defaults to 500.
+            chunk_size (int, optional): Number of identifiers per combined search. Defaults to 50.
+        """
+        fl = _fl(self._fields) or _search._short_fl
+        fl = ",".join(dict.fromkeys(fl.split(",") + ["identifier"]))
+
+        def lookup(ids):
+            q = " OR ".join(f'"{i}"' for i in ids)
+            found = {}
+            for doc in pyastroapi.search(
+                f"identifier:({q})", fields=fl, rows=_search._max_rows
+            ):
+                for i in [doc["bibcode"]] + list(doc.get("identifier") or []):
+                    found[utils.normalize_identifier(i)] = doc
+            return [found.get(utils.normalize_identifier(i)) for i in ids]
+
+        def search(query):
+            return next(iter(pyastroapi.search(query, limit=1, fields=fl)), None)
+
+        queries = iter(queries)
+        while True:
+            # Only hold batch queries at a time
+            batch_queries = list(itertools.islice(queries, batch))
+            if not len(batch_queries):
+                break
+            results: t.List[t.Any] = [None] * len(batch_queries)
+
+            ids = [
+                (n, q[len("identifier:") :])
+                for n, q in enumerate(batch_queries)
+                if q.startswith("identifier:")
+            ]
+            id_chunks = utils.chunks(ids, chunk_size)
+            for chunk, docs in zip(
+                id_chunks,
+                utils.concurrent_map(lookup, [[i for _, i in c] for c in id_chunks]),
+            ):
+                for (n, _), doc in zip(chunk, docs):
+                    results[n] = doc
+
+            # Anything not found so far gets its own search
+            todo = [n for n, doc in enumerate(results) if doc is None]
+            for n, doc in zip(
+                todo, utils.concurrent_map(search, [batch_queries[n] for n in todo])
+            ):
+                results[n] = doc
+
+            self.add_data(doc for doc in results if doc is not None)
+
+    def _article(self, **kwargs) -> _paper:
+        if self._compact:
+            return compact_article(**kwargs)
+        return article(**kwargs)
 
     def bibcodes(self):
         """Returns the list of bibcodes in the journal
@@ -425,9 +760,52 @@ class journal:
         """
         return list(self.keys())
 
+    def _reset(self):
+        self._data = {}
+        # Bibcodes in order and their positions, rebuilt lazily if set to None
+        self._order = []
+        self._position = {}
+
+    def _set(self, bibcode: str, paper: _paper):
+        if bibcode not in self._data:
+            if self._order is not None:
+                self._order.append(bibcode)
+            if self._position is not None:
+                self._position[bibcode] = len(self._data)
+        self._data[bibcode] = paper
+
+    def _positions(self) -> t.List[str]:
+        if self._order is None:
+            self._order = list(self._data)
+        return self._order
+
+    def index(self, bibcode: str) -> int:
+        """Position of a bibcode in the journal
+
+        Args:
+            bibcode (str): Bibcode
+
+        Raises:
+            ValueError: If the bibcode is not in the journal
+
+        Returns:
+            int:
+        """
+        if self._position is None:
+            self._position = {b: i for i, b in enumerate(self._positions())}
+        try:
+            return self._position[bibcode]
+        except KeyError:
+            raise ValueError(f"{bibcode} is not in journal")
+
     def __getitem__(self, bibcode):
         if isinstance(bibcode, int):
-            return self._data[list(self.keys())[bibcode]]
+            return self._data[self._positions()[bibcode]]
+        elif isinstance(bibcode, slice):
+            j = journal(compact=self._compact)
+            j._fields = self._fields
+            j.add_articles(self._data[b] for b in self._positions()[bibcode])
+            return j
         else:
             return self._data[bibcode]
 
@@ -460,11 +838,53 @@ class journal:
         return list(self.keys()) + list(self.__dict__.keys()) + list(_search._fields)
 
     def __getattr__(self, attr):
+        if attr in _search._fields:
+            self.hydrate(attr)
+
         res = {}
         for bibcode in self.bibcodes():
             res[bibcode] = getattr(self._data[bibcode], attr)
         return res
 
+    def hydrate(self, fields: t.Union[str, t.List[str]], chunk_size: int = 2000):
+        """Fetch fields for every paper that does not have them yet
+
+        Papers are looked up in bulk with ADS's bigquery, so this costs one request
+        per chunk_size papers rather than one per paper.
+
+        Args:
+            fields (str or list[str]): One or more ADS fields to load
+            chunk_size (int, optional): Number of bibcodes per request (max 2000). Defaults to 2000.
+
+        Returns:
+            self
+        """
+        fields = _check_fields(fields)
+
+        missing = []
+        bare = False
+        for paper in self.values():
+            if any(f not in paper._data for f in fields):
+                missing.append(paper.bibcode)
+                # Match article.__getattr__ and load the basic data for stubs
+                bare = bare or len(paper._data) == 1
+
+        if not len(missing):
+            return self
+
+        fl = ["bibcode"] + fields
+        if bare:
+            fl.extend(_search._short_fl.split(","))
+        fl = list(dict.fromkeys(fl))
+
+        for doc in _search.bigquery_search(
+            token.get_token(), missing, fields=",".join(fl), chunk_size=chunk_size
+        ):
+            if doc["bibcode"] in self._data:
+                self._data[doc["bibcode"]]._data.update(doc)
+
+        return self
+
     @property
     def export(self):
         return Export(self.bibcodes())
@@ -477,6 +897,76 @@ class journal:
     def visual(self):
         return Visualization(self.bibcodes())
 
+    def links(
+        self, direct: bool = False, cache: t.Optional["LinkCache"] = None
+    ) -> t.Dict[str, t.Dict[str, str]]:
+        """Get the full text links for every paper
+
+        Which sources each paper has comes from the esources field, loaded for the whole
+        journal in bulk, and the links go through the ADS link gateway (which redirects to
+        the source). The resolver is only asked, in parallel, for papers that need direct
+        links or whose esources could not be loaded. Results are kept in the cache.
+
+        Args:
+            direct (bool, optional): Get the sources' own urls from the resolver rather than link gateway urls. Defaults to False.
+            cache (LinkCache, optional): Cache to use. Defaults to the cache shared by all journals.
+
+        Returns:
+            dict: Map of bibcode to a dict of link type (e.g "ESOURCE|EPRINT_PDF") to url,
+                  empty if the paper has none or its resolver request failed (it is asked again next time)
+        """
+        if cache is None:
+            cache = _link_cache
+
+        todo = [b for b in self.bibcodes() if cache.get(b, direct) is None]
+        if len(todo):
+            sub = journal()
+            sub.add_articles(self._data[b] for b in todo)
+            sub.hydrate(["esources"])
+
+            resolve = []
+            for paper in sub:
+                esources = paper._data.get("esources")
+                if "esources" not in paper._data:
+                    resolve.append(paper.bibcode)
+                elif direct and esources:
+                    resolve.append(paper.bibcode)
+                elif direct:
+                    # Nothing to resolve
+                    cache.set(paper.bibcode, {}, True)
+                else:
+                    cache.set(
+                        paper.bibcode, _gateway_links(paper.bibcode, esources), False
+                    )
+
+            def lookup(bibcode):
+                try:
+                    return _resolver_links(bibcode)
+                except _e.AdsApiError:
+                    return None
+
+            for bibcode, links in zip(resolve, utils.concurrent_map(lookup, resolve)):
+                # Failed requests (e.g a 429 or 5xx) are not cached so are retried next time
+                if links is not None:
+                    cache.set(bibcode, links, True)
+
+        # Papers whose lookup failed have no links this time
+        return {b: cache.get(b) or {} for b in self.bibcodes()}
+
+    def download_pdfs(self, folder: str = ".", **kwargs):
+        """Download the pdfs for every paper in parallel
+
+        See pyastroapi.extras.pdfs.download for the options
+
+        Args:
+            folder (str, optional): Folder to save to, files are named bibcode.pdf. Defaults to ".".
+
+        Returns:
+            tuple(dict, dict): Map of bibcode to filename for the papers downloaded,
+                               and map of bibcode to the reason for the papers that failed
+        """
+        return _pdfs.download(self, folder, **kwargs)
+
     def pop(self, bibcodes):
         """Remove one or more bibcodes
 
@@ -487,48 +977,184 @@ class journal:
         for bib in bibcodes:
             if bib in self:
                 self._data.pop(bib)
+                self._order = None
+                self._position = None
+
+    def to_columns(
+        self, fields: t.Union[str, t.List[str]] = None, format: str = "numpy"
+    ):
+        """Export the journal as a columnar table
+
+        One column per field and one row per paper, bibcode is always the first column.
+
+        With numpy the result is a masked structured array, values a paper is missing are
+        masked. Integer columns are int64, other numeric columns float64 (with NaN under
+        the mask) and anything else (strings, lists of authors) is an object column.
+
+        Args:
+            fields (str or list[str], optional): Fields to export, any not yet loaded are fetched in bulk.
+                                                 Defaults to every field already loaded.
+            format (str, optional): Either "numpy" for a numpy structured array, or "arrow" for a pyarrow Table.
+                                    Defaults to "numpy".
+
+        Returns:
+            numpy.ma.MaskedArray or pyarrow.Table
+        """
+        if fields is None:
+            fields = list(
+                dict.fromkeys(k for paper in self.values() for k in paper._data)
+            )
+        else:
+            fields = _check_fields(fields)
+            self.hydrate(fields)
+
+        fields = ["bibcode"] + [f for f in fields if f != "bibcode"]
+        columns = {f: [paper._data.get(f) for paper in self.values()] for f in fields}
+
+        if format == "numpy":
+            return _to_numpy(columns)
+        elif format == "arrow":
+            try:
+                import pyarrow as pa
+            except ImportError:
+                raise ImportError("format='arrow' requires pyarrow")
+            return pa.table(columns)
+        else:
+            raise ValueError(f"Unknown format {format}, must be numpy or arrow")
+
+    def from_columns(self, table):
+        """Initialize from a columnar table
+
+        Accepts the output of to_columns (a numpy structured array or a pyarrow Table)
+        or a dict mapping field names to sequences of values. There must be a bibcode column.
+
+        Missing values (None, NaN or "") are left out of each paper so they are loaded lazily.
+
+        Args:
+            table (numpy.ndarray, pyarrow.Table or dict): Columns to load
+
+        Returns:
+            self
+        """
+        if hasattr(table, "to_pydict"):
+            columns = table.to_pydict()
+        elif hasattr(table, "dtype") and table.dtype.names is not None:
+            columns = {name: table[name].tolist() for name in table.dtype.names}
+        else:
+            columns = {k: list(v) for k, v in table.items()}
+
+        if "bibcode" not in columns:
+            raise ValueError("Table must have a bibcode column")
+
+        names = list(columns)
+        data = []
+        for row in zip(*columns.values()):
+            data.append(
+                {k: v for k, v in zip(names, row) if not _missing(v) or k == "bibcode"}
+            )
+
+        self.from_data(data)
+        return self
 
     def __str__(self):
         return f"Journal with {len(self.keys())} articles"
 
     def __getstate__(self):
         state = self.__dict__.copy()
+        # Positional indexes are rebuilt on demand
+        state["_order"] = None
+        state["_position"] = None
 
         return state
 
     def __setstate__(self, state):
+        # Journals pickled before declared fields, compact or the positional index existed
+        state.setdefault("_fields", [])
+        state.setdefault("_compact", False)
+        state.setdefault("_order", None)
+        state.setdefault("_position", None)
         self.__dict__.update(state)
 
-    def citations(self):
+    def citations(self, batch: bool = False, chunk_size: int = 100):
         """Get the citations to all papers in journal.
 
         This does remove duplicates
 
+        Args:
+            batch (bool, optional): Expand the whole journal with a few combined citations() queries
+                                    sent in parallel, rather than one search per paper. Defaults to False.
+            chunk_size (int, optional): Number of papers in each combined query. Defaults to 100.
+
         Returns:
-            _type_: _description_
+            dict: Map of bibcode to article
         """
+        if batch:
+            return self._expand("citations", chunk_size)
+
         data = {}
         for paper in self:
             cites = paper.citations()
             for cite in cites:
-                data[cite.bibcode] = cite
+                if cite.bibcode not in data:
+                    data[cite.bibcode] = cite
 
         return data
 
-    def references(self):
+    def references(self, batch: bool = False, chunk_size: int = 100):
         """Get the references to all papers in the journal
 
         This does remove duplicates
 
+        Args:
+            batch (bool, optional): Expand the whole journal with a few combined references() queries
+                                    sent in parallel, rather than one search per paper. Defaults to False.
+            chunk_size (int, optional): Number of papers in each combined query. Defaults to 100.
+
         Returns:
-            _type_: _description_
+            dict: Map of bibcode to article
         """
+        if batch:
+            return self._expand("references", chunk_size)
+
         data = {}
         # Loads data
         for paper in self:
             refs = paper.references()
             for ref in refs:
-                data[ref.bibcode] = ref
+                if ref.bibcode not in data:
+                    data[ref.bibcode] = ref
+
+        return data
+
+    def _expand(self, operator: str, chunk_size: int) -> t.Dict[str, article]:
+        """Run operator(bibcode:(a OR b ...)) over chunks of the journal in parallel
+
+        Args:
+            operator (str): Either citations or references
+            chunk_size (int): Number of bibcodes per query
+
+        Returns:
+            dict: Map of bibcode to article, without duplicates
+        """
+
+        def fetch(bibcodes):
+            ids = " OR ".join(f'"{b}"' for b in bibcodes)
+            return list(
+                pyastroapi.search(
+                    f"{operator}(bibcode:({ids}))",
+                    fields=_fl(self._fields),
+                    rows=_search._max_rows,
+                    cursor=True,
+                )
+            )
+
+        data = {}
+        for docs in utils.concurrent_map(
+            fetch, utils.chunks(self.bibcodes(), chunk_size)
+        ):
+            for doc in docs:
+                if doc["bibcode"] not in data:
+                    data[doc["bibcode"]] = self._article(data=doc)
 
         return data
 
@@ -618,32 +1244,121 @@ class Visualization:
         return dir(_visualization)
 
 
+class LinkCache:
+    """Thread safe memo of each paper's links, shared between journals (and articles)
+
+    Each entry maps a bibcode to a dict of link type (e.g "ESOURCE|EPRINT_PDF") to url,
+    along with whether the urls are the direct ones from the resolver or ADS link gateway
+    redirects built from the esources field.
+    """
+
+    def __init__(self) -> None:
+        self._data: t.Dict[str, t.Tuple[bool, t.Dict[str, str]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, bibcode: str, direct: bool = False) -> t.Optional[t.Dict[str, str]]:
+        """Get the links for a bibcode
+
+        Args:
+            bibcode (str): Bibcode
+            direct (bool, optional): Only return links that came from the resolver. Defaults to False.
+
+        Returns:
+            dict: Map of link type to url, or None if not cached
+        """
+        with self._lock:
+            entry = self._data.get(bibcode)
+        if entry is None or (direct and not entry[0]):
+            return None
+        return entry[1]
+
+    def set(self, bibcode: str, links: t.Dict[str, str], direct: bool) -> None:
+        """Store the links for a bibcode
+
+        Args:
+            bibcode (str): Bibcode
+            links (dict): Map of link type to url
+            direct (bool): Whether the links came from the resolver
+        """
+        with self._lock:
+            self._data[bibcode] = (direct, links)
+
+    def clear(self) -> None:
+        """Remove every entry"""
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, bibcode: str) -> bool:
+        with self._lock:
+            return bibcode in self._data
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+
+# Default cache used by every journal and article
+_link_cache = LinkCache()
+
+
+def _cached_links(
+    bibcode: str, cache: LinkCache, direct: bool = False
+) -> t.Dict[str, str]:
+    """Get a paper's links from the cache, asking the resolver if needed
+
+    Only successful lookups are cached, so a failed request is tried again next time.
+    """
+    links = cache.get(bibcode, direct)
+    if links is None:
+        links = _resolver_links(bibcode)
+        cache.set(bibcode, links, True)
+    return links
+
+
+def _gateway_links(bibcode: str, esources: t.Optional[t.List[str]]) -> t.Dict[str, str]:
+    """Links to each esource through the ADS link gateway, no requests needed"""
+    return {
+        f"ESOURCE|{e}": _urls.link_gateway.format(bibcode=bibcode, esource=e)
+        for e in esources or []
+    }
+
+
+def _resolver_links(bibcode: str) -> t.Dict[str, str]:
+    """Ask the resolver for a paper's links
+
+    Raises:
+        _e.AdsApiError: If the request fails, the caller must not cache anything
+    """
+    links = _resolve.esource(token.get_token(), bibcode)
+
+    if "links" not in links:
+        return {}
+
+    return {i["link_type"]: i["url"] for i in links["links"].get("records", [])}
+
+
 class PDF:
     """Class handles getting the url for pdf downloads
 
     Not every bibcode has all possible download options
     """
 
-    def __init__(self, bibcode: str):
+    def __init__(self, bibcode: str, cache: t.Optional[LinkCache] = None):
         if isinstance(bibcode, list):
             raise TypeError("Can only handle one pdf at a time")
 
         self.links = None
 
         self.bibcode = bibcode
+        self._cache = _link_cache if cache is None else cache
 
     def _get(self):
-        try:
-            links = _resolve.esource(token.get_token(), self.bibcode)
-        except _e.NoRecordsFound:
+        # Downloads need the sources' own urls not the link gateway.
+        # If the request fails links stays None so the next download tries again
+        self.links = _cached_links(self.bibcode, self._cache, direct=True)
+        if not len(self.links):
             raise ValueError("No pdf links available")
 
-        if "links" not in links:
-            raise ValueError("No pdf links available")
-
-        for i in links["links"]["records"]:
-            self.links[i["link_type"]] = i["url"]
-
     def filename(self) -> str:
         """Gets the filename for a bibcode
 
@@ -718,24 +1433,43 @@ class PDF:
 
 
 class Urls:
-    """Class handles accessing the URL's to a paper"""
+    """Class handles accessing the URL's to a paper
 
-    def __init__(self, bibcode: str):
+    Nothing is fetched until a link that needs the resolver is asked for, the
+    result is then kept in the link cache (shared by all articles and journals
+    by default) so later lookups for the same paper are free.
+
+    Args:
+        bibcode (str): Bibcode
+        cache (LinkCache, optional): Cache to use. Defaults to the shared cache.
+    """
+
+    def __init__(self, bibcode: str, cache: t.Optional[LinkCache] = None):
         if isinstance(bibcode, list):
             raise TypeError("Can only handle one pdf at a time")
 
         self.bibcode = bibcode
-        links = _resolve.esource(token.get_token(), bibcode)
-        self.links = {}
-        if "links" not in links:
-            raise ValueError("No pdf links available")
+        self._cache = _link_cache if cache is None else cache
+        self._links: t.Optional[t.Dict[str, str]] = None
 
-        for i in links["links"]["records"]:
-            self.links[i["link_type"]] = i["url"]
+    @property
+    def links(self) -> t.Dict[str, str]:
+        """Map of link type (e.g "ESOURCE|EPRINT_HTML") to url
 
-    def _get(self, source: str, name: str):
+        Raises:
+            _e.AdsApiError: If the resolver request fails, nothing is kept so the next access tries again
+
+        Returns:
+            dict:
+        """
+        if self._links is None:
+            self._links = _cached_links(self.bibcode, self._cache)
+        return self._links
+
+    def _get(self, source: str, name: str) -> str:
         if source not in self.links:
             raise ValueError(f"No {name} html available for {self.bibcode}")
+        return self.links[source]
 
     @property
     def ads(self) -> str:
@@ -762,8 +1496,17 @@ class Urls:
         Returns:
             str: Journal URL
         """
-        tries = ["ESOURCE", "ESOURCE|HTML", "PUB_HTML", "AUTHOR_HTML"]
+        tries = [
+            "ESOURCE|PUB_HTML",
+            "ESOURCE|AUTHOR_HTML",
+            "ESOURCE",
+            "ESOURCE|HTML",
+            "PUB_HTML",
+            "AUTHOR_HTML",
+        ]
 
         for link in tries:
             if link in self.links:
                 return self._get(link, "Journal")
+
+        raise ValueError(f"No Journal html available for {self.bibcode}")
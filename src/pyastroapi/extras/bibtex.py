@@ -1,20 +1,164 @@
+import re
+import typing as t
+
 import bibtexparser
 from bibtexparser.bparser import BibTexParser
 
-__all__ = ["parse_file", "parse_bibtex"]
+__all__ = ["parse_file", "parse_bibtex", "iter_file", "iter_bibtex", "iter_queries"]
+
+# Entries handed to bibtexparser at once, making a parser is slow so we don't want one per entry
+_batch = 200
+
+# Start of an entry, e.g @article{ or @book(
+_entry_start = re.compile(r"@\s*[A-Za-z]+\s*[{(]")
 
-_parser = BibTexParser(common_strings=True)
+
+def _parser():
+    # A parser accumulates everything it has parsed, so use a fresh one each time
+    return BibTexParser(common_strings=True)
 
 
 def parse_file(filename):
-    with open(filename) as f:
-        bd = bibtexparser.load(f, _parser)
-    return _extract_from(bd)
+    return list(iter_queries(iter_file(filename)))
 
 
 def parse_bibtex(bibtex):
-    bd = bibtexparser.loads(bibtex, _parser)
-    return _extract_from(bd)
+    return list(iter_queries(iter_bibtex(bibtex)))
+
+
+def iter_file(filename: str, batch: int = _batch) -> t.Iterator[t.Dict[str, str]]:
+    """Iterate over the entries in a bibtex file without loading it all at once
+
+    Args:
+        filename (str): Bibtex file
+        batch (int, optional): Number of entries parsed at a time. Defaults to 200.
+
+    Yields:
+        dict: One bibtexparser entry per bibtex entry
+    """
+    with open(filename) as f:
+        yield from _parse(_split(f), batch)
+
+
+def iter_bibtex(bibtex: str, batch: int = _batch) -> t.Iterator[t.Dict[str, str]]:
+    """Iterate over the entries in a bibtex string
+
+    Args:
+        bibtex (str): One or more bibtex entries
+        batch (int, optional): Number of entries parsed at a time. Defaults to 200.
+
+    Yields:
+        dict: One bibtexparser entry per bibtex entry
+    """
+    yield from _parse(_split(bibtex.splitlines(keepends=True)), batch)
+
+
+def iter_queries(entries: t.Iterable[t.Dict[str, str]]) -> t.Iterator[str]:
+    """Turn bibtex entries into adsabs queries
+
+    Args:
+        entries (iterable[dict]): bibtexparser entries, e.g from iter_file
+
+    Yields:
+        str: One query per entry that has enough information to find it
+    """
+    for entry in entries:
+        q = _query(entry)
+        if q is not None:
+            yield q
+
+
+def _split(lines: t.Iterable[str]) -> t.Iterator[str]:
+    """Split bibtex text into one string per @entry
+
+    Text between entries (comments) is dropped.
+    """
+    buf: t.List[str] = []
+    depth = 0
+    # Entries are either @type{...} or @type(...), only the outer pair is counted
+    opener = ""
+    inside = False
+
+    for line in lines:
+        while len(line):
+            if not inside:
+                start = _entry_start.search(line)
+                if start is None:
+                    break
+                line = line[start.start() :]
+                inside = True
+                opener = ""
+                depth = 0
+                buf = []
+
+            end = None
+            for i, c in enumerate(line):
+                if not opener:
+                    if c in "{(":
+                        opener = c
+                        closer = "}" if c == "{" else ")"
+                        depth = 1
+                elif c == opener:
+                    depth += 1
+                elif c == closer:
+                    depth -= 1
+                    if depth == 0:
+                        end = i + 1
+                        break
+
+            if end is None:
+                buf.append(line)
+                break
+
+            buf.append(line[:end])
+            yield "".join(buf)
+            inside = False
+            line = line[end:]
+
+
+def _parse(entries: t.Iterable[str], batch: int) -> t.Iterator[t.Dict[str, str]]:
+    # @string macros are kept and given to every batch so later entries can use them
+    strings: t.List[str] = []
+    pending: t.List[str] = []
+
+    for text in entries:
+        kind = text[1:].lstrip().lower()
+        if kind.startswith("string"):
+            strings.append(text)
+        elif kind.startswith("comment") or kind.startswith("preamble"):
+            continue
+        else:
+            pending.append(text)
+
+        if len(pending) >= batch:
+            yield from bibtexparser.loads(
+                "\n".join(strings + pending), _parser()
+            ).entries
+            pending = []
+
+    if len(pending):
+        yield from bibtexparser.loads("\n".join(strings + pending), _parser()).entries
+
+
+def _query(entry: t.Dict[str, str]) -> t.Optional[str]:
+    """Get an adsabs query for a bibtex entry
+
+    Uses the first of: the key (if it looks like a bibcode), the doi, the eprint,
+    or the title and year.
+    """
+    if len(entry.get("ID", "")) == 19:
+        return f'identifier:{entry["ID"]}'
+    elif "doi" in entry:
+        return f'identifier:{entry["doi"]}'
+    elif "eprint" in entry:
+        return f'identifier:{entry["eprint"]}'
+    elif "title" in entry:  # Fallback
+        title = entry["title"].replace("{", "").replace("}", "")
+        if "year" in entry:
+            return f'title:"{title}" year:{entry["year"]}'
+        return f'title:"{title}"'
+
+    return None
 
 
 def _extract_from(bibtex_db):
@@ -22,20 +166,4 @@ def _extract_from(bibtex_db):
 
     Returns a list of adsabs queries
     """
-
-    result = []
-
-    for i in bibtex_db.entries:
-        if "ID" in i:
-            if len(i["ID"]) == 19:
-                result.append(f'identifier:{i["ID"]}')
-        elif "doi" in i:
-            result.append(f'identifier:{i["doi"]}')
-        elif "eprint" in i:
-            result.append(f'identifier:{i["eprint"]}')
-        else:  # Fallback
-            t = i["title"]
-            t.replace("}{", "")
-            result.append(f'title:"{t}" year:{i["year"]}')
-
-    return result
+    return list(iter_queries(bibtex_db.entries))
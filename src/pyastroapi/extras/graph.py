@@ -0,0 +1,309 @@
+# SPDX-License-Identifier: BSD-3-Clause
+
+import array
+import collections
+import typing as t
+
+import pyastroapi
+
+__all__ = ["CitationGraph"]
+
+
+class CitationGraph:
+    """In-memory citation graph
+
+    Papers are stored as integer nodes, with the edges held in compressed sparse
+    row (CSR) arrays in both directions. An edge A -> B means A references B
+    (and so B is cited by A).
+
+    The graph is filled from the reference and citation fields of papers that
+    have already been fetched, so walks, co-citation and bibliographic coupling
+    all run locally without further ADS calls.
+
+    Example:
+
+        j = pyastroapi.journal(bibcodes=bibcodes)
+        g = CitationGraph.from_journal(j)
+        g.walk("2020ApJ...902L..36F", depth=2)
+
+    """
+
+    def __init__(self) -> None:
+        self._index: t.Dict[str, int] = {}
+        self._nodes: t.List[str] = []
+
+        # Edge list, appended to as papers are added
+        self._src = array.array("q")
+        self._dst = array.array("q")
+
+        # CSR arrays, built lazily from the edge list
+        self._out: t.Optional[t.Tuple[array.array, array.array]] = None
+        self._in: t.Optional[t.Tuple[array.array, array.array]] = None
+
+    @classmethod
+    def from_journal(cls, journal: "pyastroapi.journal") -> "CitationGraph":
+        """Build a graph from a journal
+
+        Any reference and citation fields not yet loaded are fetched in bulk first.
+
+        Args:
+            journal (pyastroapi.journal): Papers to add
+
+        Returns:
+            CitationGraph:
+        """
+        g = cls()
+        g.add_journal(journal)
+        return g
+
+    @classmethod
+    def from_search(cls, query: str, limit: int = -1) -> "CitationGraph":
+        """Build a graph from the results of a search
+
+        Args:
+            query (str): ADS search query
+            limit (int, optional): Maximum number of papers. Defaults to -1 (all).
+
+        Returns:
+            CitationGraph:
+        """
+        g = cls()
+        g.add_docs(
+            pyastroapi.search(query, limit=limit, fields="bibcode,reference,citation")
+        )
+        return g
+
+    def add_journal(self, journal: "pyastroapi.journal") -> None:
+        """Add every paper in a journal
+
+        Args:
+            journal (pyastroapi.journal): Papers to add
+        """
+        journal.hydrate(["reference", "citation"])
+        self.add_docs(paper._data for paper in journal)
+
+    def add_docs(self, docs: t.Iterable[t.Dict[str, t.Any]]) -> None:
+        """Add papers from search results
+
+        Args:
+            docs (iterable[dict]): ADS documents with bibcode and optionally reference and citation fields
+        """
+        for doc in docs:
+            self.add(doc["bibcode"], doc.get("reference"), doc.get("citation"))
+
+    def add(
+        self,
+        bibcode: str,
+        references: t.Optional[t.Iterable[str]] = None,
+        citations: t.Optional[t.Iterable[str]] = None,
+    ) -> None:
+        """Add a paper and its edges
+
+        Args:
+            bibcode (str): Paper bibcode
+            references (list[str], optional): Bibcodes this paper references. Defaults to None.
+            citations (list[str], optional): Bibcodes that cite this paper. Defaults to None.
+        """
+        node = self._node(bibcode)
+
+        for ref in references or []:
+            self._src.append(node)
+            self._dst.append(self._node(ref))
+
+        for cite in citations or []:
+            self._src.append(self._node(cite))
+            self._dst.append(node)
+
+        self._out = None
+        self._in = None
+
+    def _node(self, bibcode: str) -> int:
+        try:
+            return self._index[bibcode]
+        except KeyError:
+            self._index[bibcode] = len(self._nodes)
+            self._nodes.append(bibcode)
+            return self._index[bibcode]
+
+    def _build(self) -> None:
+        if self._out is None:
+            self._out = _csr(len(self._nodes), self._src, self._dst)
+            self._in = _csr(len(self._nodes), self._dst, self._src)
+
+    def _neighbours(self, node: int, direction: str) -> array.array:
+        self._build()
+        if direction == "references":
+            indptr, indices = self._out  # type: ignore
+        elif direction == "citations":
+            indptr, indices = self._in  # type: ignore
+        else:
+            raise ValueError(
+                f"direction must be references or citations not {direction}"
+            )
+        return indices[indptr[node] : indptr[node + 1]]
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, bibcode: str) -> bool:
+        return bibcode in self._index
+
+    def __iter__(self) -> t.Iterator[str]:
+        yield from self._nodes
+
+    @property
+    def num_edges(self) -> int:
+        """Number of distinct edges"""
+        self._build()
+        return len(self._out[1])  # type: ignore
+
+    def references(self, bibcode: str) -> t.List[str]:
+        """Papers referenced by bibcode
+
+        Args:
+            bibcode (str): Paper bibcode
+
+        Returns:
+            list[str]: Bibcodes
+        """
+        return [
+            self._nodes[i] for i in self._neighbours(self._index[bibcode], "references")
+        ]
+
+    def citations(self, bibcode: str) -> t.List[str]:
+        """Papers that cite bibcode
+
+        Args:
+            bibcode (str): Paper bibcode
+
+        Returns:
+            list[str]: Bibcodes
+        """
+        return [
+            self._nodes[i] for i in self._neighbours(self._index[bibcode], "citations")
+        ]
+
+    def walk(
+        self, bibcode: str, depth: int = 1, direction: str = "citations"
+    ) -> t.Dict[str, int]:
+        """Breadth first walk out from a paper
+
+        Args:
+            bibcode (str): Starting paper
+            depth (int, optional): Maximum number of hops. Defaults to 1.
+            direction (str, optional): Follow "citations" or "references". Defaults to "citations".
+
+        Returns:
+            dict: Map of each bibcode reached to its number of hops, not including the start
+        """
+        start = self._index[bibcode]
+        seen = {start: 0}
+        frontier = [start]
+        for hop in range(1, depth + 1):
+            next_frontier = []
+            for node in frontier:
+                for i in self._neighbours(node, direction):
+                    if i not in seen:
+                        seen[i] = hop
+                        next_frontier.append(i)
+            frontier = next_frontier
+            if not frontier:
+                break
+
+        del seen[start]
+        return {self._nodes[i]: hop for i, hop in seen.items()}
+
+    def cocited(self, bibcode: str) -> t.Dict[str, int]:
+        """Co-citation counts
+
+        Two papers are co-cited when a third paper references both of them.
+
+        Args:
+            bibcode (str): Paper bibcode
+
+        Returns:
+            dict: Map of bibcode to the number of papers citing both, most frequent first
+        """
+        return self._shared(bibcode, "citations", "references")
+
+    def coupled(self, bibcode: str) -> t.Dict[str, int]:
+        """Bibliographic coupling counts
+
+        Two papers are coupled when they both reference a third paper.
+
+        Args:
+            bibcode (str): Paper bibcode
+
+        Returns:
+            dict: Map of bibcode to the number of shared references, most frequent first
+        """
+        return self._shared(bibcode, "references", "citations")
+
+    def _shared(self, bibcode: str, first: str, second: str) -> t.Dict[str, int]:
+        node = self._index[bibcode]
+        counts: t.Counter[int] = collections.Counter()
+        for i in self._neighbours(node, first):
+            counts.update(self._neighbours(i, second))
+        counts.pop(node, None)
+
+        return {self._nodes[i]: n for i, n in counts.most_common()}
+
+    def cocitation(self, a: str, b: str) -> int:
+        """Number of papers that cite both a and b
+
+        Args:
+            a (str): Bibcode
+            b (str): Bibcode
+
+        Returns:
+            int:
+        """
+        return self._overlap(a, b, "citations")
+
+    def coupling(self, a: str, b: str) -> int:
+        """Number of references shared by a and b
+
+        Args:
+            a (str): Bibcode
+            b (str): Bibcode
+
+        Returns:
+            int:
+        """
+        return self._overlap(a, b, "references")
+
+    def _overlap(self, a: str, b: str, direction: str) -> int:
+        na = self._neighbours(self._index[a], direction)
+        nb = self._neighbours(self._index[b], direction)
+        return len(set(na).intersection(nb))
+
+
+def _csr(
+    n: int, rows: array.array, cols: array.array
+) -> t.Tuple[array.array, array.array]:
+    """Build sorted, de-duplicated CSR arrays from an edge list"""
+    # Counting sort the edges by row
+    start = array.array("q", bytes(8 * (n + 1)))
+    for r in rows:
+        start[r + 1] += 1
+    for i in range(n):
+        start[i + 1] += start[i]
+
+    fill = array.array("q", start)
+    by_row = array.array("q", bytes(8 * len(cols)))
+    for r, c in zip(rows, cols):
+        by_row[fill[r]] = c
+        fill[r] += 1
+
+    # Then sort each row, dropping repeated edges as they are copied across
+    indptr = array.array("q", [0])
+    indices = array.array("q")
+    for i in range(n):
+        last = -1
+        for c in sorted(by_row[start[i] : start[i + 1]]):
+            if c != last:
+                indices.append(c)
+                last = c
+        indptr.append(len(indices))
+
+    return indptr, indices
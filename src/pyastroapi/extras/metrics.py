@@ -0,0 +1,208 @@
+# SPDX-License-Identifier: BSD-3-Clause
+
+import datetime
+import typing as t
+
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError(
+        "pyastroapi.extras.metrics requires numpy, install it with: pip install pyastroapi[numpy]"
+    )
+
+import pyastroapi
+import pyastroapi.api.search as _search
+import pyastroapi.api.token as token
+
+__all__ = ["LocalMetrics"]
+
+_fields = ["year", "citation_count", "author_count", "property", "citation"]
+
+
+class LocalMetrics:
+    """Bibliometric indicators computed locally from a journal's records
+
+    The needed fields are fetched (in bulk) once when this is made, after that
+    indicators and histograms for the whole set, or any subset of it, are computed
+    with numpy without contacting ADS.
+
+    The results follow the layout of pyastroapi.api.metrics.indicators and
+    pyastroapi.api.metrics.histograms. Papers ADS has no year for (e.g deleted or
+    alternate bibcodes) are left out and listed in skipped.
+
+    Example:
+
+        m = LocalMetrics(pyastroapi.journal(bibcodes=all_bibcodes))
+        for author, bibcodes in subsets.items():
+            m.indicators(bibcodes)
+
+    Args:
+        journal (pyastroapi.journal): Papers to compute metrics for
+        tori (bool, optional): Also compute the tori and riq indicators. These need the number of
+                               references of every citing paper, which costs one bulk query
+                               per 2000 citing papers. Defaults to False.
+        year (int, optional): Current year, used for the m and riq indicators. Defaults to this year.
+    """
+
+    def __init__(
+        self,
+        journal: "pyastroapi.journal",
+        tori: bool = False,
+        year: t.Optional[int] = None,
+    ) -> None:
+        journal.hydrate(_fields)
+        papers = [p for p in journal if p._data.get("year")]
+        self.skipped = [p.bibcode for p in journal if not p._data.get("year")]
+
+        if year is None:
+            year = datetime.date.today().year
+        self.year = year
+
+        self.bibcodes = [p.bibcode for p in papers]
+        self._index = {b: i for i, b in enumerate(self.bibcodes)}
+
+        self.pub_year = np.array([int(p._data["year"]) for p in papers], dtype=int)
+        self.citation_count = np.array(
+            [p._data.get("citation_count") or 0 for p in papers], dtype=int
+        )
+        self.author_count = np.array(
+            [max(p._data.get("author_count") or 1, 1) for p in papers], dtype=float
+        )
+        self.refereed = np.array(
+            ["REFEREED" in (p._data.get("property") or []) for p in papers],
+            dtype=bool,
+        )
+
+        # Flattened citation lists, citing paper year and which paper was cited
+        cites = [p._data.get("citation") or [] for p in papers]
+        self._cite_owner = np.repeat(
+            np.arange(len(papers)), [len(c) for c in cites]
+        ).astype(int)
+        citing = [c for cs in cites for c in cs]
+        self._cite_year = np.array([int(c[:4]) for c in citing], dtype=int)
+
+        self.tori: t.Optional[np.ndarray] = None
+        if tori:
+            self.tori = self._tori(citing)
+
+    def _tori(self, citing: t.List[str]) -> np.ndarray:
+        # Each citation is worth 1/(references in the citing paper), split between the authors
+        num_refs = {}
+        for doc in _search.bigquery_search(
+            token.get_token(), list(set(citing)), fields="bibcode,reference"
+        ):
+            num_refs[doc["bibcode"]] = len(doc.get("reference") or [])
+
+        weight = np.array(
+            [1.0 / num_refs[c] if num_refs.get(c) else 0.0 for c in citing]
+        )
+        per_paper = np.bincount(
+            self._cite_owner, weights=weight, minlength=len(self.bibcodes)
+        )
+        return per_paper / self.author_count
+
+    def _mask(self, bibcodes: t.Optional[t.Iterable[str]]) -> np.ndarray:
+        if bibcodes is None:
+            return np.ones(len(self.bibcodes), dtype=bool)
+
+        # Skipped papers are ignored
+        mask = np.zeros(len(self.bibcodes), dtype=bool)
+        mask[[self._index[b] for b in bibcodes if b in self._index]] = True
+        return mask
+
+    def indicators(self, bibcodes: t.Optional[t.Iterable[str]] = None) -> t.Dict:
+        """h, g, m, i10, i100 (and optionally tori and riq) indicators
+
+        Args:
+            bibcodes (list[str], optional): Subset of papers to use. Defaults to all papers.
+
+        Returns:
+            dict: Indicators for all papers and for just the refereed papers
+        """
+        mask = self._mask(bibcodes)
+        return {
+            "indicators": self._indicators(mask),
+            "indicators refereed": self._indicators(mask & self.refereed),
+        }
+
+    def _indicators(self, mask: np.ndarray) -> t.Dict[str, t.Any]:
+        cc = np.sort(self.citation_count[mask])[::-1]
+        rank = np.arange(1, len(cc) + 1)
+
+        h = int(np.count_nonzero(cc >= rank))
+        g = np.nonzero(np.cumsum(cc) >= rank**2)[0]
+        g = int(g[-1] + 1) if len(g) else 0
+
+        if mask.any():
+            span = self.year - int(self.pub_year[mask].min()) + 1
+        else:
+            span = 1
+
+        result: t.Dict[str, t.Any] = {
+            "h": h,
+            "g": g,
+            "i10": int(np.count_nonzero(cc >= 10)),
+            "i100": int(np.count_nonzero(cc >= 100)),
+            "m": h / span,
+        }
+
+        if self.tori is not None:
+            tori = float(self.tori[mask].sum())
+            result["tori"] = tori
+            result["riq"] = int(1000.0 * np.sqrt(tori) / span)
+
+        return result
+
+    def histograms(self, bibcodes: t.Optional[t.Iterable[str]] = None) -> t.Dict:
+        """Per year publication and citation histograms
+
+        Citations are binned by the year of the citing paper.
+
+        Args:
+            bibcodes (list[str], optional): Subset of papers to use. Defaults to all papers.
+
+        Returns:
+            dict: Histograms for all papers and for just the refereed papers
+        """
+        mask = self._mask(bibcodes)
+        if not mask.any():
+            return {"publications": {}, "citations": {}}
+
+        first = int(self.pub_year[mask].min())
+        last = max(self.year, int(self.pub_year[mask].max()))
+
+        def hist(years, weights=None):
+            # Drop anything outside the range (e.g. early bibcodes for forthcoming papers)
+            keep = (years >= first) & (years <= last)
+            if weights is not None:
+                weights = weights[keep]
+            counts = np.bincount(
+                years[keep] - first, weights=weights, minlength=last - first + 1
+            )
+            return {str(first + i): v.item() for i, v in enumerate(counts)}
+
+        ref = mask & self.refereed
+        cite = mask[self._cite_owner]
+        cite_ref = ref[self._cite_owner]
+        norm = 1.0 / self.author_count[self._cite_owner]
+
+        return {
+            "publications": {
+                "all publications": hist(self.pub_year[mask]),
+                "refereed publications": hist(self.pub_year[ref]),
+                "all publications normalized": hist(
+                    self.pub_year[mask], 1.0 / self.author_count[mask]
+                ),
+                "refereed publications normalized": hist(
+                    self.pub_year[ref], 1.0 / self.author_count[ref]
+                ),
+            },
+            "citations": {
+                "all citations": hist(self._cite_year[cite]),
+                "citations to refereed": hist(self._cite_year[cite_ref]),
+                "all citations normalized": hist(self._cite_year[cite], norm[cite]),
+                "citations to refereed normalized": hist(
+                    self._cite_year[cite_ref], norm[cite_ref]
+                ),
+            },
+        }
@@ -0,0 +1,134 @@
+# SPDX-License-Identifier: BSD-3-Clause
+
+import os
+import threading
+import typing as t
+import urllib.parse as parse
+
+import requests
+
+import pyastroapi.api.http as http
+import pyastroapi.api.urls as urls
+import pyastroapi.api.utils as utils
+
+__all__ = ["download"]
+
+# Names used by articles.PDF mapped to the ADS esource types
+_sources = {"arxiv": "EPRINT_PDF", "ads": "ADS_PDF", "publisher": "PUB_PDF"}
+
+# Publishers often redirect a few times (e.g doi.org -> publisher -> pdf server)
+_max_redirects = 10
+_redirects = {301, 302, 303, 307, 308}
+
+
+class _HostLimits:
+    """Semaphore per host so we never have more than per_host downloads from one site"""
+
+    def __init__(self, per_host: int) -> None:
+        self.per_host = per_host
+        self._lock = threading.Lock()
+        self._hosts: t.Dict[str, threading.Semaphore] = {}
+
+    def __call__(self, url: str) -> threading.Semaphore:
+        host = parse.urlparse(url).netloc
+        with self._lock:
+            if host not in self._hosts:
+                self._hosts[host] = threading.Semaphore(self.per_host)
+            return self._hosts[host]
+
+
+def _resolve(url: str) -> str:
+    """Follow the redirects from the ADS link gateway to the final url, without downloading anything
+
+    Raises:
+        requests.TooManyRedirects: If there are more than _max_redirects redirects
+    """
+    for _ in range(_max_redirects):
+        r = http.get_client().request("GET", url, allow_redirects=False, stream=True)
+        with r:
+            location = r.headers.get("Location")
+            if r.status_code not in _redirects or location is None:
+                return url
+        url = parse.urljoin(url, location)
+
+    raise requests.TooManyRedirects(f"More than {_max_redirects} redirects")
+
+
+def download(
+    journal: t.Any,
+    folder: str = ".",
+    sources: t.Sequence[str] = ("arxiv", "ads", "publisher"),
+    workers: int = 8,
+    per_host: int = 2,
+    resume: bool = True,
+) -> t.Tuple[t.Dict[str, str], t.Dict[str, str]]:
+    """Download the pdfs for every paper in a journal
+
+    The esources for every paper are looked up in bulk first, then papers are
+    downloaded in parallel with at most per_host connections to any one site.
+    For each paper the sources are tried in order until one works. Papers already
+    downloaded are skipped and partial downloads are resumed.
+
+    Args:
+        journal (pyastroapi.journal): Papers to download
+        folder (str, optional): Folder to save to, files are named bibcode.pdf. Defaults to ".".
+        sources (list[str], optional): Sources to try in order, any of "arxiv", "ads" and "publisher".
+                                       Defaults to ("arxiv", "ads", "publisher").
+        workers (int, optional): Number of papers downloaded at once. Defaults to 8.
+        per_host (int, optional): Maximum number of downloads from each host. Defaults to 2.
+        resume (bool, optional): Continue partial downloads. Defaults to True.
+
+    Raises:
+        ValueError: If a source is not known
+
+    Returns:
+        tuple(dict, dict): Map of bibcode to filename for the papers downloaded,
+                           and map of bibcode to the reason for the papers that failed
+    """
+    for s in sources:
+        if s not in _sources:
+            raise ValueError(f"Unknown source {s}, must be one of {list(_sources)}")
+
+    journal.hydrate(["esources"])
+    os.makedirs(folder, exist_ok=True)
+    limits = _HostLimits(per_host)
+
+    def fetch(paper):
+        filename = os.path.join(folder, f"{paper.bibcode}.pdf")
+        if os.path.exists(filename):
+            return filename, None
+
+        available = paper._data.get("esources") or []
+        errors = []
+        for s in sources:
+            if _sources[s] not in available:
+                continue
+
+            url = urls.link_gateway.format(bibcode=paper.bibcode, esource=_sources[s])
+            try:
+                with limits(url):
+                    url = _resolve(url)
+                # Keep partial downloads separate per source so they resume correctly
+                with limits(url):
+                    http.download_file(url, f"{filename}.{s}", resume=resume)
+                os.replace(f"{filename}.{s}", filename)
+                return filename, None
+            except (http.FileDownloadFailed, requests.RequestException, OSError) as err:
+                errors.append(f"{s}: {err}")
+
+        if not len(errors):
+            errors.append("No pdf available")
+        return None, "; ".join(errors)
+
+    papers = list(journal)
+    downloaded = {}
+    failed = {}
+    for paper, (filename, error) in zip(
+        papers, utils.concurrent_map(fetch, papers, workers)
+    ):
+        if filename is not None:
+            downloaded[paper.bibcode] = filename
+        else:
+            failed[paper.bibcode] = error
+
+    return downloaded, failed
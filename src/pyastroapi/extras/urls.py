@@ -1,12 +1,22 @@
 # # SPDX-License-Identifier: BSD-3-Clause
 
+import collections
+import threading
 import urllib.parse as parse
 import typing as t
 
-__all__ = ["parse_url"]
+import pyastroapi
+import pyastroapi.api.utils as utils
+
+__all__ = ["parse_url", "resolve"]
 
 _headers = {"user-agent": "Mozilla /5.0 (Windows NT 10.0; Win64; x64)"}
 
+# Least recently used memo of normalized identifier to bibcode, shared between calls to resolve
+_memo: "collections.OrderedDict[str, str]" = collections.OrderedDict()
+_memo_size = 100_000
+_memo_lock = threading.Lock()
+
 
 def parse_url(url: str) -> t.Dict[str, str]:
     """Attempt to determine what article is referenced by url
@@ -43,6 +53,70 @@ def parse_url(url: str) -> t.Dict[str, str]:
     return r
 
 
+def resolve(
+    urls: t.Iterable[str], chunk_size: int = 50
+) -> t.Dict[str, t.Optional[str]]:
+    """Find the bibcodes for many urls at once
+
+    Every url is parsed with parse_url, the identifiers are de-duplicated and any not
+    already memoized are looked up with combined identifier:(...) searches of chunk_size
+    identifiers, sent in parallel. ADS urls already contain the bibcode so are not looked up.
+
+    Args:
+        urls (iterable[str]): URLs to articles
+        chunk_size (int, optional): Number of identifiers per search. Defaults to 50.
+
+    Returns:
+        t.Dict[str, t.Optional[str]]: Map of url to bibcode, None if the url could not be parsed or found
+    """
+    bibcodes: t.Dict[str, t.Optional[str]] = {}
+    identifiers: t.Dict[str, str] = {}
+    for url in dict.fromkeys(urls):
+        try:
+            r = parse_url(url)
+        except (ValueError, NotImplementedError):
+            r = None
+
+        if r is None:
+            bibcodes[url] = None
+        elif parse.urlparse(url).netloc == "ui.adsabs.harvard.edu":
+            bibcodes[url] = r["identifier"]
+        else:
+            bibcodes[url] = None
+            identifiers[url] = utils.normalize_identifier(r["identifier"])
+
+    found = {}
+    with _memo_lock:
+        for i in set(identifiers.values()):
+            if i in _memo:
+                _memo.move_to_end(i)
+                found[i] = _memo[i]
+
+    todo = sorted(set(identifiers.values()) - set(found))
+
+    def lookup(ids):
+        q = " OR ".join(f'"{i}"' for i in ids)
+        res = {}
+        for doc in pyastroapi.search(
+            f"identifier:({q})", fields="bibcode,identifier", rows=2000
+        ):
+            for i in [doc["bibcode"]] + list(doc.get("identifier") or []):
+                res[utils.normalize_identifier(i)] = doc["bibcode"]
+        return {i: res[i] for i in ids if i in res}
+
+    for res in utils.concurrent_map(lookup, utils.chunks(todo, chunk_size)):
+        found.update(res)
+        with _memo_lock:
+            _memo.update(res)
+            while len(_memo) > _memo_size:
+                _memo.popitem(last=False)
+
+    for url, i in identifiers.items():
+        bibcodes[url] = found.get(i)
+
+    return bibcodes
+
+
 def _parse_ads(purl):
     for i in purl.path.split("/"):
         if len(i) == 19:
@@ -52,8 +126,9 @@ def _parse_ads(purl):
 def _parse_arxiv(purl):
     for i in purl.path.split("/"):
         try:
-            x = float(i.split("v")[0])
-            return {"identifier": str(x)}
+            x = i.split("v")[0]
+            float(x)
+            return {"identifier": x}
         except ValueError:
             pass
 
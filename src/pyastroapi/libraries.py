@@ -49,36 +49,132 @@ class libraries:
         pass
 
     def pop(self, name):
-        self.update()
+        if name not in self._data.keys():
+            self.update()
         if name not in self._data.keys():
             raise KeyError("Library does not exit")
 
         lid = self._data[name].lid
         lib.delete(token.get_token(), lid)
-        self.update()
+        self._data.pop(name)
+
+    def update(self, sync=False, fields=None, rows=lib._max_rows, concurrent=True):
+        """Refresh the list of libraries
+
+        Existing library objects (and the papers they hold) are kept, only new libraries
+        are created and deleted ones dropped.
 
-    def update(self):
+        Args:
+            sync (bool, optional): Also sync the contents of every library modified since its last sync. Defaults to False.
+            fields (list[str], optional): Fields to load in bulk for papers added by the sync. Defaults to None.
+            rows (int, optional): Bibcodes per page when syncing, see pyastroapi.api.libraries.get. Defaults to 2000.
+            concurrent (bool, optional): Fetch each library's pages in parallel when syncing. Defaults to True.
+        """
         all_libs = lib.list_all(token.get_token())
 
-        self._data = {}
+        existing = {l.lid: l for l in self._data.values()}
 
+        self._data = {}
         for l in all_libs["libraries"]:
-            self._data[l["name"]] = library(l["id"])
+            if l["id"] in existing:
+                self._data[l["name"]] = existing[l["id"]]
+                self._data[l["name"]].metadata = l
+            else:
+                self._data[l["name"]] = library(l["id"], metadata=l)
+
+        if sync:
+            stale = [l for l in self._data.values() if l.modified]
+            utils.concurrent_map(
+                lambda l: l.sync(
+                    fields=fields, refresh=False, rows=rows, concurrent=concurrent
+                ),
+                stale,
+            )
 
 
 class library:
     """An instance of a single ADS library"""
 
-    def __init__(self, lid):
+    def __init__(self, lid, metadata=None):
         self.lid = lid
         self._data = articles.journal()
-
-    def update_all(self):
-        bibcodes = list(lib.get(token.get_token(), self.lid))
-        self._data = articles.journal(bibcodes=bibcodes)
-
-    def update_iter(self):
-        iter = lib.get(token.get_token(), self.lid)
+        # Metadata from the library listing, and the modification time it had at the last sync
+        self.metadata = metadata or {}
+        self._synced = None
+
+    @property
+    def modified(self):
+        """Whether the library has changed on ADS since the last sync, going by the stored metadata"""
+        return (
+            self._synced is None
+            or self.metadata.get("date_last_modified") != self._synced
+        )
+
+    def sync(self, fields=None, refresh=True, rows=lib._max_rows, concurrent=True):
+        """Bring the library up to date with ADS, changing only what differs
+
+        If the library's modification time is unchanged since the last sync nothing else is
+        fetched. Otherwise the current list of bibcodes is downloaded and diffed against the
+        papers held, removed papers are dropped and only new papers are added (and have fields
+        loaded), papers already held keep any data they have loaded.
+
+        Args:
+            fields (list[str], optional): Fields to load in bulk for newly added papers. Defaults to None.
+            refresh (bool, optional): Refresh the metadata first, set False if it is already up to date. Defaults to True.
+            rows (int, optional): Bibcodes per page, see pyastroapi.api.libraries.get. Defaults to 2000.
+            concurrent (bool, optional): Fetch the pages in parallel. Defaults to True.
+
+        Returns:
+            tuple(list[str], list[str]): Bibcodes added and removed
+        """
+        if refresh:
+            self._refresh()
+
+        if not self.modified:
+            return [], []
+
+        modified = self.metadata.get("date_last_modified")
+
+        bibcodes = list(
+            lib.get(token.get_token(), self.lid, rows=rows, concurrent=concurrent)
+        )
+        current = set(bibcodes)
+
+        removed = [b for b in self._data.keys() if b not in current]
+        added = [b for b in dict.fromkeys(bibcodes) if b not in self._data]
+
+        self._data.pop(removed)
+        self._data.add_articles(articles.journal(bibcodes=added, fields=fields))
+
+        self._synced = modified
+        return added, removed
+
+    def update_all(self, fields=None, rows=lib._max_rows, concurrent=True):
+        """Reload every paper in the library
+
+        Args:
+            fields (list[str], optional): Fields to load for every paper in bulk requests. Defaults to None.
+            rows (int, optional): Bibcodes per page, see pyastroapi.api.libraries.get. Defaults to 2000.
+            concurrent (bool, optional): Fetch the pages in parallel. Defaults to True.
+        """
+        self._refresh()
+        modified = self.metadata.get("date_last_modified")
+
+        bibcodes = list(
+            lib.get(token.get_token(), self.lid, rows=rows, concurrent=concurrent)
+        )
+        self._data = articles.journal(bibcodes=bibcodes, fields=fields)
+        self._synced = modified
+
+    def _refresh(self):
+        # Fetch this library's current metadata from the library listing
+        for l in lib.list_all(token.get_token())["libraries"]:
+            if l["id"] == self.lid:
+                self.metadata = l
+                break
+
+    def update_iter(self, rows=lib._max_rows):
+        iter = lib.get(token.get_token(), self.lid, rows=rows)
         for bibcode in iter:
             self._data.add_bibcode(bibcode)
 
@@ -104,7 +200,7 @@ class library:
         return hash(self.lid)
 
     def __str__(self):
-        return self._data["name"]
+        return self.metadata.get("name", self.lid)
 
     def __eq__(self, value):
         if isinstance(value, library):
@@ -117,18 +213,57 @@ class library:
 
     def add_bibcode(self, bibcodes):
         bibcodes = utils.ensure_list(bibcodes)
-        lib.add(token.get_token(), self.lib, bibcodes)
+        lib.add(token.get_token(), self.lid, bibcodes)
 
-        self._data.add_bibcode(bibcodes)
+        for bibcode in bibcodes:
+            self._data.add_bibcode(bibcode)
 
     def add_from_bibtex(self, bibtex):
-        bibcodes = self._data.add_bibtex(bibtex)
-        lib.add(token.get_token(), self.lib, bibcodes)
+        before = set(self._data.keys())
+        self._data.add_bibtex(bibtex)
+        bibcodes = [b for b in self._data.keys() if b not in before]
+        lib.add(token.get_token(), self.lid, bibcodes)
 
     def pop(self, bibcodes):
         bibcodes = utils.ensure_list(bibcodes)
-        lib.remove(token.get_token(), self.lib, bibcodes)
+        lib.remove(token.get_token(), self.lid, bibcodes)
         self._data.pop(bibcodes)
 
+    def add_bulk(self, bibcodes, retries=0):
+        """Add many bibcodes in parallel chunks, without stopping on failures
+
+        Args:
+            bibcodes (list[str]): Bibcodes to add
+            retries (int, optional): Number of times to resend bibcodes that failed. Defaults to 0.
+
+        Returns:
+            dict: Map of bibcode to status, see pyastroapi.api.libraries.bulk
+        """
+        report = lib.bulk(token.get_token(), self.lid, bibcodes, "add", retries=retries)
+
+        for bibcode, status in report.items():
+            if status == "ok" and bibcode not in self._data:
+                self._data.add_bibcode(bibcode)
+
+        return report
+
+    def pop_bulk(self, bibcodes, retries=0):
+        """Remove many bibcodes in parallel chunks, without stopping on failures
+
+        Args:
+            bibcodes (list[str]): Bibcodes to remove
+            retries (int, optional): Number of times to resend bibcodes that failed. Defaults to 0.
+
+        Returns:
+            dict: Map of bibcode to status, see pyastroapi.api.libraries.bulk
+        """
+        report = lib.bulk(
+            token.get_token(), self.lid, bibcodes, "remove", retries=retries
+        )
+
+        self._data.pop([b for b, status in report.items() if status == "ok"])
+
+        return report
+
     def edit(self, name="", description="", public=False):
         raise NotImplementedError
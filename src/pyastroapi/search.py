@@ -18,7 +18,15 @@ __all__ = [
 ]
 
 
-def search(query: str, limit: int = -1, fields: t.List[str] = None, dbg: bool = False):
+def search(
+    query: str,
+    limit: int = -1,
+    fields: t.List[str] = None,
+    dbg: bool = False,
+    rows: int = None,
+    cursor: bool = False,
+    prefetch: int = 0,
+):
     """Performs an ADS search
 
     Args:
@@ -26,12 +34,22 @@ def search(query: str, limit: int = -1, fields: t.List[str] = None, dbg: bool =
         limit (int, optional): Number of rows to limit to (-1 is no limit). Defaults to -1.
         fields (t.List[str], optional): ADS fields to return, if None returns a default set of fields.
         dbg (bool, optional): Debugging flag. Defaults to False.
+        rows (int, optional): Number of records fetched per request (max 2000). Defaults to None.
+        cursor (bool, optional): Use cursor based pagination, best for large result sets. Defaults to False.
+        prefetch (int, optional): Number of pages to fetch in the background ahead of the current one. Defaults to 0.
 
     Returns:
         generator: Returns a generator where each element is a dict for each ADS record, with keys given by the fields
     """
     return _search.search(
-        _token.get_token(), query=query, limit=limit, fields=fields, dbg=dbg
+        _token.get_token(),
+        query=query,
+        limit=limit,
+        fields=fields,
+        dbg=dbg,
+        rows=rows,
+        cursor=cursor,
+        prefetch=prefetch,
     )
 
 
@@ -16,11 +16,16 @@ import pyastroapi.api.notifications as notif
 
 import pyastroapi.api.urls as urls
 import pyastroapi.api.http as http
+import pyastroapi.api.cache as cache
 
 import pyastroapi.api.token as t
 import pyastroapi.api.exceptions as e
 
+import asyncio
+import collections
 import pytest
+import requests
+import time
 import tempfile
 import os
 import random
@@ -97,6 +102,81 @@ class TestAPISearch:
         )
 
 
+class TestAPISearchPaging:
+    @pytest.fixture
+    def fake_search(self, monkeypatch):
+        docs = [{"id": str(i), "bibcode": f"bib{i}"} for i in range(7)]
+        calls = []
+
+        def get(token, url, data=None, json=True):
+            calls.append(data)
+            rows = int(data["rows"])
+            if "cursorMark" in data:
+                start = 0 if data["cursorMark"] == "*" else int(data["cursorMark"])
+            else:
+                start = int(data["start"])
+            page = docs[start : start + rows]
+            response = {
+                "response": {"numFound": len(docs), "docs": [dict(d) for d in page]},
+                "nextCursorMark": (
+                    str(start + len(page)) if page else data["cursorMark"]
+                ),
+            }
+            return http.HttpResponse(response, 200, http.ADSLimits())
+
+        monkeypatch.setattr(http, "get", get)
+        return calls
+
+    def test_cursor(self, fake_search):
+        res = list(search.search(token, "*:*", fields="bibcode", rows=3, cursor=True))
+
+        assert [i["bibcode"] for i in res] == [f"bib{i}" for i in range(7)]
+        assert all(c["sort"] == "id asc" for c in fake_search)
+        assert fake_search[0]["cursorMark"] == "*"
+
+    def test_cursor_limit(self, fake_search):
+        res = list(search.search(token, "*:*", limit=5, rows=2, cursor=True))
+
+        assert len(res) == 5
+        assert fake_search[-1]["rows"] == "1"
+
+    def test_start(self, fake_search):
+        res = list(search.search(token, "*:*", fields="bibcode", rows=2))
+
+        # Every record exactly once, and the same as with prefetching
+        assert [i["bibcode"] for i in res] == [f"bib{i}" for i in range(7)]
+        assert [int(c["start"]) for c in fake_search] == [0, 2, 4, 6]
+        assert res == list(
+            search.search(token, "*:*", fields="bibcode", rows=2, prefetch=2)
+        )
+
+    def test_start_limit(self, fake_search):
+        res = list(search.search(token, "*:*", limit=5, rows=2))
+
+        assert [i["bibcode"] for i in res] == [f"bib{i}" for i in range(5)]
+        assert fake_search[-1]["rows"] == "1"
+
+    def test_rows(self):
+        with pytest.raises(ValueError):
+            list(search.search(token, "*:*", rows=2001))
+
+    def test_prefetch(self, fake_search):
+        res = list(search.search(token, "*:*", fields="bibcode", rows=2, prefetch=2))
+
+        assert [i["bibcode"] for i in res] == [f"bib{i}" for i in range(7)]
+        assert sorted(int(c["start"]) for c in fake_search) == [0, 2, 4, 6]
+
+    def test_prefetch_limit(self, fake_search):
+        res = list(search.search(token, "*:*", limit=5, rows=2, prefetch=3))
+
+        assert [i["bibcode"] for i in res] == [f"bib{i}" for i in range(5)]
+
+    def test_prefetch_cursor(self, fake_search):
+        res = list(search.search(token, "*:*", rows=3, cursor=True, prefetch=1))
+
+        assert [i["bibcode"] for i in res] == [f"bib{i}" for i in range(7)]
+
+
 @pytest.mark.vcr()
 class TestAPIExport:
     def test_ads_1(self):
@@ -353,6 +433,127 @@ class TestAPILib:
         assert len(r2["libraries"]) == len(r["libraries"])  # Removed library
 
 
+class TestAPILibPaging:
+    @pytest.fixture
+    def fake_lib(self, monkeypatch):
+        docs = [f"bib{i}" for i in range(7)]
+        calls = []
+
+        def get(token, url, data=None, json=True):
+            query = dict(i.split("=") for i in url.split("?")[1].split("&"))
+            calls.append(query)
+            start = int(query["start"])
+            rows = int(query.get("rows", 3))
+            response = {
+                "metadata": {"num_documents": len(docs)},
+                "documents": docs[start : start + rows],
+            }
+            return http.HttpResponse(response, 200, http.ADSLimits())
+
+        monkeypatch.setattr(http, "get", get)
+        return docs, calls
+
+    def test_paging(self, fake_lib):
+        docs, calls = fake_lib
+
+        assert list(lib.get(None, "lid")) == docs
+        assert [c["start"] for c in calls] == ["0", "3", "6"]
+
+    def test_rows(self, fake_lib):
+        docs, calls = fake_lib
+
+        assert list(lib.get(None, "lid", rows=5)) == docs
+        assert calls == [{"start": "0", "rows": "5"}, {"start": "5", "rows": "5"}]
+
+        with pytest.raises(ValueError):
+            list(lib.get(None, "lid", rows=5000))
+
+    def test_concurrent(self, fake_lib):
+        docs, calls = fake_lib
+
+        assert list(lib.get(None, "lid", rows=2, concurrent=True)) == docs
+        assert sorted(int(c["start"]) for c in calls) == [0, 2, 4, 6]
+
+    def test_concurrent_short_page(self, monkeypatch):
+        docs = [f"bib{i}" for i in range(7)]
+
+        def get(token, url, data=None, json=True):
+            query = dict(i.split("=") for i in url.split("?")[1].split("&"))
+            start = int(query["start"])
+            # A page in the middle comes back short
+            rows = 1 if start == 2 else int(query["rows"])
+            response = {
+                "metadata": {"num_documents": len(docs)},
+                "documents": docs[start : start + rows],
+            }
+            return http.HttpResponse(response, 200, http.ADSLimits())
+
+        monkeypatch.setattr(http, "get", get)
+
+        assert list(lib.get(None, "lid", rows=2, concurrent=True)) == docs
+
+
+class TestAPILibBulk:
+    @pytest.fixture
+    def fake_lib(self, monkeypatch):
+        # Chunks with a "busy" bibcode fail once
+        state = {"members": {"old"}, "posts": [], "fail": set(), "busy": set()}
+
+        def post(token, url, data=None, params=None, json=True):
+            bibs = data["bibcode"]
+            state["posts"].append(bibs)
+            if state["busy"].intersection(bibs):
+                state["busy"].difference_update(bibs)
+                return http.HttpResponse({"error": "busy"}, 503, http.ADSLimits())
+
+            n = 0
+            for b in bibs:
+                if data["action"] == "add" and b not in state["fail"]:
+                    n += b not in state["members"]
+                    state["members"].add(b)
+                elif data["action"] == "remove" and b in state["members"]:
+                    n += 1
+                    state["members"].discard(b)
+            key = "number_added" if data["action"] == "add" else "number_removed"
+            return http.HttpResponse({key: n}, 200, http.ADSLimits())
+
+        def get(token, lid, rows=None, concurrent=False):
+            yield from sorted(state["members"])
+
+        monkeypatch.setattr(http, "post", post)
+        monkeypatch.setattr(lib, "get", get)
+        return state
+
+    def test_add(self, fake_lib):
+        fake_lib["fail"] = {"bad"}
+        bibs = ["a", "b", "bad", "old", "c"]
+
+        report = lib.bulk(None, "lid", bibs, chunk_size=2)
+
+        assert len(fake_lib["posts"]) == 3
+        assert report == {"a": "ok", "b": "ok", "bad": "failed", "old": "ok", "c": "ok"}
+
+    def test_remove(self, fake_lib):
+        report = lib.bulk(None, "lid", ["old", "missing"], action="remove")
+        assert report == {"old": "ok", "missing": "ok"}
+
+        with pytest.raises(ValueError):
+            lib.bulk(None, "lid", ["old"], action="move")
+
+    def test_retry(self, fake_lib):
+        fake_lib["busy"] = {"a"}
+
+        report = lib.bulk(None, "lid", ["a", "b", "c"])
+        assert report == {"a": "busy", "b": "busy", "c": "busy"}
+
+        fake_lib["busy"] = {"d"}
+        fake_lib["posts"] = []
+        report = lib.bulk(None, "lid", ["d", "e", "f"], chunk_size=2, retries=1)
+        assert set(report.values()) == {"ok"}
+        # Only the chunk that failed is resent
+        assert len(fake_lib["posts"]) == 3
+
+
 @pytest.mark.vcr()
 class TestAPIMetrics:
     def test_basic(self):
@@ -487,6 +688,106 @@ class TestAPIRef:
         assert r[0]["score"] == "0.0"
 
 
+class TestAPIRefBulk:
+    def test_resolve_many(self, monkeypatch):
+        sent = []
+
+        def post(token, url, data=None, params=None, json=True):
+            sent.append(data["reference"])
+            resolved = [
+                {"refstring": r, "score": "1.0", "bibcode": r[-19:]}
+                for r in data["reference"]
+            ]
+            return http.HttpResponse({"resolved": resolved}, 200, http.ADSLimits())
+
+        monkeypatch.setattr(http, "post", post)
+        monkeypatch.setattr(ref, "_memo", collections.OrderedDict())
+
+        refs = [f"Author, A. et al 2020 2020ApJ...900..{i:03d}A" for i in range(5)]
+        messy = ["  Author, A.   et al\n2020 2020ApJ...900..000A"]
+
+        with tempfile.TemporaryDirectory() as d:
+            memo = cache.Cache(os.path.join(d, "cache.sqlite"))
+
+            res = ref.resolve_many(None, refs + messy + refs, memo=memo, chunk_size=2)
+
+            bibcodes = [r[-19:] for r in refs]
+            assert [r["bibcode"] for r in res] == bibcodes + [bibcodes[0]] + bibcodes
+            assert res[5]["refstring"] == messy[0]
+            assert res[5]["bibcode"] == "2020ApJ...900..000A"
+            # Duplicates are only sent once
+            assert sorted(sum(sent, [])) == sorted(refs)
+            assert max(len(s) for s in sent) == 2
+
+            sent.clear()
+            res = ref.resolve_many(
+                None, refs[:2] + ["new 2020ApJ...900..999A"], memo=memo
+            )
+            assert sent == [["new 2020ApJ...900..999A"]]
+            assert res[0]["bibcode"] == "2020ApJ...900..000A"
+
+            # A new process still has the persistent memo
+            ref._memo.clear()
+            sent.clear()
+            res = ref.resolve_many(None, refs, memo=memo)
+            assert sent == []
+            assert [r["bibcode"] for r in res] == bibcodes
+
+    def test_resolve_many_default(self, monkeypatch):
+        sent = []
+
+        def post(token, url, data=None, params=None, json=True):
+            sent.append(data["reference"])
+            resolved = [{"refstring": r, "bibcode": r[-19:]} for r in data["reference"]]
+            return http.HttpResponse({"resolved": resolved}, 200, http.ADSLimits())
+
+        monkeypatch.setattr(http, "post", post)
+        monkeypatch.setattr(ref, "_memo", collections.OrderedDict())
+        monkeypatch.setattr(ref, "_memo_size", 3)
+
+        # No cache is configured so only the in-process memo is used
+        assert http.get_client().cache is None
+
+        refs = [f"A 2020 2020ApJ...900..{i:03d}A" for i in range(4)]
+        ref.resolve_many(None, refs[:3])
+        ref.resolve_many(None, refs[:3])
+        assert sent == [refs[:3]]
+
+        # The least recently used is dropped once the memo is full
+        ref.resolve_many(None, refs[1:])
+        assert list(ref._memo) == refs[1:]
+        sent.clear()
+        ref.resolve_many(None, refs)
+        assert sent == [refs[:1]]
+
+    def test_resolve_many_failure(self, monkeypatch):
+        sent = []
+
+        def post(token, url, data=None, params=None, json=True):
+            sent.append(data["reference"])
+            if any("bad" in r for r in data["reference"]):
+                return http.HttpResponse({"error": "server"}, 500, http.ADSLimits())
+            resolved = [{"refstring": r, "bibcode": r[-19:]} for r in data["reference"]]
+            return http.HttpResponse({"resolved": resolved}, 200, http.ADSLimits())
+
+        monkeypatch.setattr(http, "post", post)
+        monkeypatch.setattr(ref, "_memo", collections.OrderedDict())
+
+        refs = [f"A 2020 2020ApJ...900..{i:03d}A" for i in range(4)] + ["bad"]
+
+        with tempfile.TemporaryDirectory() as d:
+            memo = cache.Cache(os.path.join(d, "cache.sqlite"))
+
+            with pytest.raises(e.AdsApiError):
+                ref.resolve_many(None, refs, memo=memo, chunk_size=2)
+
+            # The chunks that worked were kept, only the failed one is sent again
+            sent.clear()
+            with pytest.raises(e.AdsApiError):
+                ref.resolve_many(None, refs, memo=memo, chunk_size=2)
+            assert sent == [["bad"]]
+
+
 @pytest.mark.vcr()
 class TestAPIResolve:
     def test_one(self):
@@ -727,3 +1028,429 @@ class TestAPINotifications:
         assert res[0]["id"] == id
 
         res = notif.delete(token, id)
+
+
+class TestAPIHttp:
+    def test_set_client(self):
+        client = http.Client(pool_connections=2, pool_maxsize=4)
+        http.set_client(client)
+
+        assert http.get_client() is client
+
+        http.set_client(None)
+
+        assert http.get_client() is not client
+        client.close()
+
+    def test_rate_limiter(self):
+        reset = int(time.time()) + 100
+        limiter = http.RateLimiter(pace=True)
+        limiter.update(
+            {
+                "X-RateLimit-Limit": "5000",
+                "X-RateLimit-Remaining": "10",
+                "X-RateLimit-Reset": str(reset),
+            }
+        )
+
+        assert limiter.budget.remaining == 10
+        assert limiter.budget.reset == reset
+
+        assert limiter.wait_time() < 1
+        assert 5 < limiter.wait_time() <= 20
+
+        headers = {"X-RateLimit-Reset": str(reset)}
+        assert 90 < limiter.retry_delay(429, headers, 0) <= 100
+        assert limiter.retry_delay(429, headers, limiter.max_retries) is None
+        assert limiter.retry_delay(404, headers, 0) is None
+
+    def test_rate_limiter_shared(self):
+        with tempfile.TemporaryDirectory() as d:
+            state = os.path.join(d, "limits")
+            a = http.RateLimiter(state_file=state)
+            b = http.RateLimiter(state_file=state)
+
+            a.update(
+                {
+                    "X-RateLimit-Limit": "5000",
+                    "X-RateLimit-Remaining": "42",
+                    "X-RateLimit-Reset": str(int(time.time()) + 100),
+                }
+            )
+
+            assert b.budget.remaining == 42
+
+    def test_rate_limiter_shared_slots(self):
+        with tempfile.TemporaryDirectory() as d:
+            state = os.path.join(d, "limits")
+            a = http.RateLimiter(pace=True, state_file=state)
+            b = http.RateLimiter(pace=True, state_file=state)
+
+            a.update(
+                {
+                    "X-RateLimit-Limit": "5000",
+                    "X-RateLimit-Remaining": "10",
+                    "X-RateLimit-Reset": str(int(time.time()) + 100),
+                }
+            )
+
+            # b must see the slot a reserved and queue after it
+            assert a.wait_time() < 1
+            assert 5 < b.wait_time() <= 20
+
+    def test_retry_idempotent(self):
+        limiter = http.RateLimiter()
+        assert limiter.retry_delay(503, {}, 0, "GET") is not None
+        assert limiter.retry_delay(503, {}, 0, "POST") is None
+        assert limiter.retry_delay(429, {"Retry-After": "1"}, 0, "POST") == 1.0
+
+    def test_client_retry(self, monkeypatch):
+        calls = []
+        closed = []
+
+        class Response(requests.Response):
+            def close(self):
+                closed.append(self)
+
+        class Session:
+            def request(self, method, url, **kwargs):
+                calls.append(method)
+                r = Response()
+                r.status_code = 503
+                return r
+
+            def close(self):
+                pass
+
+        monkeypatch.setattr(time, "sleep", lambda x: None)
+        client = http.Client(session=Session())
+
+        assert client.request("POST", urls.base_url + "biblib").status_code == 503
+        assert calls == ["POST"]
+
+        assert client.request("GET", urls.base_url + "biblib").status_code == 503
+        assert calls.count("GET") == client.limiter.max_retries + 1
+        assert len(closed) == client.limiter.max_retries
+
+
+class TestAPIChunking:
+    def test_export(self, monkeypatch):
+        calls = []
+
+        def post(token, url, data=None, params=None, json=True):
+            calls.append(data["bibcode"])
+            text = "\n\n".join(f"@ARTICLE{{{b}}}" for b in data["bibcode"]) + "\n"
+            return http.HttpResponse({"export": text}, 200, http.ADSLimits())
+
+        monkeypatch.setattr(http, "post", post)
+        monkeypatch.setattr(export, "_max_bibcodes", 2)
+
+        bibs = [str(i) for i in range(5)]
+        res = export.bibtex(token, bibs)
+
+        assert res == [f"@ARTICLE{{{b}}}" for b in bibs]
+        assert sorted(len(i) for i in calls) == [1, 2, 2]
+
+    def test_export_document(self, monkeypatch):
+        def post(token, url, data=None, params=None, json=True):
+            records = "".join(f"<record><id>{b}</id></record>" for b in data["bibcode"])
+            text = f'<?xml version="1.0"?>\n<records xmlns="x">{records}</records>\n'
+            return http.HttpResponse({"export": text}, 200, http.ADSLimits())
+
+        monkeypatch.setattr(http, "post", post)
+        monkeypatch.setattr(export, "_max_bibcodes", 2)
+
+        bibs = [str(i) for i in range(5)]
+        res = export.dcxml(token, bibs)
+
+        assert len(res) == 1
+        assert res[0] == post(token, "", {"bibcode": bibs}).response["export"]
+
+    def test_metrics(self, monkeypatch):
+        calls = []
+
+        def post(token, url, data=None, params=None, json=True):
+            calls.append(data["bibcodes"])
+            n = len(data["bibcodes"])
+            return http.HttpResponse(
+                {
+                    "skipped bibcodes": data["bibcodes"][:1],
+                    "histograms": {
+                        "reads": {
+                            "all reads": {str(2000 + n): n, "2010": 1},
+                            "all reads normalized": {"2010": 0.5},
+                        }
+                    },
+                },
+                200,
+                http.ADSLimits(),
+            )
+
+        monkeypatch.setattr(http, "post", post)
+        monkeypatch.setattr(metrics, "_max_bibcodes", 2)
+
+        bibs = [str(i) for i in range(5)]
+        res = metrics.histograms(token, bibs)
+
+        assert sorted(len(i) for i in calls) == [1, 2, 2]
+        assert res["skipped bibcodes"] == ["0", "2", "4"]
+        assert res["histograms"]["reads"]["all reads"] == {
+            "2002": 4,
+            "2010": 3,
+            "2001": 1,
+        }
+        assert res["histograms"]["reads"]["all reads normalized"] == {"2010": 1.5}
+
+        # Medians, citing papers and indices can not be added up
+        for func in [
+            metrics.basic,
+            metrics.citations,
+            metrics.indicators,
+            metrics.timeseries,
+        ]:
+            with pytest.raises(ValueError):
+                func(token, bibs)
+
+        # Up to the limit everything goes in one request
+        calls.clear()
+        metrics.indicators(token, bibs[:2])
+        assert calls == [bibs[:2]]
+
+
+class TestAPICache:
+    def test_get_set(self):
+        with tempfile.TemporaryDirectory() as d:
+            c = cache.Cache(os.path.join(d, "cache.sqlite"))
+
+            key = c.key("GET", "url", {"q": "x", "fl": "title,bibcode"})
+            assert key == c.key("get", "url", {"fl": "bibcode,title", "q": "x"})
+            assert key != c.key("GET", "url", {"q": "y", "fl": "title,bibcode"})
+            assert c.key("GET", "url", {}, "token1") != c.key(
+                "GET", "url", {}, "token2"
+            )
+
+            assert c.get(key) is None
+            c.set(key, {"a": 1}, 100)
+            assert c.get(key) == {"a": 1}
+
+            c.set(key, {"a": 1}, -1)
+            assert c.get(key) is None
+
+    def test_ttl(self):
+        with tempfile.TemporaryDirectory() as d:
+            c = cache.Cache(os.path.join(d, "cache.sqlite"), ttl={"/search/query": 0})
+
+            assert c.ttl_for(urls.make_url(urls.urls["export"]["bibtex"])) > 0
+            assert c.ttl_for(urls.make_url(urls.urls["metrics"]["detail"])) > 0
+            assert c.ttl_for(urls.make_url(urls.urls["search"]["search"])) == 0
+            assert c.ttl_for(urls.make_url(urls.urls["libraries"]["view"])) == 0
+            assert c.ttl_for("https://arxiv.org/pdf/2006.06678") == 0
+
+    def test_evict(self):
+        with tempfile.TemporaryDirectory() as d:
+            c = cache.Cache(os.path.join(d, "cache.sqlite"), max_size=100)
+
+            for i in range(10):
+                c.set(str(i), "x" * 20, 100)
+                time.sleep(0.001)
+
+            assert c.size() <= 100
+            assert c.get("0") is None
+            assert c.get("9") == "x" * 20
+
+    def test_size_total(self):
+        def actual(c):
+            with c._connect() as db:
+                return int(
+                    db.execute("SELECT TOTAL(size) FROM responses").fetchone()[0]
+                )
+
+        with tempfile.TemporaryDirectory() as d:
+            filename = os.path.join(d, "cache.sqlite")
+            c = cache.Cache(filename, max_size=100)
+
+            c.set("a", "x" * 10, 100)
+            c.set("a", "x" * 30, 100)
+            c.set_many({"b": "y" * 5, "c": "z" * 5}, 100)
+            assert c.size() == actual(c) == 32 + 7 + 7
+
+            c.set("d", "w" * 40, -1)
+            assert c.get("d") is None
+            assert c.size() == actual(c)
+
+            for i in range(10):
+                c.set(str(i), "x" * 20, 100)
+            assert c.size() == actual(c) <= 100
+
+            c.clear()
+            assert c.size() == actual(c) == 0
+
+            # A cache written before the running total was kept
+            c.set("a", "x" * 10, 100)
+            with c._connect() as db:
+                db.execute("DROP TABLE meta")
+            assert cache.Cache(filename).size() == 12
+
+    def test_client(self):
+        calls = []
+
+        class Session:
+            def request(self, method, url, **kwargs):
+                calls.append(url)
+                r = requests.Response()
+                r.status_code = 200
+                r._content = b'{"export": "bib"}'
+                return r
+
+            def close(self):
+                pass
+
+        with tempfile.TemporaryDirectory() as d:
+            c = cache.Cache(os.path.join(d, "cache.sqlite"))
+            http.set_client(http.Client(session=Session(), cache=c))
+            try:
+                for _ in range(2):
+                    res = export._export(token, "2020ApJ...902L..36F", "bibtex")
+                    assert res == "bib"
+
+                # Another user's token does not share entries
+                export._export("other", "2020ApJ...902L..36F", "bibtex")
+            finally:
+                http.set_client(None)
+
+        assert len(calls) == 2
+
+
+class TestAPIAsync:
+    class Session:
+        def __init__(self, pages):
+            self.pages = pages
+            self.calls = []
+
+        def request(self, method, url, **kwargs):
+            self.calls.append((method, url, kwargs))
+            body = self.pages[len(self.calls) - 1]
+
+            class Response:
+                status = 200
+                headers = {}
+
+                async def text(self):
+                    return body
+
+                async def __aenter__(self):
+                    return self
+
+                async def __aexit__(self, *args):
+                    pass
+
+            return Response()
+
+    def test_search(self):
+        pytest.importorskip("aiohttp")
+        import pyastroapi.api.aio.http as ahttp
+        import pyastroapi.api.aio.search as asearch
+
+        pages = [
+            '{"response": {"numFound": 3, "docs": [{"bibcode": "a"}, {"bibcode": "b"}]}, "nextCursorMark": "x"}',
+            '{"response": {"numFound": 3, "docs": [{"bibcode": "c"}]}, "nextCursorMark": "y"}',
+        ]
+        session = self.Session(pages)
+
+        async def run():
+            ahttp.set_client(ahttp.AsyncClient(session=session))
+            try:
+                return [
+                    i
+                    async for i in asearch.search(
+                        token, "*:*", fields="bibcode", rows=2, cursor=True
+                    )
+                ]
+            finally:
+                ahttp.set_client(None)
+
+        res = asyncio.run(run())
+
+        assert [i["bibcode"] for i in res] == ["a", "b", "c"]
+        assert session.calls[1][2]["params"]["cursorMark"] == "x"
+
+    def test_all(self):
+        pytest.importorskip("aiohttp")
+        import importlib
+
+        for name in ["export", "libraries", "metrics", "resolver", "search", "http"]:
+            mod = importlib.import_module(f"pyastroapi.api.aio.{name}")
+            for attr in mod.__all__:
+                assert hasattr(mod, attr), f"{name}.{attr}"
+
+    def test_bulk(self, monkeypatch):
+        pytest.importorskip("aiohttp")
+        import pyastroapi.api.aio.http as ahttp
+        import pyastroapi.api.aio.libraries as alib
+
+        posts = []
+
+        async def post(token, url, data=None, params=None, json=True):
+            posts.append(data["bibcode"])
+            if "bad" in data["bibcode"]:
+                return http.HttpResponse({"error": "nope"}, 400, http.ADSLimits())
+            return http.HttpResponse(
+                {"number_added": len(data["bibcode"])}, 200, http.ADSLimits()
+            )
+
+        monkeypatch.setattr(ahttp, "post", post)
+
+        res = asyncio.run(alib.bulk(token, "lid", ["a", "b", "bad"], chunk_size=2))
+
+        assert res == {"a": "ok", "b": "ok", "bad": "nope"}
+        assert sorted(len(p) for p in posts) == [1, 2]
+
+    def test_event_loops(self):
+        pytest.importorskip("aiohttp")
+        from aiohttp import web
+        import pyastroapi.api.aio.http as ahttp
+
+        async def handler(request):
+            return web.json_response({"a": 1})
+
+        async def run():
+            app = web.Application()
+            app.router.add_get("/", handler)
+            runner = web.AppRunner(app)
+            await runner.setup()
+            await web.TCPSite(runner, "127.0.0.1", 0).start()
+            port = runner.addresses[0][1]
+            try:
+                client = ahttp.get_client()
+                r = await client.request("GET", f"http://127.0.0.1:{port}/")
+                return r.response, client.session
+            finally:
+                await runner.cleanup()
+
+        ahttp.set_client(ahttp.AsyncClient(limiter=http.RateLimiter()))
+        try:
+            # The default client must work again from a second event loop
+            first, session = asyncio.run(run())
+            second, _ = asyncio.run(run())
+        finally:
+            ahttp.set_client(None)
+
+        assert first == second == {"a": 1}
+        assert session.closed
+
+    def test_export(self):
+        pytest.importorskip("aiohttp")
+        import pyastroapi.api.aio.http as ahttp
+        import pyastroapi.api.aio.export as aexport
+
+        session = self.Session(['{"export": "@a{1}\\n\\n@b{2}\\n\\n"}'])
+
+        async def run():
+            ahttp.set_client(ahttp.AsyncClient(session=session))
+            try:
+                return await aexport.bibtex(token, ["a", "b"])
+            finally:
+                ahttp.set_client(None)
+
+        assert asyncio.run(run()) == ["@a{1}", "@b{2}"]
+        assert session.calls[0][2]["json"] == {"bibcode": ["a", "b"]}
@@ -1,5 +1,6 @@
 # SPDX-License-Identifier: BSD-3-Clause
 import pyastroapi
+import pyastroapi.api.http as http
 
 import pytest
 import pickle
@@ -25,6 +26,34 @@ def vcr_config():
     }
 
 
+@pytest.fixture
+def fake_ads(monkeypatch):
+    """Offline ADS search, each request gets exactly the page it asks for
+
+    Fill the returned dict with query -> list of docs.
+    """
+    records = {}
+
+    def get(token, url, data=None, json=True):
+        docs = records[data["q"]]
+        start = int(data["start"])
+        page = docs[start : start + int(data["rows"])]
+        response = {
+            "response": {"numFound": len(docs), "docs": [dict(d) for d in page]}
+        }
+        return http.HttpResponse(response, 200, http.ADSLimits())
+
+    monkeypatch.setattr(http, "get", get)
+    return records
+
+
+def _refs(bibcode, n):
+    return [
+        {"bibcode": f"2000Ref..{i:03d}..{bibcode[:4]}", "title": [str(i)]}
+        for i in range(n)
+    ]
+
+
 @pytest.mark.vcr()
 class TestSearch:
     def test_basic(self):
@@ -46,10 +75,14 @@ class TestSearch:
 
         assert len(res)
 
-    def test_references(self):
+    def test_references(self, fake_ads):
+        refs = _refs("2021ApJ...923..214F", 99)
+        fake_ads["references(2021ApJ...923..214F)"] = refs
+
         res = list(pyastroapi.references("2021ApJ...923..214F"))
 
-        assert len(res)
+        # Two full pages and a short one, every reference exactly once
+        assert [r["bibcode"] for r in res] == [r["bibcode"] for r in refs]
 
 
 @pytest.mark.vcr()
@@ -60,7 +93,13 @@ class TestArticle:
         assert a.bibcode == "2021ApJ...923..214F"
         assert a.year == "2021"
 
-    def test_misc(self):
+    def test_misc(self, fake_ads):
+        fake_ads["identifier:2021ApJ...923..214F"] = [
+            {"bibcode": "2021ApJ...923..214F", "citation_count": 3}
+        ]
+        fake_ads["citations(2021ApJ...923..214F)"] = _refs("2022", 3)
+        fake_ads["references(2021ApJ...923..214F)"] = _refs("2020", 99)
+
         a = pyastroapi.article("2021ApJ...923..214F")
 
         assert a.citation_count > 0
@@ -70,6 +109,7 @@ class TestArticle:
         assert a.reference_count() == 99
         assert len(a.references())
         assert len(a.references()) == a.reference_count()
+        assert len(set(a.references().bibcodes())) == 99
         assert a.pdf.filename() == "2021ApJ...923..214F.pdf"
 
     def test_eq(self):
@@ -129,24 +169,65 @@ class TestArticle:
         os.remove(tp)
 
 
+class TestOldPickles:
+    """Pickles made before declared fields, compact articles and the positional index"""
+
+    def _old_article(self, bibcode):
+        a = pyastroapi.article(bibcode)
+        a.__dict__ = {
+            "bibcode": bibcode,
+            "_data": {"bibcode": bibcode},
+            "_query": None,
+            "_refs": None,
+            "_cites": None,
+        }
+        return a
+
+    def test_article(self, fake_ads):
+        bibcode = "2021ApJ...923..214F"
+        fake_ads[f"identifier:{bibcode}"] = [{"bibcode": bibcode, "year": "2021"}]
+
+        a = pickle.loads(pickle.dumps(self._old_article(bibcode)))
+
+        assert a._fields == []
+        assert a.year == "2021"
+
+    def test_journal(self, fake_ads):
+        bibcode = "2021ApJ...923..214F"
+        fake_ads[f"identifier:{bibcode}"] = [{"bibcode": bibcode, "year": "2021"}]
+
+        j = pyastroapi.journal()
+        j.__dict__ = {"_data": {bibcode: self._old_article(bibcode)}}
+
+        j = pickle.loads(pickle.dumps(j))
+
+        assert j._fields == []
+        assert j[bibcode].year == "2021"
+        assert j[0].bibcode == bibcode
+        assert j.index(bibcode) == 0
+
+
 @pytest.mark.vcr()
 class TestJournal:
-    def test_bibcodes(self):
+    def test_bibcodes(self, fake_ads):
         # Bug: https://github.com/rjfarmer/pyAstroApi/issues/1
-        journal = pyastroapi.journal(
-            bibcodes=["2018araa.book.....P", "2013A&A...557A..84P"]
-        )
-
+        bibcodes = ["2018araa.book.....P", "2013A&A...557A..84P"]
         titles = [
             "Astrophysical Recipes; The art of AMUSE",
             "The Astrophysical Multipurpose Software Environment",
         ]
         refs = [549, 68]
+        for bibcode, title, ref in zip(bibcodes, titles, refs):
+            fake_ads[f"identifier:{bibcode}"] = [{"bibcode": bibcode, "title": [title]}]
+            fake_ads[f"references({bibcode})"] = _refs(bibcode, ref)
+
+        journal = pyastroapi.journal(bibcodes=bibcodes)
 
         for paper, title, ref in zip(journal, titles, refs):
             assert type(paper) == pyastroapi.article
             assert paper.title == title
             assert paper.reference_count() == ref
+            assert len(set(paper.references().bibcodes())) == ref
 
     def test_citations(self):
         a = pyastroapi.journal(bibcodes=["2015arXiv151102820P", "2017zndo....846305F"])
@@ -171,3 +252,586 @@ class TestJournal:
             z["2011ApJS..192....3P"].title
             == "Modules for Experiments in Stellar Astrophysics (MESA)"
         )
+
+
+class TestJournalBulk:
+    @pytest.fixture
+    def fake_bigquery(self, monkeypatch):
+        calls = []
+
+        def bigquery_bibcodes(token, url, bibcodes, params):
+            calls.append(params)
+            docs = [{"bibcode": b, "year": b[:4]} for b in bibcodes]
+            start = int(params["start"])
+            response = {
+                "response": {
+                    "numFound": len(docs),
+                    "docs": docs[start : start + int(params["rows"])],
+                }
+            }
+            return http.HttpResponse(response, 200, http.ADSLimits())
+
+        monkeypatch.setattr(http, "bigquery_bibcodes", bigquery_bibcodes)
+        return calls
+
+    def test_hydrate(self, fake_bigquery):
+        bibcodes = [f"{2000 + i}ApJ...900..{i:03d}F" for i in range(5)]
+        j = pyastroapi.journal(bibcodes=bibcodes)
+
+        years = j.year
+
+        assert len(fake_bigquery) == 1
+        assert years == {b: b[:4] for b in bibcodes}
+        assert j[bibcodes[0]]._data["title"] is None
+
+        j.year
+        assert len(fake_bigquery) == 1
+
+    def test_hydrate_chunks(self, fake_bigquery):
+        bibcodes = [f"{2000 + i}ApJ...900..{i:03d}F" for i in range(5)]
+        j = pyastroapi.journal(bibcodes=bibcodes)
+
+        j.hydrate(["year"], chunk_size=2)
+
+        assert len(fake_bigquery) == 3
+
+    def test_fields(self, fake_bigquery):
+        bibcodes = [f"{2000 + i}ApJ...900..{i:03d}F" for i in range(5)]
+        j = pyastroapi.journal(bibcodes=bibcodes, fields=["year", "volume"])
+
+        assert len(fake_bigquery) == 1
+
+        for paper in j:
+            assert paper.year == paper.bibcode[:4]
+            assert paper.volume is None
+
+        assert len(fake_bigquery) == 1
+
+    def test_article_fields(self, monkeypatch):
+        calls = []
+
+        def search(query, limit=-1, fields=None, dbg=False):
+            calls.append(fields)
+            yield {f: "x" for f in fields.split(",")}
+
+        monkeypatch.setattr(pyastroapi, "search", search)
+
+        a = pyastroapi.article("2021ApJ...923..214F", fields=["year", "volume"])
+
+        assert len(calls) == 1
+        assert set(calls[0].split(",")) == {"year", "volume"}
+        assert a.year == "x"
+        assert a.volume == "x"
+        assert len(calls) == 1
+
+    def test_from_bibcodes(self, fake_bigquery):
+        bibcodes = [f"{2000 + i}ApJ...900..{i:03d}F" for i in range(7)]
+        j = pyastroapi.journal().from_bibcodes(bibcodes, fields=["year"])
+
+        assert len(fake_bigquery) == 1
+        assert j.year == {b: b[:4] for b in bibcodes}
+
+    def test_bigquery_paging(self, fake_bigquery):
+        bibcodes = [f"{2000 + i}ApJ...900..{i:03d}F" for i in range(7)]
+        res = list(
+            pyastroapi.articles._search.bigquery_search(
+                None, bibcodes, fields="bibcode,year", rows=3, chunk_size=5
+            )
+        )
+
+        assert [i["bibcode"] for i in res] == bibcodes
+        assert len(fake_bigquery) == 3
+
+    def test_batch_citations(self, monkeypatch):
+        queries = []
+
+        def search(query, limit=-1, fields=None, dbg=False, rows=None, cursor=False):
+            queries.append(query)
+            # Both chunks cite the same paper
+            yield {"bibcode": "2020ApJ...999..001C"}
+            yield {"bibcode": "2020ApJ...999..%03dC" % query.count(" OR ")}
+
+        monkeypatch.setattr(pyastroapi, "search", search)
+
+        bibcodes = [f"{2000 + i}ApJ...900..{i:03d}F" for i in range(5)]
+        j = pyastroapi.journal(data=[{"bibcode": b} for b in bibcodes])
+
+        cites = j.citations(batch=True, chunk_size=3)
+
+        assert len(queries) == 2
+        assert all(q.startswith("citations(bibcode:(") for q in queries)
+        assert sorted(cites) == ["2020ApJ...999..001C", "2020ApJ...999..002C"]
+        assert isinstance(cites["2020ApJ...999..002C"], pyastroapi.article)
+
+
+class TestJournalColumns:
+    data = [
+        {
+            "bibcode": "2020ApJ...900..001F",
+            "citation_count": 3,
+            "title": ["A"],
+            "year": "2020",
+        },
+        {"bibcode": "2021ApJ...900..002F", "citation_count": 5, "year": "2021"},
+    ]
+
+    def test_numpy(self):
+        np = pytest.importorskip("numpy")
+        j = pyastroapi.journal(data=self.data)
+
+        table = j.to_columns()
+
+        assert table.dtype.names == ("bibcode", "citation_count", "title", "year")
+        assert table["citation_count"].dtype == np.int64
+        assert table["year"].tolist() == ["2020", "2021"]
+        assert table["title"].tolist() == [["A"], None]
+
+        j2 = pyastroapi.journal().from_columns(table)
+        assert j2.bibcodes() == j.bibcodes()
+        assert j2["2021ApJ...900..002F"]._data == self.data[1]
+        assert j2[0]._data == self.data[0]
+
+    def test_numpy_missing(self):
+        np = pytest.importorskip("numpy")
+        data = [
+            {
+                "bibcode": "2020ApJ...900..001F",
+                "citation_count": 3,
+                "abstract": "x" * 1000,
+            },
+            {"bibcode": "2021ApJ...900..002F", "year": "2021"},
+        ]
+        j = pyastroapi.journal(data=data)
+
+        table = j.to_columns()
+
+        # Missing ints are masked rather than turned into floats
+        assert table["citation_count"].dtype == np.int64
+        assert table["citation_count"].tolist() == [3, None]
+        # Strings are not padded to the longest value
+        assert table["abstract"].dtype == object
+
+        j2 = pyastroapi.journal().from_columns(table)
+        assert [p._data for p in j2] == data
+
+    def test_arrow(self):
+        pytest.importorskip("pyarrow")
+        j = pyastroapi.journal(data=self.data)
+
+        table = j.to_columns(format="arrow")
+
+        assert table.column_names == ["bibcode", "citation_count", "title", "year"]
+
+        j2 = pyastroapi.journal().from_columns(table)
+        assert j2["2021ApJ...900..002F"]._data == self.data[1]
+
+    def test_dict(self):
+        j = pyastroapi.journal().from_columns(
+            {"bibcode": ["2020ApJ...900..001F"], "year": [None]}
+        )
+        assert j[0]._data == {"bibcode": "2020ApJ...900..001F"}
+
+        with pytest.raises(ValueError):
+            pyastroapi.journal().from_columns({"year": ["2020"]})
+
+
+class TestCompactArticle:
+    data = {
+        "bibcode": "2020ApJ...900..001F",
+        "author": ["Farmer, R."],
+        "title": ["A title"],
+        "year": "2020",
+    }
+
+    def test_data(self):
+        a = pyastroapi.compact_article(data=dict(self.data))
+
+        assert not hasattr(a, "__dict__")
+        assert a.bibcode == "2020ApJ...900..001F"
+        assert a.title == "A title"
+        assert a.first_author == "Farmer, R."
+        assert a.year == "2020"
+        assert "year" in a._data
+        assert "doi" not in a._data
+        assert a._data == self.data
+        assert a.as_dict() == self.data
+        assert a == pyastroapi.article(data=dict(self.data))
+
+        a._data.update({"volume": "900"})
+        assert a.volume == "900"
+        assert len(a._data) == 5
+
+    def test_schema_shared(self):
+        a = pyastroapi.compact_article(data=dict(self.data))
+        b = pyastroapi.compact_article(data={"year": "2021", "bibcode": "x"})
+
+        assert a._values[pyastroapi.articles._schema.index["year"]] == "2020"
+        assert b._values[pyastroapi.articles._schema.index["year"]] == "2021"
+        assert list(b._data) == ["bibcode", "year"]
+
+    def test_pickle(self):
+        a = pyastroapi.compact_article(data=dict(self.data))
+
+        b = pickle.loads(pickle.dumps(a))
+
+        assert b.bibcode == a.bibcode
+        assert b._data == self.data
+
+    def test_journal(self):
+        j = pyastroapi.journal(data=[dict(self.data)], compact=True)
+
+        assert isinstance(j[0], pyastroapi.compact_article)
+        assert j.year == {"2020ApJ...900..001F": "2020"}
+
+        j2 = pickle.loads(pickle.dumps(j))
+        assert j2[0]._data == self.data
+
+
+class TestJournalIndex:
+    bibcodes = [f"{2000 + i}ApJ...900..{i:03d}F" for i in range(5)]
+
+    def test_getitem(self):
+        j = pyastroapi.journal(data=[{"bibcode": b} for b in self.bibcodes])
+
+        assert [j[i].bibcode for i in range(len(j))] == self.bibcodes
+        assert j[-1].bibcode == self.bibcodes[-1]
+        assert j.index(self.bibcodes[3]) == 3
+
+        sub = j[1:4]
+        assert isinstance(sub, pyastroapi.journal)
+        assert sub.bibcodes() == self.bibcodes[1:4]
+
+        with pytest.raises(ValueError):
+            j.index("missing")
+
+    def test_consistent(self):
+        j = pyastroapi.journal(data=[{"bibcode": b} for b in self.bibcodes])
+        j[0]
+
+        j.pop(self.bibcodes[1])
+        assert j[1].bibcode == self.bibcodes[2]
+        assert j.index(self.bibcodes[4]) == 3
+
+        j.add_data([{"bibcode": "new"}, {"bibcode": self.bibcodes[0]}])
+        assert j[-1].bibcode == "new"
+        assert j.index("new") == 4
+        assert len(j) == 5
+
+        j.from_data([{"bibcode": "other"}])
+        assert j[0].bibcode == "other"
+        assert j.index("other") == 0
+
+        j2 = pickle.loads(pickle.dumps(j))
+        assert j2[0].bibcode == "other"
+
+
+class TestLibrarySync:
+    @pytest.fixture
+    def fake_lib(self, monkeypatch):
+        import pyastroapi.api.libraries as lib
+
+        state = {
+            "libraries": [
+                {"name": "a", "id": "1", "date_last_modified": "t0"},
+                {"name": "b", "id": "2", "date_last_modified": "t0"},
+            ],
+            "docs": {"1": ["x", "y"], "2": ["z"]},
+            "gets": [],
+        }
+
+        def list_all(token):
+            return {"libraries": [dict(l) for l in state["libraries"]]}
+
+        def get(token, lid, rows=None, concurrent=False):
+            state["gets"].append(lid)
+            state["paging"] = (rows, concurrent)
+            yield from state["docs"][lid]
+
+        monkeypatch.setattr(lib, "list_all", list_all)
+        monkeypatch.setattr(lib, "get", get)
+        monkeypatch.setattr(lib, "delete", lambda token, lid: None)
+        return state
+
+    def test_sync(self, fake_lib):
+        libs = pyastroapi.libraries()
+        libs.update(sync=True)
+
+        a = libs["a"]
+        assert sorted(a.keys()) == ["x", "y"]
+        assert sorted(fake_lib["gets"]) == ["1", "2"]
+        assert fake_lib["paging"] == (2000, True)
+
+        x = a["x"]
+        # Unchanged so nothing is fetched
+        assert a.sync() == ([], [])
+        assert len(fake_lib["gets"]) == 2
+
+        fake_lib["docs"]["1"] = ["x", "w"]
+        fake_lib["libraries"][0]["date_last_modified"] = "t1"
+        libs.update(sync=True)
+
+        assert libs["a"] is a
+        assert len(fake_lib["gets"]) == 3
+        assert list(a.keys()) == ["x", "w"]
+        assert a["x"] is x
+
+    def test_update_all(self, fake_lib):
+        libs = pyastroapi.libraries()
+        libs.update()
+        a = libs["a"]
+
+        fake_lib["libraries"][0]["date_last_modified"] = "t1"
+        a.update_all()
+        assert a.metadata["date_last_modified"] == "t1"
+        assert sorted(a.keys()) == ["x", "y"]
+        assert fake_lib["gets"] == ["1"]
+
+        # Already up to date so a sync fetches nothing
+        assert not a.modified
+        assert a.sync() == ([], [])
+        assert fake_lib["gets"] == ["1"]
+
+    def test_update(self, fake_lib):
+        libs = pyastroapi.libraries()
+        libs.update()
+        b = libs["b"]
+
+        fake_lib["libraries"][1]["name"] = "renamed"
+        libs.update()
+        assert libs["renamed"] is b
+        assert "b" not in libs
+        assert str(b) == "renamed"
+
+        libs.pop("renamed")
+        assert "renamed" not in libs
+        assert len(libs) == 1
+        assert fake_lib["gets"] == []
+
+    def test_bulk(self, fake_lib, monkeypatch):
+        import pyastroapi.api.libraries as lib
+
+        reports = []
+
+        def bulk(token, lid, bibcodes, action="add", retries=0):
+            reports.append((lid, action))
+            return {b: "failed" if b == "bad" else "ok" for b in bibcodes}
+
+        monkeypatch.setattr(lib, "bulk", bulk)
+
+        libs = pyastroapi.libraries()
+        libs.update(sync=True)
+        a = libs["a"]
+
+        report = a.add_bulk(["w", "bad"])
+        assert report == {"w": "ok", "bad": "failed"}
+        assert list(a.keys()) == ["x", "y", "w"]
+
+        a.pop_bulk(["x", "bad"])
+        assert list(a.keys()) == ["y", "w"]
+        assert reports == [("1", "add"), ("1", "remove")]
+
+
+class TestJournalBibtex:
+    def test_add_bibtex(self, monkeypatch):
+        queries = []
+        docs = {
+            "2021ApJ...923..214F": {"bibcode": "2021ApJ...923..214F"},
+            "10.1/x": {"bibcode": "2020ApJ...001..001A", "identifier": ["10.1/X"]},
+            "2006.06678": {
+                "bibcode": "2020arXiv200606678B",
+                "identifier": ["arXiv:2006.06678"],
+            },
+        }
+
+        def search(query, limit=-1, fields=None, dbg=False, rows=None):
+            queries.append(query)
+            if query.startswith("identifier:("):
+                yield from (d for k, d in docs.items() if f'"{k}' in query)
+            elif query.startswith("title:"):
+                yield {"bibcode": "2000book.....001C"}
+
+        monkeypatch.setattr(pyastroapi, "search", search)
+
+        bib = """
+        @ARTICLE{2021ApJ...923..214F, title = {A}}
+        @misc{key1, doi = {10.1/x}}
+        @book{key2, title = {Some {T}itle}, year = 2000}
+        @article{key3, eprint = {2006.06678v2}}
+        @article{key4, doi = {10.1/missing}}
+        """
+
+        j = pyastroapi.journal(bibtex=bib)
+
+        assert j.bibcodes() == [
+            "2021ApJ...923..214F",
+            "2020ApJ...001..001A",
+            "2000book.....001C",
+            "2020arXiv200606678B",
+        ]
+        # One combined identifier search then one each for the title and the unmatched doi
+        assert len(queries) == 3
+        assert sorted(queries)[0].startswith("identifier:(")
+
+
+class TestJournalLinks:
+    def test_links(self, monkeypatch):
+        import pyastroapi.api.resolver as resolver
+
+        bibcodes = ["2020ApJ...900..001A", "2020ApJ...900..002B", "2020ApJ...900..003C"]
+        esources = {bibcodes[0]: ["EPRINT_PDF", "PUB_HTML"], bibcodes[1]: None}
+        queries = []
+        resolved = []
+
+        def bigquery_bibcodes(token, url, bibcodes, params):
+            queries.append(bibcodes)
+            # The third paper is missing from the results
+            docs = [
+                {"bibcode": b, "esources": esources[b]}
+                for b in bibcodes
+                if b in esources
+            ]
+            response = {"response": {"numFound": len(docs), "docs": docs}}
+            return http.HttpResponse(response, 200, http.ADSLimits())
+
+        def esource(token, bibcode):
+            resolved.append(bibcode)
+            url = f"https://example.org/{bibcode}.pdf"
+            return {
+                "links": {"records": [{"link_type": "ESOURCE|PUB_PDF", "url": url}]}
+            }
+
+        monkeypatch.setattr(http, "bigquery_bibcodes", bigquery_bibcodes)
+        monkeypatch.setattr(resolver, "esource", esource)
+
+        cache = pyastroapi.articles.LinkCache()
+        j = pyastroapi.journal(bibcodes=bibcodes)
+
+        links = j.links(cache=cache)
+        assert links[bibcodes[0]] == {
+            "ESOURCE|EPRINT_PDF": f"https://ui.adsabs.harvard.edu/link_gateway/{bibcodes[0]}/EPRINT_PDF",
+            "ESOURCE|PUB_HTML": f"https://ui.adsabs.harvard.edu/link_gateway/{bibcodes[0]}/PUB_HTML",
+        }
+        assert links[bibcodes[1]] == {}
+        assert links[bibcodes[2]] == {
+            "ESOURCE|PUB_PDF": f"https://example.org/{bibcodes[2]}.pdf"
+        }
+        assert len(queries) == 1
+        assert resolved == [bibcodes[2]]
+
+        # Everything is cached
+        assert j.links(cache=cache) == links
+        assert len(queries) == 1
+        assert len(resolved) == 1
+
+        # Direct links only need the resolver for papers with esources
+        direct = j.links(direct=True, cache=cache)
+        assert resolved == [bibcodes[2], bibcodes[0]]
+        assert direct[bibcodes[0]] == {
+            "ESOURCE|PUB_PDF": f"https://example.org/{bibcodes[0]}.pdf"
+        }
+        assert direct[bibcodes[1]] == {}
+
+    def test_links_retry(self, monkeypatch):
+        import pyastroapi.api.resolver as resolver
+        import pyastroapi.api.exceptions as e
+
+        bibcode = "2020ApJ...900..001A"
+        calls = []
+
+        def bigquery_bibcodes(token, url, bibcodes, params):
+            # No esources so the resolver is needed
+            response = {"response": {"numFound": 0, "docs": []}}
+            return http.HttpResponse(response, 200, http.ADSLimits())
+
+        def esource(token, bibcode):
+            calls.append(bibcode)
+            if len(calls) == 1:
+                raise e.AdsApiError("Too many requests")
+            url = "https://example.org/a.pdf"
+            return {
+                "links": {"records": [{"link_type": "ESOURCE|PUB_PDF", "url": url}]}
+            }
+
+        monkeypatch.setattr(http, "bigquery_bibcodes", bigquery_bibcodes)
+        monkeypatch.setattr(resolver, "esource", esource)
+
+        cache = pyastroapi.articles.LinkCache()
+        j = pyastroapi.journal(bibcodes=[bibcode])
+
+        # A failed request is not cached as "no links"
+        assert j.links(cache=cache) == {bibcode: {}}
+        assert bibcode not in cache
+
+        assert j.links(cache=cache) == {
+            bibcode: {"ESOURCE|PUB_PDF": "https://example.org/a.pdf"}
+        }
+        assert len(calls) == 2
+
+    def test_urls_lazy(self, monkeypatch):
+        import pyastroapi.api.resolver as resolver
+
+        bibcode = "2020ApJ...900..001A"
+        resolved = []
+
+        def esource(token, bibcode):
+            resolved.append(bibcode)
+            if bibcode != "2020ApJ...900..001A":
+                return {"error": "no links"}
+            records = [
+                {"link_type": "ESOURCE|EPRINT_HTML", "url": "https://arxiv.org/abs/1"},
+                {"link_type": "ESOURCE|PUB_HTML", "url": "https://doi.org/1"},
+            ]
+            return {"links": {"records": records}}
+
+        monkeypatch.setattr(resolver, "esource", esource)
+
+        cache = pyastroapi.articles.LinkCache()
+        u = pyastroapi.articles.Urls(bibcode, cache=cache)
+        assert u.ads == f"https://ui.adsabs.harvard.edu/abs/{bibcode}"
+        assert resolved == []
+
+        assert u.arixv == "https://arxiv.org/abs/1"
+        assert u.journal == "https://doi.org/1"
+        assert resolved == [bibcode]
+
+        # A new object for the same paper uses the shared cache
+        assert pyastroapi.articles.Urls(bibcode, cache=cache).arixv == u.arixv
+        assert resolved == [bibcode]
+
+        with pytest.raises(ValueError):
+            pyastroapi.articles.Urls("2020ApJ...900..002B", cache=cache).journal
+
+    def test_urls_retry(self, monkeypatch):
+        import pyastroapi.api.resolver as resolver
+        import pyastroapi.api.exceptions as e
+
+        bibcode = "2020ApJ...900..001A"
+        calls = []
+
+        def esource(token, bibcode):
+            calls.append(bibcode)
+            if len(calls) % 2:
+                raise e.AdsApiError("Internal server error")
+            records = [
+                {"link_type": "ESOURCE|EPRINT_HTML", "url": "https://arxiv.org/abs/1"},
+                {"link_type": "ESOURCE|EPRINT_PDF", "url": "https://arxiv.org/pdf/1"},
+            ]
+            return {"links": {"records": records}}
+
+        monkeypatch.setattr(resolver, "esource", esource)
+
+        cache = pyastroapi.articles.LinkCache()
+        u = pyastroapi.articles.Urls(bibcode, cache=cache)
+
+        with pytest.raises(e.AdsApiError):
+            u.arixv
+        # The same object tries again rather than remembering no links
+        assert u.arixv == "https://arxiv.org/abs/1"
+        assert len(calls) == 2
+
+        pdf = pyastroapi.articles.PDF("2020ApJ...900..002B", cache=cache)
+        with pytest.raises(e.AdsApiError):
+            pdf._get()
+        assert pdf.links is None
+        pdf._get()
+        assert pdf.links["ESOURCE|EPRINT_PDF"] == "https://arxiv.org/pdf/1"
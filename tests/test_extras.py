@@ -1,7 +1,12 @@
 # SPDX-License-Identifier: BSD-3-Clause
 import pyastroapi.extras.urls as urls
+import pyastroapi.extras.graph as graph
+import pyastroapi.extras.pdfs as pdfs
+import pyastroapi.extras.bibtex as bibtex
+import pyastroapi.api.http as http
 
 import pytest
+import requests
 
 
 @pytest.fixture(scope="module")
@@ -45,3 +50,385 @@ class TestUrls:
         assert urls.parse_url("https://arxiv.org/pdf/2006.06678v1") == {
             "identifier": "2006.06678"
         }
+
+
+class TestGraph:
+    @pytest.fixture
+    def g(self):
+        g = graph.CitationGraph()
+        # A and B both reference C and D, E cites A and B
+        g.add_docs(
+            [
+                {"bibcode": "A", "reference": ["C", "D"], "citation": ["E"]},
+                {"bibcode": "B", "reference": ["C", "D"], "citation": ["E"]},
+                {"bibcode": "C", "reference": ["D"], "citation": ["A", "B"]},
+                {"bibcode": "E", "reference": None},
+            ]
+        )
+        return g
+
+    def test_edges(self, g):
+        assert len(g) == 5
+        assert "E" in g
+        # Edges seen from both ends are only stored once
+        assert g.num_edges == 7
+        assert g.references("A") == ["C", "D"]
+        assert sorted(g.citations("D")) == ["A", "B", "C"]
+
+    def test_walk(self, g):
+        assert g.walk("D", depth=1) == {"A": 1, "B": 1, "C": 1}
+        assert g.walk("D", depth=2) == {"A": 1, "B": 1, "C": 1, "E": 2}
+        assert g.walk("E", depth=5, direction="references") == {
+            "A": 1,
+            "B": 1,
+            "C": 2,
+            "D": 2,
+        }
+
+        with pytest.raises(ValueError):
+            g.walk("E", direction="sideways")
+
+    def test_shared(self, g):
+        assert g.cocitation("A", "B") == 1
+        assert g.coupling("A", "B") == 2
+        assert g.cocited("C") == {"D": 2}
+        assert g.coupled("A") == {"B": 2, "C": 1}
+
+    def test_add(self, g):
+        assert g.num_edges == 7
+        g.add("F", references=["A"])
+        assert g.citations("A") == ["E", "F"]
+        assert g.num_edges == 8
+
+
+class TestLocalMetrics:
+    @pytest.fixture
+    def local(self, monkeypatch):
+        metrics = pytest.importorskip("pyastroapi.extras.metrics")
+        import pyastroapi
+        import pyastroapi.api.http as http
+
+        docs = {
+            "2018ApJ...001..001A": {
+                "year": "2018",
+                "citation_count": 3,
+                "author_count": 2,
+                "property": ["REFEREED"],
+                "citation": ["2019X", "2020X", "2020Y"],
+            },
+            "2019ApJ...001..001B": {
+                "year": "2019",
+                "citation_count": 2,
+                "author_count": 1,
+                "property": ["REFEREED"],
+                "citation": ["2020X", "2021Z"],
+            },
+            "2020arXiv.....001C": {
+                "year": "2020",
+                "citation_count": 1,
+                "author_count": 1,
+                "property": [],
+                "citation": ["2021Z"],
+            },
+        }
+        refs = {"2019X": 1, "2020X": 2, "2020Y": 4, "2021Z": 1}
+
+        def bigquery_bibcodes(token, url, bibcodes, params):
+            res = []
+            for b in bibcodes:
+                if b in docs:
+                    res.append(dict(docs[b], bibcode=b))
+                else:
+                    res.append({"bibcode": b, "reference": ["x"] * refs[b]})
+            response = {"response": {"numFound": len(res), "docs": res}}
+            return http.HttpResponse(response, 200, http.ADSLimits())
+
+        monkeypatch.setattr(http, "bigquery_bibcodes", bigquery_bibcodes)
+
+        j = pyastroapi.journal(bibcodes=list(docs))
+        return metrics.LocalMetrics(j, tori=True, year=2021)
+
+    def test_indicators(self, local):
+        res = local.indicators()
+
+        assert res["indicators"]["h"] == 2
+        assert res["indicators"]["g"] == 2
+        assert res["indicators"]["i10"] == 0
+        assert res["indicators"]["m"] == 0.5
+        assert res["indicators refereed"]["h"] == 2
+
+        # (1 + 1/2 + 1/4)/2 + (1/2 + 1) + 1
+        assert res["indicators"]["tori"] == pytest.approx(3.375)
+        assert res["indicators"]["riq"] == int(1000 * 3.375**0.5 / 4)
+
+        sub = local.indicators(["2020arXiv.....001C"])
+        assert sub["indicators"]["h"] == 1
+        assert sub["indicators"]["m"] == 0.5
+        assert sub["indicators refereed"]["h"] == 0
+
+    def test_histograms(self, local):
+        res = local.histograms()
+
+        assert res["publications"]["all publications"] == {
+            "2018": 1,
+            "2019": 1,
+            "2020": 1,
+            "2021": 0,
+        }
+        assert res["publications"]["refereed publications"]["2020"] == 0
+        assert res["citations"]["all citations"] == {
+            "2018": 0,
+            "2019": 1,
+            "2020": 3,
+            "2021": 2,
+        }
+        assert res["citations"]["all citations normalized"]["2020"] == 2.0
+        assert res["citations"]["citations to refereed"]["2021"] == 1
+
+    def test_missing_year(self, monkeypatch):
+        metrics = pytest.importorskip("pyastroapi.extras.metrics")
+        import pyastroapi
+        import pyastroapi.api.http as http
+
+        def bigquery_bibcodes(token, url, bibcodes, params):
+            # A deleted bibcode is not returned and an odd record has no year
+            docs = [
+                {"bibcode": "2019ApJ...001..001B", "year": "2019", "citation_count": 1},
+                {"bibcode": "2019ApJ...001..002C", "year": None},
+            ]
+            response = {"response": {"numFound": len(docs), "docs": docs}}
+            return http.HttpResponse(response, 200, http.ADSLimits())
+
+        monkeypatch.setattr(http, "bigquery_bibcodes", bigquery_bibcodes)
+
+        j = pyastroapi.journal(
+            bibcodes=[
+                "2019ApJ...001..001B",
+                "2019ApJ...001..002C",
+                "2019Del...001..001D",
+            ]
+        )
+        m = metrics.LocalMetrics(j, year=2021)
+
+        assert m.bibcodes == ["2019ApJ...001..001B"]
+        assert m.skipped == ["2019ApJ...001..002C", "2019Del...001..001D"]
+        assert m.indicators()["indicators"]["h"] == 1
+        assert m.indicators(["2019Del...001..001D"])["indicators"]["h"] == 0
+
+
+class TestPdfs:
+    class Response:
+        def __init__(self, status, body=b"", headers=None):
+            self.status_code = status
+            self.body = body
+            self.headers = headers or {}
+
+        def iter_content(self, chunk_size):
+            for i in range(0, len(self.body), chunk_size):
+                yield self.body[i : i + chunk_size]
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            pass
+
+    @pytest.fixture
+    def fake_web(self, monkeypatch):
+        pdf = b"%PDF-1.5 " + b"x" * 100
+        calls = []
+        test = self
+
+        class Session:
+            def request(self, method, url, **kwargs):
+                headers = kwargs.get("headers") or {}
+                assert "Host" not in headers
+                calls.append((url, headers.get("Range")))
+                # Two redirects, gateway -> doi.org -> source
+                if "link_gateway" in url:
+                    bibcode, source = url.split("/")[-2:]
+                    return test.Response(
+                        302, headers={"Location": f"https://doi.org/{source}/{bibcode}"}
+                    )
+                if url.startswith("https://doi.org"):
+                    source, bibcode = url.split("/")[-2:]
+                    return test.Response(
+                        301, headers={"Location": f"https://{source}.org/{bibcode}"}
+                    )
+                if url.startswith("https://PUB_PDF"):
+                    return test.Response(200, b"<!DOCTYPE html><html></html>")
+                if "Range" in headers:
+                    start = int(headers["Range"][6:-1])
+                    return test.Response(206, pdf[start:])
+                return test.Response(200, pdf)
+
+            def close(self):
+                pass
+
+        http.set_client(http.Client(session=Session()))
+        yield pdf, calls
+        http.set_client(None)
+
+    def test_download(self, fake_web, tmp_path, monkeypatch):
+        import pyastroapi
+
+        pdf, calls = fake_web
+        docs = [
+            {"bibcode": "2020a", "esources": ["PUB_PDF", "EPRINT_PDF"]},
+            {"bibcode": "2020b", "esources": ["PUB_PDF"]},
+            {"bibcode": "2020c", "esources": []},
+        ]
+        j = pyastroapi.journal(data=docs)
+
+        # A partial download from last time
+        (tmp_path / "2020a.pdf.arxiv.part").write_bytes(pdf[:20])
+
+        done, failed = j.download_pdfs(
+            str(tmp_path), sources=["publisher", "arxiv"], per_host=1
+        )
+
+        assert done == {"2020a": str(tmp_path / "2020a.pdf")}
+        assert (tmp_path / "2020a.pdf").read_bytes() == pdf
+        assert not (tmp_path / "2020a.pdf.arxiv.part").exists()
+        assert ("https://EPRINT_PDF.org/2020a", "bytes=20-") in calls
+
+        assert "html" in failed["2020b"]
+        assert not (tmp_path / "2020b.pdf").exists()
+        assert failed["2020c"] == "No pdf available"
+
+        # Already downloaded files are skipped
+        calls.clear()
+        done, failed = j.download_pdfs(str(tmp_path), sources=["arxiv"])
+        assert "2020a" in done
+        assert not any("2020a" in url for url, _ in calls)
+
+        with pytest.raises(ValueError):
+            pdfs.download(j, str(tmp_path), sources=["library"])
+
+    def test_disk_error(self, fake_web, tmp_path, monkeypatch):
+        import pyastroapi
+
+        download_file = http.download_file
+
+        def full(url, filename, **kwargs):
+            if "2020a" in filename:
+                raise OSError(28, "No space left on device")
+            return download_file(url, filename, **kwargs)
+
+        monkeypatch.setattr(http, "download_file", full)
+
+        docs = [
+            {"bibcode": "2020a", "esources": ["EPRINT_PDF"]},
+            {"bibcode": "2020b", "esources": ["EPRINT_PDF"]},
+        ]
+        done, failed = pdfs.download(
+            pyastroapi.journal(data=docs), str(tmp_path), sources=["arxiv"]
+        )
+
+        # One paper failing to save does not stop the others
+        assert done == {"2020b": str(tmp_path / "2020b.pdf")}
+        assert "No space left" in failed["2020a"]
+
+    def test_redirect_loop(self, monkeypatch):
+        class Session:
+            def request(self, method, url, **kwargs):
+                return TestPdfs.Response(302, headers={"Location": url})
+
+            def close(self):
+                pass
+
+        http.set_client(http.Client(session=Session()))
+        try:
+            with pytest.raises(requests.TooManyRedirects):
+                pdfs._resolve("https://example.org/loop")
+        finally:
+            http.set_client(None)
+
+
+class TestBibtex:
+    bib = """
+    % A comment with an @ in it
+    @string{apj = {ApJ}}
+    @ARTICLE{2021ApJ...923..214F, title = {A (b}, journal = apj} @misc{key1, doi = {10.1/x}}
+    @book(key2, title = {Some {T}itle}, year = 2000)
+    @article{key3,
+        eprint = {2006.06678}
+    }
+    """
+
+    def test_iter(self):
+        entries = list(bibtex.iter_bibtex(self.bib, batch=1))
+
+        assert [e["ID"] for e in entries] == [
+            "2021ApJ...923..214F",
+            "key1",
+            "key2",
+            "key3",
+        ]
+        # Macros are available to every batch
+        assert entries[0]["journal"] == "ApJ"
+
+    def test_queries(self, tmp_path):
+        filename = tmp_path / "refs.bib"
+        filename.write_text(self.bib)
+
+        queries = [
+            "identifier:2021ApJ...923..214F",
+            "identifier:10.1/x",
+            'title:"Some Title" year:2000',
+            "identifier:2006.06678",
+        ]
+
+        assert bibtex.parse_bibtex(self.bib) == queries
+        assert bibtex.parse_file(str(filename)) == queries
+        # Parsing again doesn't return the earlier entries
+        assert bibtex.parse_file(str(filename)) == queries
+
+
+class TestResolveUrls:
+    def test_resolve(self, monkeypatch):
+        import pyastroapi
+
+        queries = []
+        docs = [
+            {"bibcode": "2020arXiv200606678F", "identifier": ["arXiv:2006.06678"]},
+            {
+                "bibcode": "2016ApJS..227...22P",
+                "identifier": ["10.3847/1538-4365/227/2/22"],
+            },
+        ]
+
+        def search(query, limit=-1, fields=None, dbg=False, rows=None):
+            queries.append(query)
+            yield from (d for d in docs if d["identifier"][0][-5:] in query)
+
+        monkeypatch.setattr(pyastroapi, "search", search)
+        monkeypatch.setattr(urls, "_memo", urls.collections.OrderedDict())
+
+        links = [
+            "https://arxiv.org/abs/2006.06678",
+            "https://arxiv.org/pdf/2006.06678v2",
+            "https://iopscience.iop.org/article/10.3847/1538-4365/227/2/22/meta",
+            "https://ui.adsabs.harvard.edu/abs/2020ApJ...902L..36F/abstract",
+            "https://arxiv.org/abs/2101.00001",
+            "https://example.com/paper",
+        ]
+
+        res = urls.resolve(links, chunk_size=2)
+
+        assert list(res) == links
+        assert res == {
+            links[0]: "2020arXiv200606678F",
+            links[1]: "2020arXiv200606678F",
+            links[2]: "2016ApJS..227...22P",
+            links[3]: "2020ApJ...902L..36F",
+            links[4]: None,
+            links[5]: None,
+        }
+        assert len(queries) == 2
+
+        # Found identifiers are remembered
+        queries.clear()
+        res = urls.resolve(links[:3])
+        assert res[links[2]] == "2016ApJS..227...22P"
+        assert queries == []